@@ -0,0 +1,361 @@
+"""
+Copyright 2024 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+import importlib.util
+import json
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from io import StringIO
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from parkapi_sources import ParkAPISources
+from parkapi_sources.converters.base_converter import BaseConverter
+from parkapi_sources.exceptions import ImportParkingSiteException
+from parkapi_sources.models import RealtimeParkingSiteInput, StaticParkingSiteInput
+from parkapi_sources.util import ConfigHelper, DefaultJSONEncoder, ParkingSiteSerializer
+
+from .scaling import scale_fixture
+
+if TYPE_CHECKING:
+    from requests_mock.request import Request
+    from requests_mock.response import Context
+
+DATA_PATH = Path(Path(__file__).parent.parent, 'tests', 'converters', 'data')
+
+ConverterResult = tuple[list[StaticParkingSiteInput | RealtimeParkingSiteInput], list[ImportParkingSiteException]]
+
+
+def load_fixture(filename: str, scale: int, record_xpath: Optional[str] = None) -> bytes:
+    file_path = Path(DATA_PATH, filename)
+    return scale_fixture(file_path.read_bytes(), file_path.suffix, scale, record_xpath=record_xpath)
+
+
+@dataclass
+class PushBenchmarkCase:
+    """
+    Runs a push converter's handle_* method on a fixture. Parsing the fixture is done here, just like the push endpoint of the
+    consuming service does it, so it's measured as its own stage.
+    """
+
+    name: str
+    source_uid: str
+    filename: str
+
+    def prepare(self, scale: int) -> bytes:
+        return load_fixture(self.filename, scale)
+
+    def parse(self, data: bytes) -> Any:
+        suffix = Path(self.filename).suffix
+        if suffix == '.csv':
+            return StringIO(data.decode('utf-8'))
+        if suffix == '.json':
+            return json.loads(data)
+        # XLSX and XML files are parsed by handle_xlsx_file() and handle_xml_file(), which can parse while the converter iterates
+        return data
+
+    def convert(self, converter: BaseConverter, parsed_data: Any) -> ConverterResult:
+        suffix = Path(self.filename).suffix
+        if suffix == '.csv':
+            # handle_csv_string reads the CSV with the dialect of the converter and passes the rows to handle_csv
+            return converter.handle_csv_string(parsed_data)
+        if suffix == '.json':
+            return converter.handle_json(parsed_data)
+        if suffix == '.xlsx':
+            return converter.handle_xlsx_file(parsed_data)
+        return converter.handle_xml_file(parsed_data)
+
+
+@dataclass
+class MockedRequest:
+    method: str
+    url: str
+    # Either a fixture filename or a callback which returns the fixture filename for a request
+    fixture: str | Callable[['Request'], Optional[str]]
+
+
+@dataclass
+class PullBenchmarkCase:
+    """
+    Runs a pull converter's get_static_parking_sites() or get_realtime_parking_sites() with mocked HTTP requests. Data which is not
+    fetched via HTTP can be injected by replacing converter methods with patched_methods.
+    """
+
+    name: str
+    source_uid: str
+    realtime: bool
+    mocked_requests: list[MockedRequest] = field(default_factory=list)
+    patched_methods: dict[str, str] = field(default_factory=dict)
+    config: dict[str, str] = field(default_factory=dict)
+    unscaled_fixtures: list[str] = field(default_factory=list)
+    # Records to repeat in scaled HTML and XML fixtures, if the default of using the most common children does not fit
+    record_xpath: Optional[str] = None
+
+    def prepare(self, scale: int) -> dict[str, bytes]:
+        fixtures: dict[str, bytes] = {}
+        for filename in self._get_fixture_filenames():
+            fixtures[filename] = load_fixture(filename, 1 if filename in self.unscaled_fixtures else scale, self.record_xpath)
+        return fixtures
+
+    def _get_fixture_filenames(self) -> list[str]:
+        filenames: list[str] = list(self.patched_methods.values())
+        for mocked_request in self.mocked_requests:
+            if isinstance(mocked_request.fixture, str):
+                filenames.append(mocked_request.fixture)
+        # Callback fixtures are in a directory named like the source
+        source_path = Path(DATA_PATH, self.source_uid)
+        if source_path.is_dir():
+            filenames += [str(Path(self.source_uid, file_path.name)) for file_path in sorted(source_path.iterdir())]
+        return filenames
+
+    def register_mocks(self, requests_mocker: Any, fixtures: dict[str, bytes]):
+        for mocked_request in self.mocked_requests:
+            if isinstance(mocked_request.fixture, str):
+                requests_mocker.register_uri(mocked_request.method, mocked_request.url, content=fixtures[mocked_request.fixture])
+                continue
+
+            def content_callback(request: 'Request', context: 'Context', callback: Callable = mocked_request.fixture) -> bytes:
+                filename = callback(request)
+                if filename is None:
+                    context.status_code = 404
+                    return b''
+                return fixtures[filename]
+
+            requests_mocker.register_uri(mocked_request.method, mocked_request.url, content=content_callback)
+
+    def convert(self, converter: BaseConverter) -> ConverterResult:
+        if self.realtime:
+            return converter.get_realtime_parking_sites()
+        return converter.get_static_parking_sites()
+
+
+IMPORT_SCRIPT = """
+import tracemalloc
+from time import perf_counter
+if {trace_memory!r}:
+    tracemalloc.start()
+start = perf_counter()
+from parkapi_sources import ParkAPISources
+ParkAPISources(config={{}}, converter_uids={converter_uids!r})
+print(perf_counter() - start, tracemalloc.get_traced_memory()[1])
+"""
+
+
+@dataclass
+class ImportBenchmarkCase:
+    """
+    Imports ParkAPI-Sources and loads converters in a fresh interpreter, as all converters are imported in this one already. Rows are
+    the loaded converters. There is no data to scale, so it just runs with the first scale.
+    """
+
+    name: str
+    # All sources if None
+    converter_uids: Optional[list[str]] = None
+
+    def get_converter_count(self) -> int:
+        return len(ParkAPISources.converter_class_names_by_uid if self.converter_uids is None else self.converter_uids)
+
+    def measure(self, trace_memory: bool) -> tuple[float, int]:
+        """
+        Returns duration and peak memory of the import.
+        """
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, '-c', IMPORT_SCRIPT.format(trace_memory=trace_memory, converter_uids=self.converter_uids)],
+            capture_output=True,
+            check=True,
+            env={'PYTHONPATH': str(Path(Path(__file__).parent.parent, 'src'))},
+            text=True,
+        )
+        duration, peak_memory = result.stdout.split()
+        return float(duration), int(peak_memory)
+
+
+@dataclass
+class SerializerBenchmarkCase:
+    """
+    Serializes the results of all push converter cases to JSON, repeated scale times, so ParkingSiteSerializer and its orjson backend
+    can be compared with to_dict() and DefaultJSONEncoder. Rows are the serialized parking sites, which are all spent in serialize.
+    """
+
+    name: str
+    # json_encoder for to_dict() and DefaultJSONEncoder, json or orjson for ParkingSiteSerializer with the respective backend
+    backend: str
+
+    def prepare(self, scale: int) -> list[StaticParkingSiteInput | RealtimeParkingSiteInput]:
+        parking_site_inputs: list[StaticParkingSiteInput | RealtimeParkingSiteInput] = []
+        for case in BENCHMARK_CASES:
+            if isinstance(case, PushBenchmarkCase):
+                parsed_data = case.parse(case.prepare(1))
+                parking_site_inputs += case.convert(create_converter(case, parsed_data), parsed_data)[0]
+        return parking_site_inputs * scale
+
+    def create_encoder(self) -> Callable[[StaticParkingSiteInput | RealtimeParkingSiteInput], str]:
+        if self.backend == 'json_encoder':
+            json_encoder = DefaultJSONEncoder()
+            return lambda parking_site_input: json_encoder.encode(parking_site_input.to_dict())
+        return ParkingSiteSerializer(use_orjson=self.backend == 'orjson').dumps
+
+
+BenchmarkCase = PushBenchmarkCase | PullBenchmarkCase | ImportBenchmarkCase | SerializerBenchmarkCase
+
+
+def create_converter(case: PushBenchmarkCase | PullBenchmarkCase, fixtures: Any) -> BaseConverter:
+    config: dict[str, str] = case.config if isinstance(case, PullBenchmarkCase) else {}
+    converter = ParkAPISources.get_converter_class(case.source_uid)(config_helper=ConfigHelper(config=config))
+
+    if isinstance(case, PullBenchmarkCase):
+        for method_name, filename in case.patched_methods.items():
+            setattr(converter, method_name, lambda data=fixtures[filename]: data)
+
+    return converter
+
+
+def pbw_fixture(request: 'Request') -> Optional[str]:
+    request_type = request.qs['type'][0]
+    if request_type == 'catalog-city':
+        return 'pbw/catalog-city.json'
+    if request_type == 'object-by-city':
+        return f'pbw/object-by-city-{request.qs["id"][0]}.json'
+    if request_type == 'object-dynamic-all':
+        return 'pbw/object-dynamic-all.json'
+    return None
+
+
+# Static parking sites of Bietigheim-Bissingen, Freiburg and Ulm come from the static GeoJSON repository, so just their realtime
+# imports are covered.
+BENCHMARK_CASES: list[BenchmarkCase] = [
+    PushBenchmarkCase('bfrk_bw_oepnv_bike', 'bfrk_bw_oepnv_bike', 'bfrk_bw_bike.csv'),
+    PushBenchmarkCase('bfrk_bw_oepnv_car', 'bfrk_bw_oepnv_car', 'bfrk_bw_car.csv'),
+    PushBenchmarkCase('ellwangen', 'ellwangen', 'ellwangen.xlsx'),
+    PushBenchmarkCase('konstanz_bike', 'konstanz_bike', 'konstanz_bike.csv'),
+    PushBenchmarkCase('mannheim', 'mannheim', 'mannheim.json'),
+    PushBenchmarkCase('neckarsulm', 'neckarsulm', 'neckarsulm.csv'),
+    PushBenchmarkCase('neckarsulm_bike', 'neckarsulm_bike', 'neckarsulm_bike.csv'),
+    PushBenchmarkCase('pforzheim', 'pforzheim', 'pforzheim.json'),
+    PushBenchmarkCase('pum_bw', 'pum_bw', 'pum_bw.xlsx'),
+    PushBenchmarkCase('reutlingen', 'reutlingen', 'reutlingen.csv'),
+    PushBenchmarkCase('reutlingen_bike', 'reutlingen_bike', 'reutlingen_bike.csv'),
+    PushBenchmarkCase('stuttgart_static', 'stuttgart', 'stuttgart-static.xml'),
+    PushBenchmarkCase('stuttgart_realtime', 'stuttgart', 'stuttgart-realtime.xml'),
+    PushBenchmarkCase('vrs-p-r', 'vrs-p-r', 'vrs_p_r.xlsx'),
+    *[
+        PullBenchmarkCase(
+            f'a81_p_m_{"realtime" if realtime else "static"}',
+            'a81_p_m',
+            realtime=realtime,
+            mocked_requests=[MockedRequest('GET', 'https://api.cloud-telartec.de/v1/parkings', 'a81_p_m.json')],
+            config={'PARK_API_A81_P_M_TOKEN': 'token'},
+        )
+        for realtime in (False, True)
+    ],
+    PullBenchmarkCase(
+        'bahn_v2_static',
+        'bahn_v2',
+        realtime=False,
+        mocked_requests=[
+            MockedRequest(
+                'GET',
+                'https://apis.deutschebahn.com/db-api-marketplace/apis/parking-information/db-bahnpark/v2/parking-facilities',
+                'bahn_v2.json',
+            ),
+        ],
+        config={'PARK_API_BAHN_API_CLIENT_ID': 'client-id', 'PARK_API_BAHN_API_CLIENT_SECRET': 'client-secret'},
+    ),
+    PullBenchmarkCase(
+        'bietigheim_bissingen_realtime',
+        'bietigheim_bissingen',
+        realtime=True,
+        patched_methods={'_get_data': 'bietigheim-bissingen.csv'},
+    ),
+    PullBenchmarkCase(
+        'freiburg_realtime',
+        'freiburg',
+        realtime=True,
+        mocked_requests=[MockedRequest('GET', 'https://geoportal.freiburg.de/wfs/gdm_pls/gdm_plslive', 'freiburg.json')],
+    ),
+    *[
+        PullBenchmarkCase(
+            f'heidelberg_{"realtime" if realtime else "static"}',
+            'heidelberg',
+            realtime=realtime,
+            mocked_requests=[
+                MockedRequest(
+                    'GET',
+                    'https://api.datenplattform.heidelberg.de/ckan/or/mobility/main/offstreetparking/v2/entities',
+                    'heidelberg.json',
+                ),
+            ],
+            config={'PARK_API_HEIDELBERG_API_KEY': 'api-key'},
+        )
+        for realtime in (False, True)
+    ],
+    PullBenchmarkCase(
+        'herrenberg_static',
+        'herrenberg',
+        realtime=False,
+        mocked_requests=[MockedRequest('GET', 'https://api.stadtnavi.de/herrenberg/parking/parkapi.json', 'herrenberg.json')],
+    ),
+    *[
+        PullBenchmarkCase(
+            f'{source_uid}_{"realtime" if realtime else "static"}',
+            source_uid,
+            realtime=realtime,
+            mocked_requests=[MockedRequest('GET', 'https://mobil.trk.de:8443/geoserver/TBA/ows', f'{source_uid}.json')],
+        )
+        for source_uid in ('karlsruhe', 'karlsruhe_bike')
+        for realtime in (False, True)
+    ],
+    *[
+        PullBenchmarkCase(
+            f'kienzler_{"realtime" if realtime else "static"}',
+            'kienzler',
+            realtime=realtime,
+            mocked_requests=[MockedRequest('POST', 'https://www.bikeandridebox.de/index.php', 'kienzler.json')],
+            config={'PARK_API_KIENZLER_USER': 'user', 'PARK_API_KIENZLER_PASSWORD': 'password', 'PARK_API_KIENZLER_IDS': 'id1,id2,id3'},
+        )
+        for realtime in (False, True)
+    ],
+    *[
+        PullBenchmarkCase(
+            f'pbw_{"realtime" if realtime else "static"}',
+            'pbw',
+            realtime=realtime,
+            mocked_requests=[MockedRequest('GET', 'https://www.mypbw.de/api/', pbw_fixture)],
+            config={'PARK_API_PBW_API_KEY': 'api-key'},
+            # The city catalog is not scaled, as more cities would multiply the scaled per-city objects once more
+            unscaled_fixtures=['pbw/catalog-city.json'],
+        )
+        for realtime in (False, True)
+    ],
+    PullBenchmarkCase(
+        'radvis_bw_static',
+        'radvis_bw',
+        realtime=False,
+        mocked_requests=[
+            MockedRequest(
+                'GET',
+                'https://radvis.landbw.de/api/geoserver/basicauth/radvis/wfs?service=WFS&version=2.0.0&request=GetFeature'
+                '&typeNames=radvis%3Aabstellanlage&outputFormat=application/json',
+                'radvis_bw.json',
+            ),
+        ],
+        config={'PARK_API_RADVIS_USER': 'user', 'PARK_API_RADVIS_PASSWORD': 'password'},
+    ),
+    PullBenchmarkCase(
+        'ulm_realtime',
+        'ulm',
+        realtime=True,
+        mocked_requests=[MockedRequest('GET', 'https://www.parken-in-ulm.de', 'ulm.html')],
+        record_xpath='//section[contains(@class, "s_live_counter")]//div[contains(@class, "card-container")]',
+    ),
+    # Converters are loaded lazily, so a single source should import much less than all of them
+    ImportBenchmarkCase('import_all'),
+    ImportBenchmarkCase('import_herrenberg', ['herrenberg']),
+    SerializerBenchmarkCase('serializer_json_encoder', 'json_encoder'),
+    SerializerBenchmarkCase('serializer_json', 'json'),
+    # orjson is optional
+    *([SerializerBenchmarkCase('serializer_orjson', 'orjson')] if importlib.util.find_spec('orjson') is not None else []),
+]
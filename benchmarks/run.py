@@ -0,0 +1,184 @@
+"""
+Copyright 2024 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+import argparse
+import json
+import sys
+import tracemalloc
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Optional
+
+import requests_mock
+
+sys.path.append(str(Path(__file__).parent.parent))  # noqa: E402
+sys.path.append(str(Path(Path(__file__).parent.parent, 'src')))  # noqa: E402
+
+from benchmarks.cases import (
+    BENCHMARK_CASES,
+    BenchmarkCase,
+    ConverterResult,
+    ImportBenchmarkCase,
+    PullBenchmarkCase,
+    PushBenchmarkCase,
+    SerializerBenchmarkCase,
+    create_converter,
+)
+from benchmarks.stage_timer import STAGES, StageTimer
+from parkapi_sources.util import ParkingSiteSerializer
+
+
+@dataclass
+class BenchmarkResult:
+    case: str
+    scale: int
+    rows: int
+    parking_sites: int
+    duration: float
+    rows_per_second: float
+    peak_memory: int
+    stages: dict[str, float]
+
+
+def run_case(
+    case: PushBenchmarkCase | PullBenchmarkCase | SerializerBenchmarkCase,
+    fixtures: Any,
+    serializer: ParkingSiteSerializer,
+    timer: Optional[StageTimer],
+) -> ConverterResult:
+    if isinstance(case, SerializerBenchmarkCase):
+        encode = case.create_encoder()
+        with timer.stage('serialize') if timer is not None else nullcontext():
+            for parking_site_input in fixtures:
+                encode(parking_site_input)
+        return fixtures, []
+
+    converter = create_converter(case, fixtures)
+    instrumentation = nullcontext() if timer is None else timer.instrument()
+    mocker = requests_mock.Mocker() if isinstance(case, PullBenchmarkCase) else nullcontext()
+
+    with mocker as requests_mocker, instrumentation:
+        if isinstance(case, PullBenchmarkCase):
+            case.register_mocks(requests_mocker, fixtures)
+
+        start = perf_counter()
+        if isinstance(case, PushBenchmarkCase):
+            with timer.stage('parse') if timer is not None else nullcontext():
+                parsed_data = case.parse(fixtures)
+            result = case.convert(converter, parsed_data)
+        else:
+            result = case.convert(converter)
+        if timer is not None:
+            timer.add_map_duration(perf_counter() - start)
+
+        with timer.stage('serialize') if timer is not None else nullcontext():
+            for parking_site_input in result[0]:
+                serializer.dumps(parking_site_input)
+
+    return result
+
+
+def benchmark_import_case(case: ImportBenchmarkCase, runs: int) -> BenchmarkResult:
+    # Like for the other cases, memory is traced in a separate run, so it does not slow down the timing runs
+    duration = min(case.measure(trace_memory=False)[0] for _ in range(runs))
+    _, peak_memory = case.measure(trace_memory=True)
+
+    rows = case.get_converter_count()
+    return BenchmarkResult(
+        case=case.name,
+        scale=1,
+        rows=rows,
+        parking_sites=0,
+        duration=duration,
+        rows_per_second=rows / duration if duration else 0,
+        peak_memory=peak_memory,
+        stages=dict.fromkeys(STAGES, 0.0),
+    )
+
+
+def benchmark_case(case: BenchmarkCase, scale: int, runs: int) -> BenchmarkResult:
+    if isinstance(case, ImportBenchmarkCase):
+        return benchmark_import_case(case, runs)
+
+    fixtures = case.prepare(scale)
+    serializer = ParkingSiteSerializer()
+
+    # Timing runs are done without tracemalloc, as it slows down allocations a lot
+    best_timer: Optional[StageTimer] = None
+    for _ in range(runs):
+        timer = StageTimer()
+        parking_site_inputs, import_parking_site_exceptions = run_case(case, fixtures, serializer, timer)
+        if best_timer is None or sum(timer.durations.values()) < sum(best_timer.durations.values()):
+            best_timer = timer
+
+    tracemalloc.start()
+    run_case(case, fixtures, serializer, None)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    rows = len(parking_site_inputs) + len(import_parking_site_exceptions)
+    duration = sum(best_timer.durations.values())
+    return BenchmarkResult(
+        case=case.name,
+        scale=scale,
+        rows=rows,
+        parking_sites=len(parking_site_inputs),
+        duration=duration,
+        rows_per_second=rows / duration if duration else 0,
+        peak_memory=peak_memory,
+        stages=best_timer.durations,
+    )
+
+
+def print_result(result: BenchmarkResult, baseline: Optional[dict[str, Any]]):
+    stages = ' '.join(f'{result.stages[stage] * 1000:9.1f}' for stage in STAGES)
+    line = (
+        f'{result.case:<30} {result.scale:>5} {result.rows:>7} {result.duration * 1000:9.1f} {result.rows_per_second:10.0f} '
+        f'{result.peak_memory / 1024 / 1024:8.1f} {stages}'
+    )
+    if baseline is not None and baseline['rows_per_second']:
+        line += f' {result.rows_per_second / baseline["rows_per_second"]:7.2f}x'
+    print(line)  # noqa: T201
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog='ParkAPI-Sources Benchmark',
+        description='Runs all converters against the test fixtures and synthetic scaled-up versions of them with mocked HTTP requests',
+    )
+    parser.add_argument('-c', '--case', dest='cases', nargs='+', help='Limit to specific cases, matched by prefix.')
+    parser.add_argument('--scale', dest='scales', type=int, nargs='+', default=[1, 10, 100], help='Row multipliers for the fixtures.')
+    parser.add_argument('-r', '--runs', type=int, default=3, help='Timing runs per case, the fastest one is reported.')
+    parser.add_argument('-o', '--output', dest='output_file', help='Write results as JSON, for example to use them as baseline later.')
+    parser.add_argument('-b', '--baseline', dest='baseline_file', help='Compare rows per second with the results of an earlier run.')
+    args = parser.parse_args()
+
+    cases = [case for case in BENCHMARK_CASES if args.cases is None or any(case.name.startswith(prefix) for prefix in args.cases)]
+
+    baseline_by_key: dict[tuple[str, int], dict[str, Any]] = {}
+    if args.baseline_file is not None:
+        with Path(args.baseline_file).open() as baseline_file:
+            baseline_by_key = {(item['case'], item['scale']): item for item in json.load(baseline_file)}
+
+    stage_header = ' '.join(f'{stage + " ms":>9}' for stage in STAGES)
+    print(f'{"case":<30} {"scale":>5} {"rows":>7} {"total ms":>9} {"rows/s":>10} {"peak MiB":>8} {stage_header}')  # noqa: T201
+
+    results: list[BenchmarkResult] = []
+    for case in cases:
+        # Import cases have no data to scale
+        for scale in args.scales[:1] if isinstance(case, ImportBenchmarkCase) else args.scales:
+            result = benchmark_case(case, scale, args.runs)
+            print_result(result, baseline_by_key.get((result.case, result.scale)))
+            results.append(result)
+
+    if args.output_file is not None:
+        with Path(args.output_file).open('w') as output_file:
+            json.dump([asdict(result) for result in results], output_file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
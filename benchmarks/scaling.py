@@ -0,0 +1,116 @@
+"""
+Copyright 2024 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+import json
+from collections import Counter
+from copy import deepcopy
+from io import BytesIO
+from typing import Any, Optional
+
+from lxml import etree
+from openpyxl.reader.excel import load_workbook
+
+
+def scale_fixture(data: bytes, suffix: str, scale: int, record_xpath: Optional[str] = None) -> bytes:
+    """
+    Creates a synthetic, scaled-up version of a fixture by repeating its records. Numeric ids in JSON object keys are shifted to stay
+    unique, all other uids are repeated as they are, as converters don't deduplicate, so the work per record stays the same.
+    """
+    if scale == 1:
+        return data
+    if suffix == '.csv':
+        return scale_csv(data, scale)
+    if suffix == '.json':
+        return scale_json(data, scale)
+    if suffix == '.xlsx':
+        return scale_xlsx(data, scale)
+    if suffix in ('.xml', '.html'):
+        return scale_xml(data, scale, html=suffix == '.html', record_xpath=record_xpath)
+    raise ValueError(f'Cannot scale {suffix} fixtures.')
+
+
+def scale_csv(data: bytes, scale: int) -> bytes:
+    # The body is repeated as a block, so quoted values with line breaks stay intact
+    header, body = data.split(b'\n', 1)
+    if not body.endswith(b'\n'):
+        body += b'\n'
+    return header + b'\n' + body * scale
+
+
+def scale_json(data: bytes, scale: int) -> bytes:
+    root = json.loads(data)
+    if _is_record_collection(root):
+        return json.dumps(_scale_collection(root, scale)).encode()
+
+    parent, key = _find_largest_json_collection(root)
+    if parent is None:
+        return data
+    parent[key] = _scale_collection(parent[key], scale)
+    return json.dumps(root).encode()
+
+
+def _is_record_collection(node: Any) -> bool:
+    # Objects are just scaled if they are keyed by ids, which means that all values are objects as well
+    if isinstance(node, list):
+        return True
+    return isinstance(node, dict) and len(node) > 0 and all(isinstance(value, dict) for value in node.values())
+
+
+def _scale_collection(collection: list | dict, scale: int) -> list | dict:
+    if isinstance(collection, list):
+        return collection * scale
+
+    scaled_collection = dict(collection)
+    for index in range(1, scale):
+        for key, value in collection.items():
+            scaled_key = str(int(key) + index * 1_000_000) if key.isdigit() else f'{key}-{index}'
+            scaled_collection[scaled_key] = value
+    return scaled_collection
+
+
+def _find_largest_json_collection(node: Any) -> tuple[Any, Any]:
+    largest: tuple[Any, Any, int] = (None, None, 0)
+    stack: list[Any] = [node]
+    while stack:
+        current = stack.pop()
+        items = current.items() if isinstance(current, dict) else enumerate(current) if isinstance(current, list) else ()
+        for key, value in items:
+            if _is_record_collection(value) and len(value) > largest[2]:
+                largest = (current, key, len(value))
+            if isinstance(value, (dict, list)):
+                stack.append(value)
+    return largest[0], largest[1]
+
+
+def scale_xlsx(data: bytes, scale: int) -> bytes:
+    workbook = load_workbook(BytesIO(data))
+    for worksheet in workbook.worksheets:
+        rows = [row for row in worksheet.iter_rows(min_row=2, values_only=True) if any(value is not None for value in row)]
+        for _ in range(scale - 1):
+            for row in rows:
+                worksheet.append(row)
+    output = BytesIO()
+    workbook.save(output)
+    return output.getvalue()
+
+
+def scale_xml(data: bytes, scale: int, html: bool = False, record_xpath: Optional[str] = None) -> bytes:
+    parser = etree.HTMLParser() if html else etree.XMLParser(resolve_entities=False)
+    root = etree.fromstring(data, parser=parser)  # noqa: S320
+
+    if record_xpath is None:
+        # Without explicit records, we use the most common children of the element with most children
+        parent = max(root.iter(), key=len)
+        record_tag = Counter(child.tag for child in parent).most_common(1)[0][0]
+        records = [child for child in parent if child.tag == record_tag]
+    else:
+        records = root.xpath(record_xpath)
+
+    # Copies are inserted right after each record, so records with different parents are scaled as well
+    for record in records:
+        for _ in range(scale - 1):
+            record.addnext(deepcopy(record))
+
+    return etree.tostring(root, method='html' if html else 'xml', encoding='utf-8', xml_declaration=not html)
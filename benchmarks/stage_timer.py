@@ -0,0 +1,83 @@
+"""
+Copyright 2024 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+from contextlib import ExitStack, contextmanager
+from functools import wraps
+from threading import Lock, local
+from time import perf_counter
+from typing import Callable, Iterator
+from unittest.mock import patch
+
+import requests
+from bs4 import BeautifulSoup
+from validataclass.validators import DataclassValidator
+
+from parkapi_sources.util import RequestHelper
+from parkapi_sources.validators import CompiledDataclassValidator
+
+STAGES: tuple[str, ...] = ('fetch', 'parse', 'validate', 'map', 'serialize')
+
+
+class StageTimer:
+    """
+    Measures how much of a converter run is spent in which stage by wrapping the functions every converter uses for it:
+    RequestHelper requests are fetch, Response.json() and BeautifulSoup are parse, DataclassValidator.validate() and
+    CompiledDataclassValidator.validate() are validate. Just the outermost stage call is counted, so nested validators don't count
+    twice. Everything else within the converter is map. Calls in worker threads are summed up, so stages of concurrent converters can
+    add up to more than the wall time.
+    """
+
+    durations: dict[str, float]
+    _lock: Lock
+    _state: local
+
+    def __init__(self):
+        self.durations = dict.fromkeys(STAGES, 0.0)
+        self._lock = Lock()
+        self._state = local()
+
+    @contextmanager
+    def stage(self, stage: str) -> Iterator[None]:
+        if getattr(self._state, 'active', False):
+            yield
+            return
+
+        self._state.active = True
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            duration = perf_counter() - start
+            self._state.active = False
+            with self._lock:
+                self.durations[stage] += duration
+
+    def wrap(self, stage: str, function: Callable) -> Callable:
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            with self.stage(stage):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    @contextmanager
+    def instrument(self) -> Iterator['StageTimer']:
+        targets: list[tuple[type, str, str]] = [
+            (RequestHelper, 'get', 'fetch'),
+            (RequestHelper, 'post', 'fetch'),
+            (requests.Response, 'json', 'parse'),
+            (BeautifulSoup, '__init__', 'parse'),
+            (DataclassValidator, 'validate', 'validate'),
+            # CompiledDataclassValidator overrides validate(), so it has to be wrapped as well
+            (CompiledDataclassValidator, 'validate', 'validate'),
+        ]
+        with ExitStack() as exit_stack:
+            for target_class, attribute, stage in targets:
+                exit_stack.enter_context(patch.object(target_class, attribute, self.wrap(stage, getattr(target_class, attribute))))
+            yield self
+
+    def add_map_duration(self, total_duration: float):
+        # Map is what is left of the converter run after all instrumented stages
+        self.durations['map'] += max(total_duration - sum(self.durations[stage] for stage in ('fetch', 'parse', 'validate')), 0)
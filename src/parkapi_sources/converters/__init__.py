@@ -3,27 +3,76 @@ Copyright 2024 binary butterfly GmbH
 Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
 """
 
-from .a81_p_m import A81PMPullConverter
-from .bahn_v2 import BahnV2PullConverter
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .base_converter import BaseConverter
-from .bfrk_bw import BfrkBwOepnvBikePushConverter, BfrkBwOepnvCarPushConverter, BfrkBwSpnvBikePushConverter, BfrkBwSpnvCarPushConverter
-from .bietigheim_bissingen import BietigheimBissingenPullConverter
-from .ellwangen import EllwangenPushConverter
-from .freiburg import FreiburgPullConverter
-from .heidelberg import HeidelbergPullConverter
-from .karlsruhe import KarlsruheBikePullConverter, KarlsruhePullConverter
-from .kienzler import KienzlerPullConverter
-from .konstanz_bike import KonstanzBikePushConverter
-from .mannheim_buchen import BuchenPushConverter, MannheimPushConverter
-from .neckarsulm import NeckarsulmPushConverter
-from .neckarsulm_bike import NeckarsulmBikePushConverter
-from .pbw import PbwPullConverter
-from .pforzheim import PforzheimPushConverter
-from .pum_bw import PumBwPushConverter
-from .radvis_bw import RadvisBwPullConverter
-from .reutlingen import ReutlingenPushConverter
-from .reutlingen_bike import ReutlingenBikePushConverter
-from .stuttgart import StuttgartPushConverter
-from .ulm import UlmPullConverter
-from .vrs_p_r import VrsParkAndRidePushConverter
-from .herrenberg import HerrenbergPullConverter
+
+# Converters are imported at first access, so using one converter does not import the dependencies of all other converters.
+converter_modules_by_class_name: dict[str, str] = {
+    'A81PMPullConverter': '.a81_p_m',
+    'BahnV2PullConverter': '.bahn_v2',
+    'BfrkBwOepnvBikePushConverter': '.bfrk_bw',
+    'BfrkBwOepnvCarPushConverter': '.bfrk_bw',
+    'BfrkBwSpnvBikePushConverter': '.bfrk_bw',
+    'BfrkBwSpnvCarPushConverter': '.bfrk_bw',
+    'BietigheimBissingenPullConverter': '.bietigheim_bissingen',
+    'BuchenPushConverter': '.mannheim_buchen',
+    'EllwangenPushConverter': '.ellwangen',
+    'FreiburgPullConverter': '.freiburg',
+    'HeidelbergPullConverter': '.heidelberg',
+    'HerrenbergPullConverter': '.herrenberg',
+    'KarlsruheBikePullConverter': '.karlsruhe',
+    'KarlsruhePullConverter': '.karlsruhe',
+    'KienzlerPullConverter': '.kienzler',
+    'KonstanzBikePushConverter': '.konstanz_bike',
+    'MannheimPushConverter': '.mannheim_buchen',
+    'NeckarsulmBikePushConverter': '.neckarsulm_bike',
+    'NeckarsulmPushConverter': '.neckarsulm',
+    'PbwPullConverter': '.pbw',
+    'PforzheimPushConverter': '.pforzheim',
+    'PumBwPushConverter': '.pum_bw',
+    'RadvisBwPullConverter': '.radvis_bw',
+    'ReutlingenBikePushConverter': '.reutlingen_bike',
+    'ReutlingenPushConverter': '.reutlingen',
+    'StuttgartPushConverter': '.stuttgart',
+    'UlmPullConverter': '.ulm',
+    'VrsParkAndRidePushConverter': '.vrs_p_r',
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in converter_modules_by_class_name:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    return getattr(import_module(converter_modules_by_class_name[name], __name__), name)
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals().keys(), *converter_modules_by_class_name.keys()])
+
+
+if TYPE_CHECKING:
+    from .a81_p_m import A81PMPullConverter
+    from .bahn_v2 import BahnV2PullConverter
+    from .bfrk_bw import BfrkBwOepnvBikePushConverter, BfrkBwOepnvCarPushConverter, BfrkBwSpnvBikePushConverter, BfrkBwSpnvCarPushConverter
+    from .bietigheim_bissingen import BietigheimBissingenPullConverter
+    from .ellwangen import EllwangenPushConverter
+    from .freiburg import FreiburgPullConverter
+    from .heidelberg import HeidelbergPullConverter
+    from .herrenberg import HerrenbergPullConverter
+    from .karlsruhe import KarlsruheBikePullConverter, KarlsruhePullConverter
+    from .kienzler import KienzlerPullConverter
+    from .konstanz_bike import KonstanzBikePushConverter
+    from .mannheim_buchen import BuchenPushConverter, MannheimPushConverter
+    from .neckarsulm import NeckarsulmPushConverter
+    from .neckarsulm_bike import NeckarsulmBikePushConverter
+    from .pbw import PbwPullConverter
+    from .pforzheim import PforzheimPushConverter
+    from .pum_bw import PumBwPushConverter
+    from .radvis_bw import RadvisBwPullConverter
+    from .reutlingen import ReutlingenPushConverter
+    from .reutlingen_bike import ReutlingenBikePushConverter
+    from .stuttgart import StuttgartPushConverter
+    from .ulm import UlmPullConverter
+    from .vrs_p_r import VrsParkAndRidePushConverter
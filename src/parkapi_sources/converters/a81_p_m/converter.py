@@ -3,7 +3,6 @@ Copyright 2024 binary butterfly GmbH
 Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
 """
 
-import requests
 from validataclass.exceptions import ValidationError
 from validataclass.validators import AnythingValidator, DataclassValidator, ListValidator
 
@@ -48,10 +47,13 @@ class A81PMPullConverter(PullConverter):
         return realtime_parking_site_inputs, realtime_parking_site_errors
 
     def _get_data(self) -> tuple[list[A81PMInput], list[ImportParkingSiteException]]:
+        return self._get_cached_inputs_and_exceptions((self.source_info.source_url,), self._load_data)
+
+    def _load_data(self) -> tuple[list[A81PMInput], list[ImportParkingSiteException]]:
         a81_p_m_inputs: list[A81PMInput] = []
         parking_site_errors: list[ImportParkingSiteException] = []
 
-        response = requests.get(
+        response = self.request_helper.get(
             self.source_info.source_url,
             headers={'Authorization': f'Bearer {self.config_helper.get("PARK_API_A81_P_M_TOKEN")}'},
             timeout=60,
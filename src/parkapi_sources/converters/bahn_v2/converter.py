@@ -3,7 +3,6 @@ Copyright 2024 binary butterfly GmbH
 Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
 """
 
-import requests
 from validataclass.exceptions import ValidationError
 from validataclass.validators import DataclassValidator
 
@@ -64,7 +63,7 @@ class BahnV2PullConverter(PullConverter):
             'accept': 'application/json',
         }
 
-        response = requests.get(
+        response = self.request_helper.get(
             f'{self.config_helper.get("PARK_API_BAHN_URL", self._base_url)}/parking-facilities',
             headers=headers,
             timeout=60,
@@ -4,21 +4,24 @@ Use of this source code is governed by an MIT-style license that can be found in
 """
 
 from abc import ABC, abstractmethod
-
-from validataclass.validators import DataclassValidator
+from typing import Optional
 
 from parkapi_sources.models import RealtimeParkingSiteInput, SourceInfo, StaticParkingSiteInput
-from parkapi_sources.util import ConfigHelper
+from parkapi_sources.util import ConfigHelper, RequestHelper
+from parkapi_sources.validators import CompiledDataclassValidator
 
 
 class BaseConverter(ABC):
     config_helper: ConfigHelper
-    static_parking_site_validator = DataclassValidator(StaticParkingSiteInput)
-    realtime_parking_site_validator = DataclassValidator(RealtimeParkingSiteInput)
+    request_helper: RequestHelper
+    static_parking_site_validator = CompiledDataclassValidator(StaticParkingSiteInput)
+    realtime_parking_site_validator = CompiledDataclassValidator(RealtimeParkingSiteInput)
     required_config_keys: list[str] = []
 
-    def __init__(self, config_helper: ConfigHelper):
+    def __init__(self, config_helper: ConfigHelper, request_helper: Optional[RequestHelper] = None):
         self.config_helper = config_helper
+        # If no shared RequestHelper is given, the converter gets its own connection pool
+        self.request_helper = RequestHelper() if request_helper is None else request_helper
 
     @property
     @abstractmethod
@@ -4,13 +4,24 @@ Use of this source code is governed by an MIT-style license that can be found in
 """
 
 from abc import abstractmethod
+from typing import Any, Callable, Hashable
 
 from parkapi_sources.converters.base_converter import BaseConverter
 from parkapi_sources.exceptions import ImportParkingSiteException
 from parkapi_sources.models import RealtimeParkingSiteInput, StaticParkingSiteInput
+from parkapi_sources.util import SnapshotCache
 
 
 class PullConverter(BaseConverter):
+    # Seconds a downloaded snapshot is re-used, should be lower than the shortest realtime update interval. ParkAPISources sets
+    # PARK_API_SNAPSHOT_CACHE_TTL instead if it's configured, and ParkAPIPoller caps it at the realtime interval of the source.
+    snapshot_cache_ttl: float = 30
+    snapshot_cache: SnapshotCache
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.snapshot_cache = SnapshotCache(ttl=self.snapshot_cache_ttl)
+
     @abstractmethod
     def get_static_parking_sites(self) -> tuple[list[StaticParkingSiteInput], list[ImportParkingSiteException]]:
         pass
@@ -18,3 +29,17 @@ class PullConverter(BaseConverter):
     @abstractmethod
     def get_realtime_parking_sites(self) -> tuple[list[RealtimeParkingSiteInput], list[ImportParkingSiteException]]:
         pass
+
+    def _get_cached_inputs_and_exceptions(
+        self,
+        key: Hashable,
+        loader: Callable[[], tuple[list[Any], list[ImportParkingSiteException]]],
+    ) -> tuple[list[Any], list[ImportParkingSiteException]]:
+        """
+        Returns the validated inputs and exceptions of loader, re-using them for the same key as long as the snapshot cache TTL is not
+        exceeded. The key should contain the URL and all relevant request parameters.
+        """
+        inputs, exceptions = self.snapshot_cache.get_or_load(key, loader)
+
+        # Callers get their own lists, so they cannot change the cached snapshot
+        return list(inputs), list(exceptions)
@@ -4,35 +4,41 @@ Use of this source code is governed by an MIT-style license that can be found in
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-import requests
-from bs4 import BeautifulSoup
-from bs4.element import Tag
 from validataclass.exceptions import ValidationError
 from validataclass.validators import DataclassValidator
 
 from parkapi_sources.exceptions import ImportParkingSiteException
 from parkapi_sources.models import RealtimeParkingSiteInput, SourceInfo
+from parkapi_sources.util import RequestHelper
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+    from bs4.element import Tag
 
 
 class PullScraperMixin(ABC):
     source_info: SourceInfo
+    request_helper: RequestHelper
     realtime_parking_site_validator: DataclassValidator
 
     @abstractmethod
-    def get_realtime_tags_and_params(self) -> tuple[list[Tag], dict]:
+    def get_realtime_tags_and_params(self) -> tuple[list['Tag'], dict]:
         pass
 
     @abstractmethod
-    def realtime_tag_to_dict(self, tag: Tag, **kwargs) -> Optional[dict]:
+    def realtime_tag_to_dict(self, tag: 'Tag', **kwargs) -> Optional[dict]:
         pass
 
-    def load_url_in_soup(self, url: Optional[str] = None):
+    def load_url_in_soup(self, url: Optional[str] = None) -> 'BeautifulSoup':
+        # bs4 is imported here, so it's just loaded if a scraper is actually used
+        from bs4 import BeautifulSoup
+
         if url is None:
             url = self.source_info.public_url
 
-        response = requests.get(url, timeout=30)
+        response = self.request_helper.get(url, timeout=30)
 
         return BeautifulSoup(response.text, features='html.parser')
 
@@ -5,52 +5,178 @@ Use of this source code is governed by an MIT-style license that can be found in
 
 import json
 from datetime import datetime, timezone
+from hashlib import sha256
 from pathlib import Path
+from typing import Optional
 
-import requests
-from requests import ConnectionError, JSONDecodeError
+from requests import ConnectionError, Timeout
 from urllib3.exceptions import NewConnectionError
 from validataclass.exceptions import ValidationError
 from validataclass.validators import DataclassValidator
 
-from parkapi_sources.converters.base_converter.pull.static_geojson_data_mixin.models import GeojsonFeatureInput, GeojsonInput
+from parkapi_sources.converters.base_converter.pull.static_geojson_data_mixin.models import (
+    GeojsonFeatureInput,
+    GeojsonInput,
+    StaticGeojsonContent,
+    StaticGeojsonMetadata,
+    StaticGeojsonSnapshot,
+)
 from parkapi_sources.exceptions import ImportParkingSiteException, ImportSourceException
 from parkapi_sources.models import SourceInfo, StaticParkingSiteInput
-from parkapi_sources.util import ConfigHelper
+from parkapi_sources.util import ConfigHelper, RequestHelper
+from parkapi_sources.validators import Rfc1123DateTimeValidator
 
 
 class StaticGeojsonDataMixin:
     config_helper: ConfigHelper
+    request_helper: RequestHelper
     source_info: SourceInfo
     geojson_validator = DataclassValidator(GeojsonInput)
     geojson_feature_validator = DataclassValidator(GeojsonFeatureInput)
+    last_modified_validator = Rfc1123DateTimeValidator()
     _base_url = 'https://raw.githubusercontent.com/ParkenDD/parkapi-static-data/main/sources'
+    _static_geojson_snapshot: Optional[StaticGeojsonSnapshot] = None
 
-    def _get_static_geojson(self, source_uid: str) -> GeojsonInput:
+    def _get_static_geojson(self, source_uid: str) -> StaticGeojsonContent:
         if self.config_helper.get('STATIC_GEOJSON_BASE_PATH'):
-            with Path(self.config_helper.get('STATIC_GEOJSON_BASE_PATH'), f'{source_uid}.geojson').open() as geojson_file:
-                return json.loads(geojson_file.read())
-        else:
-            try:
-                response = requests.get(f'{self.config_helper.get("STATIC_GEOJSON_BASE_URL")}/{source_uid}.geojson', timeout=30)
-            except (ConnectionError, NewConnectionError) as e:
-                raise ImportParkingSiteException(
-                    source_uid=self.source_info.uid,
-                    message='Connection issue for GeoJSON data',
-                ) from e
+            with Path(self.config_helper.get('STATIC_GEOJSON_BASE_PATH'), f'{source_uid}.geojson').open('rb') as geojson_file:
+                return self._build_static_geojson_content(geojson_file.read())
+
+        cache_path: Optional[Path] = None
+        metadata: Optional[StaticGeojsonMetadata] = None
+        if self.config_helper.get('STATIC_GEOJSON_CACHE_PATH'):
+            cache_path = Path(self.config_helper.get('STATIC_GEOJSON_CACHE_PATH'))
+            metadata = self._load_static_geojson_metadata(cache_path, source_uid)
+
+        # With cached data, we just download the GeoJSON if it changed since the last request
+        headers: dict[str, str] = {}
+        if metadata is not None:
+            if metadata.etag:
+                headers['If-None-Match'] = metadata.etag
+            if metadata.last_modified:
+                headers['If-Modified-Since'] = metadata.last_modified
+
+        try:
+            response = self.request_helper.get(
+                f'{self.config_helper.get("STATIC_GEOJSON_BASE_URL")}/{source_uid}.geojson',
+                headers=headers,
+                timeout=30,
+            )
+        except (ConnectionError, NewConnectionError, Timeout) as e:
+            # If GitHub is not available, cached data is still good enough, because the templates change rarely
+            if metadata is not None:
+                return self._load_cached_static_geojson(cache_path, source_uid, metadata)
+            raise ImportParkingSiteException(
+                source_uid=self.source_info.uid,
+                message='Connection issue for GeoJSON data',
+            ) from e
+
+        if metadata is not None and (response.status_code == 304 or response.status_code >= 500):
+            return self._load_cached_static_geojson(cache_path, source_uid, metadata)
+
+        static_geojson_content = self._build_static_geojson_content(
+            response.content,
+            last_modified=response.headers.get('Last-Modified'),
+        )
+
+        if cache_path is not None and response.status_code == 200:
+            # Without Last-Modified, content keeps the time it was loaded first, so updated_at just moves if the content changes
+            if static_geojson_content.updated_at is None:
+                static_geojson_content.updated_at = self._get_first_loaded_at(metadata, static_geojson_content.content_hash)
+            self._save_static_geojson_cache(
+                cache_path,
+                source_uid,
+                static_geojson_content,
+                StaticGeojsonMetadata(
+                    content_hash=static_geojson_content.content_hash,
+                    etag=response.headers.get('ETag'),
+                    last_modified=response.headers.get('Last-Modified'),
+                    updated_at=static_geojson_content.updated_at.isoformat(),
+                ),
+            )
+
+        return static_geojson_content
+
+    def _build_static_geojson_content(self, data: bytes, last_modified: Optional[str] = None) -> StaticGeojsonContent:
+        updated_at: Optional[datetime] = None
+        if last_modified:
             try:
-                return response.json()
-            except JSONDecodeError as e:
-                raise ImportParkingSiteException(
-                    source_uid=self.source_info.uid,
-                    message='Invalid JSON response for GeoJSON data',
-                ) from e
+                updated_at = self.last_modified_validator.validate(last_modified)
+            except ValidationError:
+                pass
 
-    def _get_static_parking_site_inputs_and_exceptions(
+        return StaticGeojsonContent(data=data, content_hash=sha256(data).hexdigest(), updated_at=updated_at)
+
+    @staticmethod
+    def _load_static_geojson_metadata(cache_path: Path, source_uid: str) -> Optional[StaticGeojsonMetadata]:
+        metadata_path = Path(cache_path, f'{source_uid}.meta.json')
+        if not metadata_path.exists() or not Path(cache_path, f'{source_uid}.geojson').exists():
+            return None
+
+        try:
+            with metadata_path.open() as metadata_file:
+                return StaticGeojsonMetadata(**json.loads(metadata_file.read()))
+        except (ValueError, TypeError):
+            # Broken cache metadata just means that we download the data again
+            return None
+
+    def _load_cached_static_geojson(
         self,
+        cache_path: Path,
         source_uid: str,
-    ) -> tuple[list[StaticParkingSiteInput], list[ImportParkingSiteException]]:
-        geojson_dict = self._get_static_geojson(source_uid)
+        metadata: StaticGeojsonMetadata,
+    ) -> StaticGeojsonContent:
+        with Path(cache_path, f'{source_uid}.geojson').open('rb') as geojson_file:
+            static_geojson_content = self._build_static_geojson_content(geojson_file.read(), last_modified=metadata.last_modified)
+
+        if static_geojson_content.updated_at is None and metadata.updated_at:
+            static_geojson_content.updated_at = self._get_first_loaded_at(metadata, static_geojson_content.content_hash)
+        return static_geojson_content
+
+    @staticmethod
+    def _get_first_loaded_at(metadata: Optional[StaticGeojsonMetadata], content_hash: str) -> datetime:
+        if metadata is not None and metadata.content_hash == content_hash and metadata.updated_at:
+            try:
+                return datetime.fromisoformat(metadata.updated_at)
+            except ValueError:
+                pass
+        return datetime.now(tz=timezone.utc)
+
+    @staticmethod
+    def _save_static_geojson_cache(
+        cache_path: Path,
+        source_uid: str,
+        static_geojson_content: StaticGeojsonContent,
+        metadata: StaticGeojsonMetadata,
+    ):
+        cache_path.mkdir(parents=True, exist_ok=True)
+
+        # Write to temporary files first, so parallel readers never see half-written files
+        for filename, data in (
+            (f'{source_uid}.geojson', static_geojson_content.data),
+            (f'{source_uid}.meta.json', json.dumps(metadata.to_dict()).encode()),
+        ):
+            temporary_path = Path(cache_path, f'{filename}.tmp')
+            temporary_path.write_bytes(data)
+            temporary_path.replace(Path(cache_path, filename))
+
+    def _get_static_geojson_snapshot(self, source_uid: str, static_geojson_content: StaticGeojsonContent) -> StaticGeojsonSnapshot:
+        # If the content did not change, we can re-use the validated features of the last run
+        if (
+            self._static_geojson_snapshot is not None
+            and self._static_geojson_snapshot.source_uid == source_uid
+            and self._static_geojson_snapshot.content_hash == static_geojson_content.content_hash
+        ):
+            return self._static_geojson_snapshot
+
+        try:
+            geojson_dict = json.loads(static_geojson_content.data)
+        except ValueError as e:
+            raise ImportParkingSiteException(
+                source_uid=self.source_info.uid,
+                message='Invalid JSON response for GeoJSON data',
+            ) from e
+
         try:
             geojson_input = self.geojson_validator.validate(geojson_dict)
         except ValidationError as e:
@@ -59,19 +185,12 @@ class StaticGeojsonDataMixin:
                 message=f'Invalid GeoJSON for source {source_uid}: {e.to_dict()}. Data: {geojson_dict}',
             ) from e
 
-        static_parking_site_inputs: list[StaticParkingSiteInput] = []
+        feature_inputs: list[GeojsonFeatureInput] = []
         import_parking_site_exceptions: list[ImportParkingSiteException] = []
 
         for feature_dict in geojson_input.features:
             try:
-                feature_input: GeojsonFeatureInput = self.geojson_feature_validator.validate(feature_dict)
-                static_parking_site_inputs.append(
-                    feature_input.to_static_parking_site_input(
-                        # TODO: Use the Last-Updated HTTP header instead, but as Github does not set such an header, we need to move
-                        #  all GeoJSON data in order to use this.
-                        static_data_updated_at=datetime.now(tz=timezone.utc),
-                    ),
-                )
+                feature_inputs.append(self.geojson_feature_validator.validate(feature_dict))
             except ValidationError as e:
                 import_parking_site_exceptions.append(
                     ImportParkingSiteException(
@@ -80,4 +199,31 @@ class StaticGeojsonDataMixin:
                         message=f'Invalid GeoJSON feature for source {source_uid}: {e.to_dict()}',
                     ),
                 )
-        return static_parking_site_inputs, import_parking_site_exceptions
+
+        self._static_geojson_snapshot = StaticGeojsonSnapshot(
+            source_uid=source_uid,
+            content_hash=static_geojson_content.content_hash,
+            feature_inputs=feature_inputs,
+            import_parking_site_exceptions=import_parking_site_exceptions,
+            loaded_at=datetime.now(tz=timezone.utc),
+        )
+        return self._static_geojson_snapshot
+
+    def _get_static_parking_site_inputs_and_exceptions(
+        self,
+        source_uid: str,
+    ) -> tuple[list[StaticParkingSiteInput], list[ImportParkingSiteException]]:
+        static_geojson_content = self._get_static_geojson(source_uid)
+        static_geojson_snapshot = self._get_static_geojson_snapshot(source_uid, static_geojson_content)
+
+        # GitHub does not set a Last-Modified header, so we fall back to the time the content was loaded first if there is none. The
+        # snapshot is re-used as long as the content does not change, so the time does not move either.
+        static_data_updated_at = static_geojson_content.updated_at or static_geojson_snapshot.loaded_at
+
+        # StaticParkingSiteInputs are created on every call, because converters extend them afterwards
+        static_parking_site_inputs: list[StaticParkingSiteInput] = [
+            feature_input.to_static_parking_site_input(static_data_updated_at=static_data_updated_at)
+            for feature_input in static_geojson_snapshot.feature_inputs
+        ]
+
+        return static_parking_site_inputs, list(static_geojson_snapshot.import_parking_site_exceptions)
@@ -3,6 +3,7 @@ Copyright 2024 binary butterfly GmbH
 Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
 """
 
+from dataclasses import asdict, dataclass
 from datetime import datetime
 from decimal import Decimal
 from typing import Optional
@@ -21,6 +22,7 @@ from validataclass.validators import (
     UrlValidator,
 )
 
+from parkapi_sources.exceptions import ImportParkingSiteException
 from parkapi_sources.models import StaticParkingSiteInput
 from parkapi_sources.models.enums import ParkingSiteType
 
@@ -61,3 +63,31 @@ class GeojsonFeatureInput:
 class GeojsonInput:
     type: str = AnyOfValidator(allowed_values=['FeatureCollection'])
     features: list[dict] = ListValidator(AnythingValidator(allowed_types=[dict]))
+
+
+@dataclass
+class StaticGeojsonMetadata:
+    content_hash: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    # ISO time when content with this hash was loaded first
+    updated_at: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+@dataclass
+class StaticGeojsonContent:
+    data: bytes
+    content_hash: str
+    updated_at: Optional[datetime] = None
+
+
+@dataclass
+class StaticGeojsonSnapshot:
+    source_uid: str
+    content_hash: str
+    feature_inputs: list[GeojsonFeatureInput]
+    import_parking_site_exceptions: list[ImportParkingSiteException]
+    loaded_at: datetime
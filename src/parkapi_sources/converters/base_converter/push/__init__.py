@@ -3,11 +3,37 @@ Copyright 2024 binary butterfly GmbH
 Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
 """
 
-from .push_converter import PushConverter  # noqa: I001
-
-from .csv_converter import CsvConverter
-from .json_converter import JsonConverter
-from .normalized_xlsx_converter import NormalizedXlsxConverter
-from .parkapi_json_converter import ParkApiConverter
-from .xlsx_converter import XlsxConverter
-from .xml_converter import XmlConverter
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+from .push_converter import PushConverter
+
+# Format specific base classes are imported at first access, so a CSV converter does not need to import openpyxl or lxml.
+converter_modules_by_class_name: dict[str, str] = {
+    'CsvConverter': '.csv_converter',
+    'JsonConverter': '.json_converter',
+    'NormalizedXlsxConverter': '.normalized_xlsx_converter',
+    'ParkApiConverter': '.parkapi_json_converter',
+    'XlsxConverter': '.xlsx_converter',
+    'XmlConverter': '.xml_converter',
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in converter_modules_by_class_name:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    return getattr(import_module(converter_modules_by_class_name[name], __name__), name)
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals().keys(), *converter_modules_by_class_name.keys()])
+
+
+if TYPE_CHECKING:
+    from .csv_converter import CsvConverter
+    from .json_converter import JsonConverter
+    from .normalized_xlsx_converter import NormalizedXlsxConverter
+    from .parkapi_json_converter import ParkApiConverter
+    from .xlsx_converter import XlsxConverter
+    from .xml_converter import XmlConverter
@@ -6,36 +6,66 @@ Use of this source code is governed by an MIT-style license that can be found in
 import csv
 from abc import ABC, abstractmethod
 from io import StringIO
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 from parkapi_sources.converters.base_converter.push import PushConverter
 from parkapi_sources.exceptions import ImportParkingSiteException, ImportSourceException
 from parkapi_sources.models import RealtimeParkingSiteInput, StaticParkingSiteInput
+from parkapi_sources.util import RowMapper
 
 
 class CsvConverter(PushConverter, ABC):
+    csv_dialect = 'excel'
     csv_delimiter = ';'
+    header_mapping: dict[str, str]
 
     def handle_csv_string(
         self,
         data: StringIO,
     ) -> tuple[list[StaticParkingSiteInput | RealtimeParkingSiteInput], list[ImportParkingSiteException]]:
-        return self.handle_csv(list(csv.reader(data, delimiter=self.csv_delimiter)))
+        return self.handle_csv(self.iter_csv_rows(data))
+
+    def iter_csv_string(self, data: StringIO) -> Iterator[StaticParkingSiteInput | RealtimeParkingSiteInput | ImportParkingSiteException]:
+        """
+        Like handle_csv_string(), but yields parking site inputs and import exceptions while the CSV data is read instead of collecting
+        them.
+        """
+        return self.iter_csv(self.iter_csv_rows(data))
+
+    def iter_csv_rows(self, data: StringIO) -> Iterator[list[str]]:
+        return csv.reader(data, dialect=self.csv_dialect, delimiter=self.csv_delimiter)
+
+    def iter_csv_dicts(self, data: Iterable[list]) -> Iterator[dict[str, Any]]:
+        """
+        Reads the mapping from the header row and yields a dict with the header_mapping target fields for every following row.
+        """
+        rows = iter(data)
+        row_mapper = RowMapper(self.get_mapping_by_header(self.header_mapping, next(rows, [])))
+
+        for row in rows:
+            yield row_mapper.map(row)
 
     def get_mapping_by_header(self, header_row: dict[str, str], row: list[Any]) -> dict[str, int]:
+        column_indices: dict[Any, int] = RowMapper.get_column_indices(row)
         mapping: dict[str, int] = {}
         for header_field, target_field in header_row.items():
-            if header_field not in row:
+            if header_field not in column_indices:
                 raise ImportSourceException(
                     source_uid=self.source_info.uid,
                     message=f'cannot find header key {header_field}',
                 )
-            mapping[target_field] = row.index(header_field)
+            mapping[target_field] = column_indices[header_field]
         return mapping
 
-    @abstractmethod
     def handle_csv(
         self,
-        data: list[list],
+        data: Iterable[list],
     ) -> tuple[list[StaticParkingSiteInput | RealtimeParkingSiteInput], list[ImportParkingSiteException]]:
+        return self.split_results(self.iter_csv(data))
+
+    @abstractmethod
+    def iter_csv(self, data: Iterable[list]) -> Iterator[StaticParkingSiteInput | RealtimeParkingSiteInput | ImportParkingSiteException]:
+        """
+        Converts CSV rows, starting with the header row, and yields parking site inputs and import exceptions.
+        """
         pass
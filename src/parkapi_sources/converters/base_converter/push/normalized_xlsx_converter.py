@@ -7,12 +7,12 @@ from abc import ABC
 from datetime import datetime, timezone
 from typing import Any
 
-from openpyxl.cell import Cell
 from openpyxl.workbook.workbook import Workbook
 from validataclass.exceptions import ValidationError
 
 from parkapi_sources.exceptions import ImportParkingSiteException
 from parkapi_sources.models import StaticParkingSiteInput
+from parkapi_sources.util import RowMapper
 
 from .xlsx_converter import XlsxConverter
 
@@ -63,18 +63,22 @@ class NormalizedXlsxConverter(XlsxConverter, ABC):
     }
 
     def handle_xlsx(self, workbook: Workbook) -> tuple[list[StaticParkingSiteInput], list[ImportParkingSiteException]]:
-        worksheet = workbook.active
-        mapping: dict[str, int] = self.get_mapping_by_header(next(worksheet.rows))
+        rows = self.iter_rows(workbook.active)
+        row_mapper = RowMapper(self.get_mapping_by_header(next(rows)))
 
         static_parking_site_errors: list[ImportParkingSiteException] = []
         static_parking_site_inputs: list[StaticParkingSiteInput] = []
 
-        for row in worksheet.iter_rows(min_row=2):
+        parking_site_dicts: list[dict[str, Any]] = []
+        for row in rows:
             # ignore empty lines as LibreOffice sometimes adds empty rows at the end of a file
-            if row[0].value is None:
+            if row[0] is None:
                 continue
-            parking_site_dict = self.map_row_to_parking_site_dict(mapping, row)
+            parking_site_dicts.append(self.map_row_to_parking_site_dict(row_mapper, row))
 
+        self.map_parking_site_dicts(parking_site_dicts)
+
+        for parking_site_dict in parking_site_dicts:
             try:
                 static_parking_site_inputs.append(self.static_parking_site_validator.validate(parking_site_dict))
             except ValidationError as e:
@@ -89,10 +93,14 @@ class NormalizedXlsxConverter(XlsxConverter, ABC):
 
         return static_parking_site_inputs, static_parking_site_errors
 
-    def map_row_to_parking_site_dict(self, mapping: dict[str, int], row: list[Cell]) -> dict[str, Any]:
-        parking_site_raw_dict: dict[str, str] = {}
-        for field in mapping.keys():
-            parking_site_raw_dict[field] = row[mapping[field]].value
+    def map_parking_site_dicts(self, parking_site_dicts: list[dict[str, Any]]):
+        """
+        Hook for mapping steps which are done for all rows at once, like coordinate transformations. Changes the dicts in place.
+        """
+        pass
+
+    def map_row_to_parking_site_dict(self, row_mapper: RowMapper, row: tuple[Any, ...]) -> dict[str, Any]:
+        parking_site_raw_dict: dict[str, str] = row_mapper.map(row)
 
         parking_site_dict = {key: value for key, value in parking_site_raw_dict.items() if not key.startswith('opening_hours_')}
         opening_hours_input = self.excel_opening_time_validator.validate(
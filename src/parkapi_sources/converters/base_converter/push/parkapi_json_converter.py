@@ -12,6 +12,7 @@ from validataclass.validators import AnythingValidator, DataclassValidator, List
 from parkapi_sources.converters.base_converter.push import JsonConverter
 from parkapi_sources.exceptions import ImportParkingSiteException, ImportSourceException
 from parkapi_sources.models import RealtimeParkingSiteInput, StaticParkingSiteInput
+from parkapi_sources.validators import CompiledDataclassValidator
 
 
 @validataclass
@@ -21,8 +22,8 @@ class ParkingSiteItemsInput:
 
 class ParkApiConverter(JsonConverter, ABC):
     parking_site_items_validator = DataclassValidator(ParkingSiteItemsInput)
-    static_parking_site_validator = DataclassValidator(StaticParkingSiteInput)
-    realtime_parking_site_validator = DataclassValidator(RealtimeParkingSiteInput)
+    static_parking_site_validator = CompiledDataclassValidator(StaticParkingSiteInput)
+    realtime_parking_site_validator = CompiledDataclassValidator(RealtimeParkingSiteInput)
 
     def handle_json(
         self,
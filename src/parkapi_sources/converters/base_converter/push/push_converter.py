@@ -4,9 +4,27 @@ Use of this source code is governed by an MIT-style license that can be found in
 """
 
 from abc import ABC
+from typing import Iterable
 
 from parkapi_sources.converters import BaseConverter
+from parkapi_sources.exceptions import ImportParkingSiteException
+from parkapi_sources.models import RealtimeParkingSiteInput, StaticParkingSiteInput
 
 
 class PushConverter(BaseConverter, ABC):
-    pass
+    @staticmethod
+    def split_results(
+        results: Iterable[StaticParkingSiteInput | RealtimeParkingSiteInput | ImportParkingSiteException],
+    ) -> tuple[list[StaticParkingSiteInput | RealtimeParkingSiteInput], list[ImportParkingSiteException]]:
+        """
+        Collects results of converters which yield parking site inputs and import exceptions while reading their data into the usual
+        tuple of lists.
+        """
+        parking_site_inputs: list[StaticParkingSiteInput | RealtimeParkingSiteInput] = []
+        import_parking_site_exceptions: list[ImportParkingSiteException] = []
+        for result in results:
+            if isinstance(result, ImportParkingSiteException):
+                import_parking_site_exceptions.append(result)
+            else:
+                parking_site_inputs.append(result)
+        return parking_site_inputs, import_parking_site_exceptions
@@ -4,9 +4,13 @@ Use of this source code is governed by an MIT-style license that can be found in
 """
 
 from abc import ABC, abstractmethod
+from io import BytesIO
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator
 
-from openpyxl.cell import Cell
+from openpyxl.reader.excel import load_workbook
 from openpyxl.workbook import Workbook
+from openpyxl.worksheet.worksheet import Worksheet
 from validataclass.validators import DataclassValidator
 
 from parkapi_sources.converters.base_converter.push import PushConverter
@@ -18,10 +22,12 @@ from parkapi_sources.models import (
     SourceInfo,
     StaticParkingSiteInput,
 )
+from parkapi_sources.util import RowMapper
+from parkapi_sources.validators import CompiledDataclassValidator
 
 
 class XlsxConverter(PushConverter, ABC):
-    static_parking_site_validator = DataclassValidator(ExcelStaticParkingSiteInput)
+    static_parking_site_validator = CompiledDataclassValidator(ExcelStaticParkingSiteInput)
     excel_opening_time_validator = DataclassValidator(ExcelOpeningTimeInput)
 
     header_row: dict[str, str] = {}
@@ -34,14 +40,44 @@ class XlsxConverter(PushConverter, ABC):
     ) -> tuple[list[StaticParkingSiteInput | RealtimeParkingSiteInput], list[ImportParkingSiteException]]:
         pass
 
-    def get_mapping_by_header(self, row: tuple[Cell]) -> dict[str, int]:
-        row_values = [cell.value for cell in row]
+    def handle_xlsx_file(
+        self,
+        source: bytes | str | Path | BinaryIO,
+    ) -> tuple[list[StaticParkingSiteInput | RealtimeParkingSiteInput], list[ImportParkingSiteException]]:
+        """
+        Opens an XLSX file from bytes, a path or a binary file object in read-only mode and passes it to handle_xlsx(). Read-only
+        workbooks parse rows while iterating instead of building all cells up front, which needs much less memory and time.
+        """
+        workbook: Workbook = load_workbook(BytesIO(source) if isinstance(source, bytes) else source, read_only=True, data_only=True)
+        try:
+            return self.handle_xlsx(workbook)
+        finally:
+            # Read-only workbooks keep the file open until they are closed
+            workbook.close()
+
+    @staticmethod
+    def iter_rows(worksheet: Worksheet) -> Iterator[tuple[Any, ...]]:
+        """
+        Yields the values of all rows including the header row as tuples, which works for regular and read-only worksheets. Read-only
+        worksheets without dimension information skip trailing empty cells, so rows are padded to the length of the header row.
+        """
+        rows = worksheet.iter_rows(values_only=True)
+        header_row: tuple[Any, ...] = next(rows, ())
+        yield header_row
+
+        for row in rows:
+            if len(row) < len(header_row):
+                row = row + (None,) * (len(header_row) - len(row))
+            yield row
+
+    def get_mapping_by_header(self, row_values: tuple[Any, ...]) -> dict[str, int]:
+        column_indices: dict[Any, int] = RowMapper.get_column_indices(row_values)
         mapping: dict[str, int] = {}
         for header_col, target_field in self.header_row.items():
-            if header_col not in row_values:
+            if header_col not in column_indices:
                 raise ImportSourceException(
                     source_uid=self.source_info.uid,
                     message=f'cannot find header key {header_col}',
                 )
-            mapping[target_field] = row_values.index(header_col)
+            mapping[target_field] = column_indices[header_col]
         return mapping
@@ -4,7 +4,11 @@ Use of this source code is governed by an MIT-style license that can be found in
 """
 
 from abc import ABC, abstractmethod
+from io import BytesIO
+from pathlib import Path
+from typing import BinaryIO
 
+from lxml import etree
 from lxml.etree import Element
 
 from parkapi_sources.converters.base_converter.push import PushConverter
@@ -19,3 +23,22 @@ class XmlConverter(PushConverter, ABC):
     @abstractmethod
     def handle_xml(self, root: Element) -> tuple[list[StaticParkingSiteInput | RealtimeParkingSiteInput], list[ImportParkingSiteException]]:
         pass
+
+    def handle_xml_file(
+        self,
+        source: bytes | str | Path | BinaryIO,
+    ) -> tuple[list[StaticParkingSiteInput | RealtimeParkingSiteInput], list[ImportParkingSiteException]]:
+        """
+        Parses an XML file from bytes, a path or a binary file object and passes it to handle_xml(). Converters which can convert records
+        while parsing override this, so they don't have to build the whole tree first.
+        """
+        tree = etree.parse(self.get_xml_source(source), parser=etree.XMLParser(resolve_entities=False))  # noqa: S320
+        return self.handle_xml(tree.getroot())
+
+    @staticmethod
+    def get_xml_source(source: bytes | str | Path | BinaryIO) -> str | BinaryIO:
+        if isinstance(source, bytes):
+            return BytesIO(source)
+        if isinstance(source, Path):
+            return str(source)
+        return source
@@ -6,10 +6,9 @@ Use of this source code is governed by an MIT-style license that can be found in
 from datetime import datetime, timezone
 from typing import Any
 
-from openpyxl.cell import Cell
-
 from parkapi_sources.converters.base_converter.push import NormalizedXlsxConverter
 from parkapi_sources.models import SourceInfo
+from parkapi_sources.util import RowMapper
 
 
 class EllwangenPushConverter(NormalizedXlsxConverter):
@@ -39,11 +38,8 @@ class EllwangenPushConverter(NormalizedXlsxConverter):
             **ellwangen_header_rows,
         }
 
-    def map_row_to_parking_site_dict(self, mapping: dict[str, int], row: list[Cell]) -> dict[str, Any]:
-        parking_site_dict: dict[str, str] = {}
-
-        for field in mapping.keys():
-            parking_site_dict[field] = row[mapping[field]].value
+    def map_row_to_parking_site_dict(self, row_mapper: RowMapper, row: tuple[Any, ...]) -> dict[str, Any]:
+        parking_site_dict: dict[str, str] = row_mapper.map(row)
 
         parking_site_dict['max_stay'] = parking_site_dict['max_stay'] * 60 if parking_site_dict['max_stay'] else None
         parking_site_dict['type'] = self.type_mapping.get(parking_site_dict.get('type'))
@@ -3,7 +3,6 @@ Copyright 2024 binary butterfly GmbH
 Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
 """
 
-import requests
 from validataclass.exceptions import ValidationError
 from validataclass.validators import DataclassValidator
 
@@ -64,10 +63,13 @@ class FreiburgPullConverter(PullConverter, StaticGeojsonDataMixin):
         return realtime_parking_site_inputs, import_parking_site_exceptions
 
     def _get_raw_realtime_parking_sites(self) -> tuple[list[FreiburgFeatureInput], list[ImportParkingSiteException]]:
+        return self._get_cached_inputs_and_exceptions((self.source_info.source_url,), self._load_raw_realtime_parking_sites)
+
+    def _load_raw_realtime_parking_sites(self) -> tuple[list[FreiburgFeatureInput], list[ImportParkingSiteException]]:
         realtime_freiburg_inputs: list[FreiburgFeatureInput] = []
         import_parking_site_exceptions: list[ImportParkingSiteException] = []
 
-        response = requests.get(self.source_info.source_url, timeout=30)
+        response = self.request_helper.get(self.source_info.source_url, timeout=30)
         response_data = response.json()
 
         try:
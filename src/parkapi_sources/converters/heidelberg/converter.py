@@ -3,7 +3,6 @@ Copyright 2024 binary butterfly GmbH
 Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
 """
 
-import requests
 from validataclass.exceptions import ValidationError
 from validataclass.validators import AnythingValidator, DataclassValidator, ListValidator
 
@@ -18,6 +17,7 @@ class HeidelbergPullConverter(PullConverter):
     required_config_keys = ['PARK_API_HEIDELBERG_API_KEY']
     list_validator = ListValidator(AnythingValidator(allowed_types=[dict]))
     heidelberg_validator = DataclassValidator(HeidelbergInput)
+    request_limit: int = 50
 
     source_info = SourceInfo(
         uid='heidelberg',
@@ -52,12 +52,15 @@ class HeidelbergPullConverter(PullConverter):
         return realtime_parking_site_inputs, import_parking_site_exceptions
 
     def _get_data(self) -> tuple[list[HeidelbergInput], list[ImportParkingSiteException]]:
+        return self._get_cached_inputs_and_exceptions((self.source_info.source_url, self.request_limit), self._load_data)
+
+    def _load_data(self) -> tuple[list[HeidelbergInput], list[ImportParkingSiteException]]:
         heidelberg_inputs: list[HeidelbergInput] = []
         import_parking_site_exceptions: list[ImportParkingSiteException] = []
 
-        response = requests.get(
+        response = self.request_helper.get(
             self.source_info.source_url,
-            params={'api-key': self.config_helper.get('PARK_API_HEIDELBERG_API_KEY'), 'limit': 50},
+            params={'api-key': self.config_helper.get('PARK_API_HEIDELBERG_API_KEY'), 'limit': self.request_limit},
             headers={'X-Gravitee-Api-Key': self.config_helper.get('PARK_API_HEIDELBERG_API_KEY')},
             timeout=30,
         )
@@ -3,7 +3,6 @@ Copyright 2024 binary butterfly GmbH
 Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
 """
 
-import requests
 from validataclass.exceptions import ValidationError
 from validataclass.validators import DataclassValidator
 
@@ -64,7 +63,7 @@ class HerrenbergPullConverter(BaseConverter):
         # since there is no realtimedata this is just skipped
 
     def _get_remote_data(self) -> list[dict]:
-        response = requests.get(self._base_url, timeout=60)
+        response = self.request_helper.get(self._base_url, timeout=60)
         result_dict: dict = response.json()
 
         items: list[dict] = []
@@ -6,7 +6,6 @@ Use of this source code is governed by an MIT-style license that can be found in
 from abc import ABC
 from pathlib import Path
 
-import requests
 from validataclass.exceptions import ValidationError
 from validataclass.validators import DataclassValidator
 
@@ -22,12 +21,15 @@ class KarlsruheBasePullConverter(PullConverter, ABC):
     karlsruhe_feature_validator: DataclassValidator
 
     def _get_feature_inputs(self) -> tuple[list[KarlsruheFeatureInput], list[ImportParkingSiteException]]:
+        return self._get_cached_inputs_and_exceptions((self.source_info.source_url,), self._load_feature_inputs)
+
+    def _load_feature_inputs(self) -> tuple[list[KarlsruheFeatureInput], list[ImportParkingSiteException]]:
         feature_inputs: list[KarlsruheFeatureInput] = []
         import_parking_site_exceptions: list[ImportParkingSiteException] = []
 
         # Karlsruhes http-server config misses the intermediate cert GeoTrust TLS RSA CA G1, so we add it here manually.
         ca_path = Path(Path(__file__).parent, 'files', 'ca.crt.pem')
-        response = requests.get(self.source_info.source_url, verify=str(ca_path), timeout=30)
+        response = self.request_helper.get(self.source_info.source_url, verify=str(ca_path), timeout=30)
         response_data = response.json()
 
         try:
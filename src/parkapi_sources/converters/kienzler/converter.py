@@ -3,7 +3,6 @@ Copyright 2024 binary butterfly GmbH
 Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
 """
 
-import requests
 from validataclass.exceptions import ValidationError
 from validataclass.validators import AnythingValidator, DataclassValidator, ListValidator
 
@@ -15,6 +14,7 @@ from .models import KienzlerInput
 
 
 class KienzlerPullConverter(PullConverter):
+    _base_url = 'https://www.bikeandridebox.de/index.php?eID=JSONAPI'
     kienzler_list_validator = ListValidator(AnythingValidator(allowed_types=[dict]))
     kienzler_item_validator = DataclassValidator(KienzlerInput)
 
@@ -45,6 +45,18 @@ class KienzlerPullConverter(PullConverter):
         return realtime_parking_site_inputs, static_parking_site_errors
 
     def _get_kienzler_parking_sites(self) -> tuple[list[KienzlerInput], list[ImportParkingSiteException]]:
+        return self._get_cached_inputs_and_exceptions(
+            # The key contains all request parameters, so other credentials never get the data loaded for this one
+            (
+                self._base_url,
+                self.config_helper.get('PARK_API_KIENZLER_USER'),
+                self.config_helper.get('PARK_API_KIENZLER_PASSWORD'),
+                self.config_helper.get('PARK_API_KIENZLER_IDS'),
+            ),
+            self._load_kienzler_parking_sites,
+        )
+
+    def _load_kienzler_parking_sites(self) -> tuple[list[KienzlerInput], list[ImportParkingSiteException]]:
         kienzler_item_inputs: list[KienzlerInput] = []
         errors: list[ImportParkingSiteException] = []
 
@@ -63,8 +75,8 @@ class KienzlerPullConverter(PullConverter):
         return kienzler_item_inputs, errors
 
     def _request(self) -> list[dict]:
-        response = requests.post(
-            url='https://www.bikeandridebox.de/index.php?eID=JSONAPI',
+        response = self.request_helper.post(
+            url=self._base_url,
             json={
                 'user': self.config_helper.get('PARK_API_KIENZLER_USER'),
                 'password': self.config_helper.get('PARK_API_KIENZLER_PASSWORD'),
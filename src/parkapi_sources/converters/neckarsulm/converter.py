@@ -3,6 +3,8 @@ Copyright 2024 binary butterfly GmbH
 Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
 """
 
+from typing import Iterable, Iterator
+
 from validataclass.exceptions import ValidationError
 from validataclass.validators import DataclassValidator
 
@@ -41,30 +43,16 @@ class NeckarsulmPushConverter(CsvConverter):
         'maxhoehe': 'max_height',
     }
 
-    def handle_csv(self, data: list[list]) -> tuple[list[StaticParkingSiteInput], list[ImportParkingSiteException]]:
-        static_parking_site_inputs: list[StaticParkingSiteInput] = []
-        static_parking_site_errors: list[ImportParkingSiteException] = []
-
-        mapping: dict[str, int] = self.get_mapping_by_header(self.header_mapping, data[0])
-
-        # We start at row 2, as the first one is our header
-        for row in data[1:]:
-            input_dict: dict[str, str] = {}
-            for field in self.header_mapping.values():
-                input_dict[field] = row[mapping[field]]
-
+    def iter_csv(self, data: Iterable[list]) -> Iterator[StaticParkingSiteInput | ImportParkingSiteException]:
+        for input_dict in self.iter_csv_dicts(data):
             try:
                 input_data: NeckarsulmRowInput = self.neckarsulm_row_validator.validate(input_dict)
             except ValidationError as e:
-                static_parking_site_errors.append(
-                    ImportParkingSiteException(
-                        source_uid=self.source_info.uid,
-                        parking_site_uid=input_dict.get('id'),
-                        message=f'validation error for {input_dict}: {e.to_dict()}',
-                    ),
+                yield ImportParkingSiteException(
+                    source_uid=self.source_info.uid,
+                    parking_site_uid=input_dict.get('id'),
+                    message=f'validation error for {input_dict}: {e.to_dict()}',
                 )
                 continue
 
-            static_parking_site_inputs.append(input_data.to_static_parking_site_input())
-
-        return static_parking_site_inputs, static_parking_site_errors
+            yield input_data.to_static_parking_site_input()
@@ -3,9 +3,9 @@ Copyright 2024 binary butterfly GmbH
 Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
 """
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional
 
-import requests
 from validataclass.exceptions import ValidationError
 from validataclass.validators import DataclassValidator
 
@@ -20,6 +20,9 @@ from .validation import PbwCityInput, PbwParkingSiteDetailInput, PbwParkingSiteI
 class PbwPullConverter(PullConverter):
     _base_url = 'https://www.mypbw.de/api/'
     required_config_keys = ['PARK_API_PBW_API_KEY']
+    # PBW needs one request per city, so we run these requests concurrently with a limited amount of workers, which can be set by
+    # PARK_API_PBW_CITY_WORKERS
+    default_city_workers: int = 4
 
     mapper = PbwMapper()
 
@@ -40,9 +43,10 @@ class PbwPullConverter(PullConverter):
         static_parking_site_inputs: list[StaticParkingSiteInput] = []
         static_parking_site_errors: list[ImportParkingSiteException] = []
 
+        city_inputs: list[PbwCityInput] = []
         for city_dict in city_dicts:
             try:
-                city_input: PbwCityInput = self.city_validator.validate(city_dict)
+                city_inputs.append(self.city_validator.validate(city_dict))
             except ValidationError as e:
                 static_parking_site_errors.append(
                     ImportParkingSiteException(
@@ -51,28 +55,45 @@ class PbwPullConverter(PullConverter):
                         message=f'validation error: {e.to_dict()}',
                     ),
                 )
-                continue
 
-            parking_site_detail_dicts = self._get_remote_data('object-by-city', city_input.id)
+        city_workers = int(self.config_helper.get('PARK_API_PBW_CITY_WORKERS', self.default_city_workers))
+        with ThreadPoolExecutor(max_workers=city_workers) as executor:
+            city_futures: list[tuple[PbwCityInput, Future]] = [
+                (city_input, executor.submit(self._get_remote_data, 'object-by-city', city_input.id)) for city_input in city_inputs
+            ]
 
-            for parking_site_detail_dict in parking_site_detail_dicts:
+            # We iterate in city order, so the result order does not depend on response times
+            for city_input, city_future in city_futures:
                 try:
-                    parking_site_detail_input: PbwParkingSiteDetailInput = self.parking_site_detail_validator.validate(
-                        parking_site_detail_dict
-                    )
-                except ValidationError as e:
+                    parking_site_detail_dicts: list[dict] = city_future.result()
+                except Exception as e:
                     static_parking_site_errors.append(
                         ImportParkingSiteException(
                             source_uid=self.source_info.uid,
                             parking_site_uid=str(city_input.id),
-                            message=f'validation error at data {parking_site_detail_dict}: {e.to_dict()}',
+                            message=f'request error for city {city_input.id}: {e}',
                         ),
                     )
                     continue
 
-                static_parking_site_inputs.append(
-                    self.mapper.map_static_parking_site(parking_site_detail_input),
-                )
+                for parking_site_detail_dict in parking_site_detail_dicts:
+                    try:
+                        parking_site_detail_input: PbwParkingSiteDetailInput = self.parking_site_detail_validator.validate(
+                            parking_site_detail_dict
+                        )
+                    except ValidationError as e:
+                        static_parking_site_errors.append(
+                            ImportParkingSiteException(
+                                source_uid=self.source_info.uid,
+                                parking_site_uid=str(city_input.id),
+                                message=f'validation error at data {parking_site_detail_dict}: {e.to_dict()}',
+                            ),
+                        )
+                        continue
+
+                    static_parking_site_inputs.append(
+                        self.mapper.map_static_parking_site(parking_site_detail_input),
+                    )
 
         return static_parking_site_inputs, static_parking_site_errors
 
@@ -106,7 +127,7 @@ class PbwPullConverter(PullConverter):
         if data_id is not None:
             parameters['id'] = data_id
 
-        response = requests.get(self._base_url, params=parameters, timeout=60)
+        response = self.request_helper.get(self._base_url, params=parameters, timeout=60)
         result_dict: dict = response.json()
 
         items: list[dict] = []
@@ -6,13 +6,13 @@ Use of this source code is governed by an MIT-style license that can be found in
 from datetime import datetime, timezone
 from typing import Any
 
-from openpyxl.cell import Cell
 from openpyxl.workbook.workbook import Workbook
 from validataclass.exceptions import ValidationError
 
 from parkapi_sources.converters.base_converter.push import XlsxConverter
 from parkapi_sources.exceptions import ImportParkingSiteException
 from parkapi_sources.models import SourceInfo, StaticParkingSiteInput
+from parkapi_sources.util import RowMapper
 
 
 class PumBwPushConverter(XlsxConverter):
@@ -37,15 +37,15 @@ class PumBwPushConverter(XlsxConverter):
         static_parking_site_inputs: list[StaticParkingSiteInput] = []
         static_parking_site_errors: list[ImportParkingSiteException] = []
 
-        worksheet = workbook.active
-        mapping: dict[str, int] = self.get_mapping_by_header(next(worksheet.rows))
+        rows = self.iter_rows(workbook.active)
+        # The first row is our header
+        row_mapper = RowMapper(self.get_mapping_by_header(next(rows)))
 
-        # We start at row 2, as the first one is our header
-        for row in worksheet.iter_rows(min_row=2):
+        for row in rows:
             # ignore empty lines as LibreOffice sometimes adds empty rows at the end of a file
-            if row[0].value is None:
+            if row[0] is None:
                 continue
-            parking_site_dict = self.map_row_to_parking_site_dict(mapping, row)
+            parking_site_dict = self.map_row_to_parking_site_dict(row_mapper, row)
 
             try:
                 static_parking_site_inputs.append(self.static_parking_site_validator.validate(parking_site_dict))
@@ -61,10 +61,8 @@ class PumBwPushConverter(XlsxConverter):
         return static_parking_site_inputs, static_parking_site_errors
 
     @staticmethod
-    def map_row_to_parking_site_dict(mapping: dict[str, int], row: list[Cell]) -> dict[str, Any]:
-        parking_site_dict: dict[str, Any] = {}
-        for field in mapping.keys():
-            parking_site_dict[field] = row[mapping[field]].value
+    def map_row_to_parking_site_dict(row_mapper: RowMapper, row: tuple[Any, ...]) -> dict[str, Any]:
+        parking_site_dict: dict[str, Any] = row_mapper.map(row)
 
         parking_site_dict['uid'] = f"{parking_site_dict['uid']}-{parking_site_dict['name']}"
         parking_site_dict['name'] = f"{parking_site_dict['street']} {parking_site_dict['name']}"
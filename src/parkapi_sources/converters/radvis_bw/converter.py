@@ -4,9 +4,8 @@ Use of this source code is governed by an MIT-style license that can be found in
 """
 
 from datetime import datetime, timezone
+from decimal import Decimal
 
-import pyproj
-import requests
 from validataclass.exceptions import ValidationError
 from validataclass.validators import DataclassValidator
 
@@ -14,12 +13,12 @@ from parkapi_sources.converters.base_converter.pull import GeojsonInput, PullCon
 from parkapi_sources.exceptions import ImportParkingSiteException
 from parkapi_sources.models import RealtimeParkingSiteInput, SourceInfo, StaticParkingSiteInput
 from parkapi_sources.models.enums import PurposeType
+from parkapi_sources.util.projection import UTM_32N_CRS, WGS84_LON_LAT_CRS, transform_coordinates
 
 from .models import RadvisFeatureInput
 
 
 class RadvisBwPullConverter(PullConverter):
-    proj: pyproj.Proj = pyproj.Proj(proj='utm', zone=32, ellps='WGS84', preserve_units=True)
     _base_url = (
         'https://radvis.landbw.de/api/geoserver/basicauth/radvis/wfs?service=WFS&version=2.0.0&request='
         'GetFeature&typeNames=radvis%3Aabstellanlage&outputFormat=application/json'
@@ -45,6 +44,7 @@ class RadvisBwPullConverter(PullConverter):
         if self.config_helper.get('PARK_API_RADVIS_IGNORE_SOURCES'):
             sources_to_ignore = self.config_helper.get('PARK_API_RADVIS_IGNORE_SOURCES')
 
+        static_data_updated_at = datetime.now(tz=timezone.utc)
         for feature_dict in parking_site_features.features:
             try:
                 radvis_parking_site_input = self.radvis_parking_site_validator.validate(feature_dict)
@@ -53,10 +53,7 @@ class RadvisBwPullConverter(PullConverter):
                 if radvis_parking_site_input.properties.quell_system in sources_to_ignore:
                     continue
 
-                radvis_parking_site = radvis_parking_site_input.to_static_parking_site_input_with_proj(
-                    static_data_updated_at=datetime.now(tz=timezone.utc),
-                    proj=self.proj,
-                )
+                radvis_parking_site = radvis_parking_site_input.to_static_parking_site_input(static_data_updated_at=static_data_updated_at)
 
                 radvis_parking_site.purpose = PurposeType.BIKE
                 static_parking_site_inputs.append(radvis_parking_site)
@@ -70,13 +67,26 @@ class RadvisBwPullConverter(PullConverter):
                     ),
                 )
 
+        # RadVIS has lots of features, so transforming all coordinates at once saves a lot of pyproj overhead
+        coordinates = transform_coordinates(
+            UTM_32N_CRS,
+            WGS84_LON_LAT_CRS,
+            [
+                (float(static_parking_site_input.lon), float(static_parking_site_input.lat))
+                for static_parking_site_input in static_parking_site_inputs
+            ],
+        )
+        for static_parking_site_input, (lon, lat) in zip(static_parking_site_inputs, coordinates, strict=True):
+            static_parking_site_input.lon = Decimal(lon).quantize(Decimal('1.0000000'))
+            static_parking_site_input.lat = Decimal(lat).quantize(Decimal('1.0000000'))
+
         return static_parking_site_inputs, static_parking_site_errors
 
     def get_realtime_parking_sites(self) -> tuple[list[RealtimeParkingSiteInput], list[ImportParkingSiteException]]:
         return [], []
 
     def get_data(self) -> dict:
-        response = requests.get(
+        response = self.request_helper.get(
             self._base_url,
             auth=(self.config_helper.get('PARK_API_RADVIS_USER'), self.config_helper.get('PARK_API_RADVIS_PASSWORD')),
             timeout=30,
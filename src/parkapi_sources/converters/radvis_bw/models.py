@@ -3,17 +3,13 @@ Copyright 2024 binary butterfly GmbH
 Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
 """
 
-from datetime import datetime
-from decimal import Decimal
 from enum import Enum
 from typing import Optional
 
-import pyproj
 from validataclass.dataclasses import Default, validataclass
 from validataclass.validators import BooleanValidator, DataclassValidator, EnumValidator, IntegerValidator, Noneable, StringValidator
 
 from parkapi_sources.converters.base_converter.pull.static_geojson_data_mixin.models import GeojsonFeatureInput
-from parkapi_sources.models import StaticParkingSiteInput
 from parkapi_sources.models.enums import ParkingSiteType, SupervisionType
 from parkapi_sources.validators import ExcelNoneable
 
@@ -130,12 +126,3 @@ class RadvisFeaturePropertiesInput:
 @validataclass
 class RadvisFeatureInput(GeojsonFeatureInput):
     properties: RadvisFeaturePropertiesInput = DataclassValidator(RadvisFeaturePropertiesInput)
-
-    def to_static_parking_site_input_with_proj(self, static_data_updated_at: datetime, proj: pyproj.Proj) -> StaticParkingSiteInput:
-        result = self.to_static_parking_site_input(static_data_updated_at)
-
-        coordinates = proj(float(result.lon), float(result.lat), inverse=True)
-        result.lon = Decimal(coordinates[0]).quantize(Decimal('1.0000000'))
-        result.lat = Decimal(coordinates[1]).quantize(Decimal('1.0000000'))
-
-        return result
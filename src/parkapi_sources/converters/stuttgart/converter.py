@@ -3,18 +3,20 @@ Copyright 2023 binary butterfly GmbH
 Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
 """
 
-import pyproj
-from lxml.etree import Element
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, Optional
+
+from lxml.etree import Element, QName
 from validataclass.exceptions import ValidationError
 
 from parkapi_sources.converters.base_converter.push import XmlConverter
 from parkapi_sources.exceptions import ImportParkingSiteException
 from parkapi_sources.models import RealtimeParkingSiteInput, SourceInfo, StaticParkingSiteInput
+from parkapi_sources.util import XMLToDictConverter
+from parkapi_sources.util.projection import UTM_32N_CRS, WGS84_LON_LAT_CRS, transform_coordinates
 
 
 class StuttgartPushConverter(XmlConverter):
-    proj: pyproj.Proj = pyproj.Proj(proj='utm', zone=32, ellps='WGS84', preserve_units=True)
-
     source_info = SourceInfo(
         uid='stuttgart',
         name='Stadt Stuttgart',
@@ -24,60 +26,99 @@ class StuttgartPushConverter(XmlConverter):
         has_realtime_data=True,
     )
 
+    # DATEX II records: static parking facilities and realtime parking facility states, as (parent tag, tag)
+    record_element_paths: list[tuple[str, str]] = [
+        ('parkingFacilityTable', 'parkingFacility'),
+        ('parkingFacilityTableStatusPublication', 'parkingFacilityStatus'),
+    ]
+    xml_to_dict_converter: XMLToDictConverter = XMLToDictConverter(
+        conditional_remote_type_tags=[
+            ('values', 'value'),
+            ('periodName', 'values'),
+            ('parkingFacilityName', 'values'),
+            ('openingTimes', 'period'),
+        ],
+    )
+
     def handle_xml(self, root: Element) -> tuple[list[StaticParkingSiteInput | RealtimeParkingSiteInput], list[ImportParkingSiteException]]:
-        data = self.xml_helper.xml_to_dict(
-            root,
-            conditional_remote_type_tags=[
-                ('values', 'value'),
-                ('periodName', 'values'),
-                ('parkingFacilityName', 'values'),
-                ('openingTimes', 'period'),
-            ],
-            ensure_array_keys=['parkingFacility', 'parkingFacilityStatus'],
+        # The whole tree is parsed already, so coordinates of all static records are transformed at once, as pyproj calls are expensive
+        return self.split_results(
+            self._iter_record_results(self.xml_helper.iter_elements(root, self.record_element_paths), static_batch_size=None),
         )
-        items_base = data.get('d2LogicalModel', {}).get('payloadPublication', {}).get('genericPublicationExtension', {})
-        if items_base.get('parkingFacilityTablePublication'):
-            static_parking_site_inputs: list[StaticParkingSiteInput] = []
-            static_parking_site_errors: list[ImportParkingSiteException] = []
-
-            static_items = items_base.get('parkingFacilityTablePublication', {}).get('parkingFacilityTable', {}).get('parkingFacility', [])
-
-            for static_item in static_items:
-                try:
-                    static_parking_site_inputs.append(self._handle_static_item(static_item))
-                except ValidationError as e:
-                    static_parking_site_errors.append(
-                        ImportParkingSiteException(
-                            source_uid=self.source_info.uid,
-                            parking_site_uid=static_item.get('id'),
-                            message=str(e.to_dict()),
-                        )
-                    )
-
-            return static_parking_site_inputs, static_parking_site_errors
-
-        if items_base.get('parkingFacilityTableStatusPublication'):
-            realtime_items = items_base.get('parkingFacilityTableStatusPublication', {}).get('parkingFacilityStatus', {})
-            realtime_parking_site_inputs: list[RealtimeParkingSiteInput] = []
-            realtime_parking_site_errors: list[ImportParkingSiteException] = []
-
-            for realtime_item in realtime_items:
-                try:
-                    realtime_parking_site_inputs.append(self._handle_realtime_item(realtime_item))
-                except ValidationError as e:
-                    realtime_parking_site_errors.append(
-                        ImportParkingSiteException(
-                            source_uid=self.source_info.uid,
-                            parking_site_uid=realtime_item.get('id'),
-                            message=str(e.to_dict()),
-                        ),
-                    )
-
-            return realtime_parking_site_inputs, realtime_parking_site_errors
-
-        return [], []
-
-    def _handle_static_item(self, item: dict) -> StaticParkingSiteInput:
+
+    def handle_xml_file(
+        self,
+        source: bytes | str | Path | BinaryIO,
+    ) -> tuple[list[StaticParkingSiteInput | RealtimeParkingSiteInput], list[ImportParkingSiteException]]:
+        """
+        Like handle_xml(), but parses the DATEX II publication record by record instead of building the whole tree first. The results
+        are still collected into lists, use iter_xml_stream() to process them while parsing.
+        """
+        return self.split_results(self.iter_xml_stream(source))
+
+    def iter_xml_stream(
+        self,
+        source: bytes | str | Path | BinaryIO,
+    ) -> Iterator[StaticParkingSiteInput | RealtimeParkingSiteInput | ImportParkingSiteException]:
+        """
+        Streaming entry point: parses the DATEX II publication from bytes, a path or a binary file object and yields the parking site
+        input or import exception of each record as soon as the record is parsed. Each record is converted, validated and removed from
+        the parsed tree before the next one is read, so the first result is available right away and memory usage stays flat for large
+        publications.
+        """
+        yield from self._iter_record_results(
+            self.xml_helper.iterparse_elements(self.get_xml_source(source), self.record_element_paths),
+            static_batch_size=1,
+        )
+
+    def _iter_record_results(
+        self,
+        record_elements: Iterable[Element],
+        static_batch_size: Optional[int],
+    ) -> Iterator[StaticParkingSiteInput | RealtimeParkingSiteInput | ImportParkingSiteException]:
+        """
+        Converts records and validates static records in batches of static_batch_size, or all at once with None, as their coordinates
+        are transformed for a whole batch.
+        """
+        static_batch: list[tuple[dict, dict]] = []
+        for record_element in record_elements:
+            tag_name = QName(record_element).localname
+            item = self.xml_to_dict_converter.convert(record_element)[tag_name]
+
+            if tag_name == 'parkingFacilityStatus':
+                yield self._handle_realtime_item(item)
+                continue
+
+            static_batch.append((item, self._map_static_item(item)))
+            if static_batch_size is not None and len(static_batch) >= static_batch_size:
+                yield from self._validate_static_batch(static_batch)
+                static_batch = []
+
+        yield from self._validate_static_batch(static_batch)
+
+    def _validate_static_batch(
+        self, static_batch: list[tuple[dict, dict]]
+    ) -> Iterator[StaticParkingSiteInput | ImportParkingSiteException]:
+        # Coordinates of all items are transformed at once, as single pyproj calls are expensive
+        coordinates = transform_coordinates(
+            UTM_32N_CRS,
+            WGS84_LON_LAT_CRS,
+            [(static_input_dict['lon'], static_input_dict['lat']) for _, static_input_dict in static_batch],
+        )
+
+        for (static_item, static_input_dict), (lon, lat) in zip(static_batch, coordinates, strict=True):
+            static_input_dict['lat'] = lat
+            static_input_dict['lon'] = lon
+            try:
+                yield self.static_parking_site_validator.validate(static_input_dict)
+            except ValidationError as e:
+                yield ImportParkingSiteException(
+                    source_uid=self.source_info.uid,
+                    parking_site_uid=static_item.get('id'),
+                    message=str(e.to_dict()),
+                )
+
+    def _map_static_item(self, item: dict) -> dict:
         input_data = {
             'uid': item.get('id'),
             'name': item.get('parkingFacilityName'),
@@ -86,11 +127,10 @@ class StuttgartPushConverter(XmlConverter):
             'static_data_updated_at': item.get('parkingFacilityRecordVersionTime'),
         }
 
-        # Coordinates
+        # Coordinates are UTM, they get transformed for all items at once later
         coordinates_base = item.get('facilityLocation', {}).get('locationForDisplay', {})
-        coordinates = self.proj(float(coordinates_base.get('longitude')), float(coordinates_base.get('latitude')), inverse=True)
-        input_data['lat'] = coordinates[1]
-        input_data['lon'] = coordinates[0]
+        input_data['lat'] = float(coordinates_base.get('latitude'))
+        input_data['lon'] = float(coordinates_base.get('longitude'))
 
         # max_height
         height_base = item.get('characteristicsOfPermittedVehicles', {}).get('heightCharacteristic', {})
@@ -114,9 +154,9 @@ class StuttgartPushConverter(XmlConverter):
 
         # TODO: parse opening times with more information, for now they are broken
 
-        return self.static_parking_site_validator.validate(input_data)
+        return input_data
 
-    def _handle_realtime_item(self, item: dict) -> RealtimeParkingSiteInput:
+    def _handle_realtime_item(self, item: dict) -> RealtimeParkingSiteInput | ImportParkingSiteException:
         input_data = {
             'uid': item.get('parkingFacilityReference', {}).get('id'),
             'realtime_capacity': int(item.get('totalNumberOfVacantParkingSpaces', 0)),
@@ -129,4 +169,11 @@ class StuttgartPushConverter(XmlConverter):
         elif 'closed' in status_list:
             input_data['realtime_opening_status'] = 'closed'
 
-        return self.realtime_parking_site_validator.validate(input_data)
+        try:
+            return self.realtime_parking_site_validator.validate(input_data)
+        except ValidationError as e:
+            return ImportParkingSiteException(
+                source_uid=self.source_info.uid,
+                parking_site_uid=item.get('id'),
+                message=str(e.to_dict()),
+            )
@@ -6,16 +6,13 @@ Use of this source code is governed by an MIT-style license that can be found in
 from datetime import datetime, timezone
 from typing import Any
 
-import pyproj
-from openpyxl.cell import Cell
-
 from parkapi_sources.converters.base_converter.push import NormalizedXlsxConverter
 from parkapi_sources.models import SourceInfo
+from parkapi_sources.util import RowMapper
+from parkapi_sources.util.projection import UTM_32N_CRS, WGS84_LON_LAT_CRS, transform_coordinates
 
 
 class VrsParkAndRidePushConverter(NormalizedXlsxConverter):
-    proj: pyproj.Proj = pyproj.Proj(proj='utm', zone=32, ellps='WGS84', preserve_units=True)
-
     source_info = SourceInfo(
         uid='vrs-p-r',
         name='Verband Region Stuttgart: Park and Ride',
@@ -41,14 +38,22 @@ class VrsParkAndRidePushConverter(NormalizedXlsxConverter):
         # Other opening times are there, but not parsable
     }
 
-    def map_row_to_parking_site_dict(self, mapping: dict[str, int], row: list[Cell]) -> dict[str, Any]:
-        parking_site_dict: dict[str, str] = {}
-        for field in mapping.keys():
-            parking_site_dict[field] = row[mapping[field]].value
-
-        coordinates = self.proj(float(parking_site_dict.get('lon_utm')), float(parking_site_dict.get('lat_utm')), inverse=True)
-        parking_site_dict['lat'] = coordinates[1]
-        parking_site_dict['lon'] = coordinates[0]
+    def map_parking_site_dicts(self, parking_site_dicts: list[dict[str, Any]]):
+        # Coordinates of all rows are transformed at once, as single pyproj calls are expensive
+        coordinates = transform_coordinates(
+            UTM_32N_CRS,
+            WGS84_LON_LAT_CRS,
+            [
+                (float(parking_site_dict.get('lon_utm')), float(parking_site_dict.get('lat_utm')))
+                for parking_site_dict in parking_site_dicts
+            ],
+        )
+        for parking_site_dict, (lon, lat) in zip(parking_site_dicts, coordinates, strict=True):
+            parking_site_dict['lat'] = lat
+            parking_site_dict['lon'] = lon
+
+    def map_row_to_parking_site_dict(self, row_mapper: RowMapper, row: tuple[Any, ...]) -> dict[str, Any]:
+        parking_site_dict: dict[str, str] = row_mapper.map(row)
 
         parking_site_dict['type'] = self.type_mapping.get(parking_site_dict.get('type'))
         parking_site_dict['static_data_updated_at'] = datetime.now(tz=timezone.utc).isoformat()
@@ -3,6 +3,7 @@ Copyright 2024 binary butterfly GmbH
 Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
 """
 
+from .compact_parking_site_inputs import CompactParkingSiteInput, CompactRealtimeParkingSiteInput, CompactStaticParkingSiteInput
 from .parking_site_inputs import RealtimeParkingSiteInput, StaticParkingSiteInput
 from .source_info import SourceInfo
 from .xlsx_inputs import ExcelOpeningTimeInput, ExcelStaticParkingSiteInput
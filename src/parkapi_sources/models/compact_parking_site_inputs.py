@@ -0,0 +1,97 @@
+"""
+Copyright 2024 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+import sys
+from dataclasses import asdict, fields, is_dataclass
+from typing import Any, ClassVar, Optional, TypeVar
+
+from validataclass.helpers import UnsetValue
+
+from .enums import SupervisionType
+from .parking_site_inputs import BaseParkingSiteInput, RealtimeParkingSiteInput, StaticParkingSiteInput
+
+T_CompactInput = TypeVar('T_CompactInput', bound='CompactParkingSiteInput')
+
+
+class CompactParkingSiteInput:
+    """
+    Base of the compact variants of validated parking site inputs, for keeping many results in memory. Compact inputs are plain classes
+    with one slot per field of their input_class and without a __dict__ per instance, so they are not validataclasses: create them from
+    validated inputs with from_input(), and get the validated input back with to_input().
+
+    String values of interned_fields are interned, so values which are the same for many parking sites, like the operator, are stored
+    just once. Enum members are singletons anyway, so they are never stored twice.
+    """
+
+    __slots__ = ()
+
+    input_class: ClassVar[type[BaseParkingSiteInput]]
+    interned_fields: ClassVar[frozenset[str]] = frozenset()
+
+    def __init__(self, **kwargs: Any):
+        for field_name in self.__slots__:
+            value = kwargs.get(field_name, UnsetValue)
+            if type(value) is str and field_name in self.interned_fields:
+                value = sys.intern(value)
+            object.__setattr__(self, field_name, value)
+
+    @classmethod
+    def from_input(cls: type[T_CompactInput], parking_site_input: BaseParkingSiteInput) -> T_CompactInput:
+        return cls(**{field_name: getattr(parking_site_input, field_name) for field_name in cls.__slots__})
+
+    def to_input(self) -> BaseParkingSiteInput:
+        # Unset fields are left out, so they get their defaults like at validation
+        return self.input_class(
+            **{field_name: getattr(self, field_name) for field_name in self.__slots__ if getattr(self, field_name) is not UnsetValue},
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Returns the same dict as to_dict() of the validated input: unset fields are left out, nested dataclasses become dicts and
+        lists are copied.
+        """
+        result: dict[str, Any] = {}
+        for field_name in self.__slots__:
+            value = getattr(self, field_name)
+            if value is UnsetValue:
+                continue
+            result[field_name] = self._copy_value(value)
+        return result
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, field_name) == getattr(other, field_name) for field_name in self.__slots__)
+
+    def __repr__(self) -> str:
+        values = ', '.join(f'{field_name}={getattr(self, field_name)!r}' for field_name in self.__slots__)
+        return f'{type(self).__name__}({values})'
+
+    @classmethod
+    def _copy_value(cls, value: Any) -> Any:
+        if isinstance(value, list):
+            return [cls._copy_value(item) for item in value]
+        if is_dataclass(value) and not isinstance(value, type):
+            return asdict(value)
+        return value
+
+
+class CompactStaticParkingSiteInput(CompactParkingSiteInput):
+    __slots__ = tuple(field.name for field in fields(StaticParkingSiteInput))
+
+    input_class = StaticParkingSiteInput
+    interned_fields = frozenset({'operator_name', 'description', 'fee_description', 'opening_hours', 'related_location'})
+
+    @property
+    def is_supervised(self) -> Optional[bool]:
+        if self.supervision_type is None:
+            return None
+        return self.supervision_type in [SupervisionType.YES, SupervisionType.VIDEO, SupervisionType.ATTENDED]
+
+
+class CompactRealtimeParkingSiteInput(CompactParkingSiteInput):
+    __slots__ = tuple(field.name for field in fields(RealtimeParkingSiteInput))
+
+    input_class = RealtimeParkingSiteInput
@@ -0,0 +1,238 @@
+"""
+Copyright 2024 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from threading import Lock
+from typing import Callable, Iterator, Optional
+
+from .converters.base_converter.pull import PullConverter
+from .models import RealtimeParkingSiteInput, SourceInfo, StaticParkingSiteInput
+from .parkapi_sources import ParkAPISources
+from .util import ConfigHelper, ParkingSiteSerializer, ParkingSiteStore, PollScheduler, RealtimeChangeDetector, StaticFingerprintStore
+
+logger = logging.getLogger(__name__)
+
+STATIC_POLL = 'static'
+REALTIME_POLL = 'realtime'
+
+SourceResults = dict[str, list[Optional[StaticParkingSiteInput | RealtimeParkingSiteInput]]]
+
+
+def iter_parking_site_dicts(source_results: SourceResults, serializer: ParkingSiteSerializer) -> Iterator[dict]:
+    """
+    Yields one dict per parking site, with its static data updated by its realtime data.
+    """
+    for static_parking_site_input, realtime_parking_site_input in source_results.values():
+        parking_site_dict = serializer.to_dict(static_parking_site_input)
+
+        if realtime_parking_site_input is not None:
+            parking_site_dict.update(serializer.to_dict(realtime_parking_site_input))
+
+        yield parking_site_dict
+
+
+class ParkAPIPoller:
+    """
+    Polls all pull converters of a ParkAPISources instance in one long-running process, so converters, imports and HTTP connections are
+    kept between polls. Realtime data is polled on a short interval, static data on a long one, both per source and scheduled by a
+    PollScheduler with jitter.
+
+    Results have the same format as the parkapi script uses: per parking site uid a list of the StaticParkingSiteInput and an
+    Optional[RealtimeParkingSiteInput]. After each poll, the results of the source are passed to all result handlers. Every poll creates
+    new results instead of changing the last ones, and polls of the same source are handled one after another, so handlers can keep
+    the results they get.
+
+    Realtime change handlers just get the realtime inputs which changed since the last poll of their source, as detected by a
+    RealtimeChangeDetector, plus all of them at the first poll and every heartbeat_interval seconds.
+
+    Static inputs are passed through a StaticFingerprintStore, so static_data_updated_at just moves if the content of a parking site
+    changes, and static polls without any changes are not passed to the result handlers. If PARK_API_STATIC_FINGERPRINT_PATH is set,
+    fingerprints are persisted there.
+
+    If PARK_API_PARKING_SITE_STORE_PATH is set, the latest static and realtime data of all parking sites is kept in a ParkingSiteStore
+    at this path. Static data is written if it changed, realtime data just for the parking sites which changed, and realtime data of
+    parking sites which dropped out of a realtime poll is removed.
+
+    Intervals are set in seconds by config values: PARK_API_STATIC_INTERVAL and PARK_API_REALTIME_INTERVAL for all sources, and
+    PARK_API_STATIC_INTERVAL_<SOURCE_UID> and PARK_API_REALTIME_INTERVAL_<SOURCE_UID> per source, with the source uid in upper case
+    and - replaced by _. Sources with has_realtime_data=False in their SourceInfo are not polled for realtime data.
+    """
+
+    default_static_interval: float = 6 * 60 * 60
+    default_realtime_interval: float = 5 * 60
+
+    parkapi_sources: ParkAPISources
+    workers: int
+    scheduler: PollScheduler[tuple[str, str]]
+    static_interval_by_uid: dict[str, float]
+    realtime_interval_by_uid: dict[str, float]
+    source_results_by_uid: dict[str, SourceResults]
+    result_handlers: list[Callable[[SourceInfo, SourceResults], None]]
+    realtime_change_handlers: list[Callable[[SourceInfo, list[RealtimeParkingSiteInput]], None]]
+    realtime_change_detector: RealtimeChangeDetector
+    static_fingerprint_store: StaticFingerprintStore
+    parking_site_store: Optional[ParkingSiteStore]
+    _source_locks: dict[str, Lock]
+
+    def __init__(
+        self,
+        parkapi_sources: ParkAPISources,
+        workers: int = 1,
+        jitter: float = 0.1,
+        result_handlers: Optional[list[Callable[[SourceInfo, SourceResults], None]]] = None,
+        realtime_change_handlers: Optional[list[Callable[[SourceInfo, list[RealtimeParkingSiteInput]], None]]] = None,
+        heartbeat_interval: Optional[float] = 60 * 60,
+    ):
+        if workers < 1:
+            raise ValueError('workers has to be at least 1.')
+
+        self.parkapi_sources = parkapi_sources
+        self.workers = workers
+        self.scheduler = PollScheduler(jitter=jitter)
+        self.static_interval_by_uid = {}
+        self.realtime_interval_by_uid = {}
+        self.source_results_by_uid = {}
+        self.result_handlers = [] if result_handlers is None else result_handlers
+        self.realtime_change_handlers = [] if realtime_change_handlers is None else realtime_change_handlers
+        self.realtime_change_detector = RealtimeChangeDetector(heartbeat_interval=heartbeat_interval)
+        self._source_locks = {}
+
+        config_helper = parkapi_sources.config_helper
+        static_fingerprint_path = config_helper.get('PARK_API_STATIC_FINGERPRINT_PATH')
+        self.static_fingerprint_store = StaticFingerprintStore(None if not static_fingerprint_path else Path(static_fingerprint_path))
+        parking_site_store_path = config_helper.get('PARK_API_PARKING_SITE_STORE_PATH')
+        self.parking_site_store = None if not parking_site_store_path else ParkingSiteStore(parking_site_store_path)
+
+        for source_uid, converter in parkapi_sources.converter_by_uid.items():
+            if not isinstance(converter, PullConverter):
+                continue
+
+            self.static_interval_by_uid[source_uid] = self.get_interval(config_helper, STATIC_POLL, source_uid)
+            if converter.source_info.has_realtime_data is not False:
+                self.realtime_interval_by_uid[source_uid] = self.get_interval(config_helper, REALTIME_POLL, source_uid)
+                # A snapshot must not outlive a realtime poll, else the next poll would just return the same data again
+                converter.snapshot_cache.ttl = min(converter.snapshot_cache.ttl, self.realtime_interval_by_uid[source_uid])
+            self._source_locks[source_uid] = Lock()
+
+    def get_interval(self, config_helper: ConfigHelper, poll_type: str, source_uid: str) -> float:
+        default_interval = self.default_static_interval if poll_type == STATIC_POLL else self.default_realtime_interval
+        interval_key = f'PARK_API_{poll_type.upper()}_INTERVAL'
+        source_interval_key = f'{interval_key}_{source_uid.upper().replace("-", "_")}'
+        return float(config_helper.get(source_interval_key, config_helper.get(interval_key, default_interval)))
+
+    def run(self):
+        """
+        Polls until stop() is called. Static data of all sources is polled first, spread over the jitter range of their realtime
+        interval, and realtime polls of a source start as soon as its static data is loaded. Until then, a failed static poll is retried
+        on the realtime interval instead of the static one.
+        """
+        for source_uid, static_interval in self.static_interval_by_uid.items():
+            startup_interval = self.realtime_interval_by_uid.get(source_uid, static_interval)
+            self.scheduler.add((source_uid, STATIC_POLL), static_interval, delay=self.scheduler.get_startup_delay(startup_interval))
+
+        # Leaving the executor waits for running polls, so results are complete when run() returns
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='parkapi-poll') as executor:
+            while True:
+                poll_key = self.scheduler.get_next()
+                if poll_key is None:
+                    break
+                executor.submit(self.run_poll, *poll_key)
+
+    def stop(self):
+        self.scheduler.close()
+
+    def run_poll(self, source_uid: str, poll_type: str):
+        # Errors of a poll are logged and the next poll is scheduled anyway, so a source which fails once is tried again later
+        try:
+            if poll_type == STATIC_POLL:
+                self.poll_static(source_uid)
+            else:
+                self.poll_realtime(source_uid)
+        except Exception:
+            logger.exception(f'Polling {poll_type} data of source {source_uid} failed.')
+        finally:
+            if poll_type == STATIC_POLL and source_uid not in self.source_results_by_uid:
+                # Without static data, the source has no results at all, so it's retried on the shorter realtime interval
+                retry_interval = min(self.static_interval_by_uid[source_uid], self.realtime_interval_by_uid.get(source_uid, float('inf')))
+                self.scheduler.reschedule((source_uid, poll_type), interval=retry_interval)
+            else:
+                self.scheduler.reschedule((source_uid, poll_type))
+
+    def poll_static(self, source_uid: str):
+        converter: PullConverter = self.parkapi_sources.converter_by_uid[source_uid]  # type: ignore
+        static_parking_site_inputs, static_parking_site_errors = converter.get_static_parking_sites()
+        changed_static_parking_site_inputs = self.static_fingerprint_store.update(source_uid, static_parking_site_inputs)
+        logger.info(
+            f'Polled {len(static_parking_site_inputs)} static parking sites of source {source_uid}, '
+            f'{len(changed_static_parking_site_inputs)} of them changed.',
+        )
+
+        with self._source_locks[source_uid]:
+            previous_source_results = self.source_results_by_uid.get(source_uid)
+            source_results: SourceResults = {}
+            for static_parking_site_input in static_parking_site_inputs:
+                # Realtime data is kept until the next realtime poll
+                previous_parking_site_results = (
+                    None if previous_source_results is None else previous_source_results.get(static_parking_site_input.uid)
+                )
+                source_results[static_parking_site_input.uid] = [
+                    static_parking_site_input,
+                    None if previous_parking_site_results is None else previous_parking_site_results[1],
+                ]
+            self.source_results_by_uid[source_uid] = source_results
+
+            # If no parking site changed, was added or was removed, there is nothing new for the result handlers
+            if (
+                previous_source_results is None
+                or changed_static_parking_site_inputs
+                or source_results.keys() != previous_source_results.keys()
+            ):
+                if self.parking_site_store is not None:
+                    self.parking_site_store.upsert_static_parking_sites(source_uid, static_parking_site_inputs)
+                self.handle_source_results(converter.source_info, source_results)
+
+        if previous_source_results is None and source_uid in self.realtime_interval_by_uid:
+            self.scheduler.add((source_uid, REALTIME_POLL), self.realtime_interval_by_uid[source_uid])
+
+    def poll_realtime(self, source_uid: str):
+        converter: PullConverter = self.parkapi_sources.converter_by_uid[source_uid]  # type: ignore
+        realtime_parking_site_inputs, realtime_parking_site_errors = converter.get_realtime_parking_sites()
+        logger.info(f'Polled {len(realtime_parking_site_inputs)} realtime parking sites of source {source_uid}.')
+
+        realtime_parking_site_inputs_by_uid: dict[str, RealtimeParkingSiteInput] = {
+            realtime_parking_site_input.uid: realtime_parking_site_input for realtime_parking_site_input in realtime_parking_site_inputs
+        }
+        with self._source_locks[source_uid]:
+            # Like in the parkapi script, realtime data without corresponding static data is ignored
+            source_results: SourceResults = {
+                parking_site_uid: [static_parking_site_input, realtime_parking_site_inputs_by_uid.get(parking_site_uid)]
+                for parking_site_uid, (static_parking_site_input, _) in self.source_results_by_uid[source_uid].items()
+            }
+            self.source_results_by_uid[source_uid] = source_results
+            self.handle_source_results(converter.source_info, source_results)
+
+            if self.realtime_change_handlers or self.parking_site_store is not None:
+                matched_realtime_parking_site_inputs = [
+                    realtime_parking_site_input for _, realtime_parking_site_input in source_results.values() if realtime_parking_site_input
+                ]
+                changed_realtime_parking_site_inputs = self.realtime_change_detector.filter_changed(
+                    source_uid,
+                    matched_realtime_parking_site_inputs,
+                )
+                logger.info(f'{len(changed_realtime_parking_site_inputs)} realtime parking sites of source {source_uid} changed.')
+                if self.parking_site_store is not None:
+                    self.parking_site_store.upsert_realtime_parking_sites(
+                        source_uid,
+                        changed_realtime_parking_site_inputs,
+                        current_uids=[item.uid for item in matched_realtime_parking_site_inputs],
+                    )
+                for realtime_change_handler in self.realtime_change_handlers:
+                    realtime_change_handler(converter.source_info, changed_realtime_parking_site_inputs)
+
+    def handle_source_results(self, source_info: SourceInfo, source_results: SourceResults):
+        for result_handler in self.result_handlers:
+            result_handler(source_info, source_results)
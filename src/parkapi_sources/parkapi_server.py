@@ -0,0 +1,260 @@
+"""
+Copyright 2024 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+import logging
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock
+from typing import Any, Iterable, Optional
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from .models import SourceInfo
+from .parkapi_poller import SourceResults, iter_parking_site_dicts
+from .util import ParkingSiteSerializer, ParkingSiteStore
+
+logger = logging.getLogger(__name__)
+
+
+class SourceResponses:
+    """
+    Merged parking site dicts of a source, with their serialized responses. Parking site responses are serialized at their first
+    request.
+    """
+
+    source_info: SourceInfo
+    body: bytes
+    parking_site_dicts: list[dict]
+    parking_site_dict_by_uid: dict[str, dict]
+    # Coordinates are parsed once, so bounding box queries just compare floats
+    coordinates: list[tuple[float, float]]
+    _parking_site_bodies_by_uid: dict[str, bytes]
+
+    def __init__(self, source_info: SourceInfo, parking_site_dicts: list[dict], serializer: ParkingSiteSerializer):
+        self.source_info = source_info
+        self.parking_site_dicts = parking_site_dicts
+        self.parking_site_dict_by_uid = {parking_site_dict['uid']: parking_site_dict for parking_site_dict in self.parking_site_dicts}
+        self.coordinates = [(float(item['lat']), float(item['lon'])) for item in self.parking_site_dicts]
+        # Same document as the json output of the parkapi script for this source
+        self.body = serializer.dumps({'source': source_info.to_dict(), 'parking_sites': self.parking_site_dicts}).encode()
+        self._parking_site_bodies_by_uid = {}
+
+    @classmethod
+    def from_source_results(
+        cls,
+        source_info: SourceInfo,
+        source_results: SourceResults,
+        serializer: ParkingSiteSerializer,
+    ) -> 'SourceResponses':
+        return cls(source_info, list(iter_parking_site_dicts(source_results, serializer)), serializer)
+
+    def get_parking_site_body(self, uid: str, serializer: ParkingSiteSerializer) -> Optional[bytes]:
+        body = self._parking_site_bodies_by_uid.get(uid)
+        if body is None:
+            parking_site_dict = self.parking_site_dict_by_uid.get(uid)
+            if parking_site_dict is None:
+                return None
+            body = serializer.dumps(parking_site_dict).encode()
+            self._parking_site_bodies_by_uid[uid] = body
+        return body
+
+
+class ParkAPIServer:
+    """
+    Read-only HTTP API for the latest results of all sources. Use handle_source_results() as result handler of a ParkAPIPoller, so every
+    poll of a source replaces its data. Endpoints:
+
+    - GET /sources: all sources with the number of their parking sites
+    - GET /sources/<source_uid>: the source and its parking sites, like the json output of the parkapi script
+    - GET /sources/<source_uid>/parking-sites/<uid>: a single parking site
+    - GET /parking-sites?uid=<uid>&bbox=<min_lon>,<min_lat>,<max_lon>,<max_lat>: parking sites of all sources with their source_uid,
+      like the lines of the ndjson output, filtered by uid and / or bounding box
+
+    Parking site dicts and responses are built at the first request after a result and cached until the next result of the source, so
+    polls don't serialize data nobody reads and repeated requests just send prepared bytes. With load_parking_site_store(), the last
+    stored data of sources is served until they got their first result.
+    """
+
+    serializer: ParkingSiteSerializer
+    http_server: ThreadingHTTPServer
+    _source_info_by_uid: dict[str, SourceInfo]
+    _source_results_by_uid: dict[str, tuple[SourceInfo, SourceResults]]
+    _source_responses_by_uid: dict[str, SourceResponses]
+    _sources_body: Optional[bytes]
+    _lock: Lock
+    _serving: bool
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 8000, serializer: Optional[ParkingSiteSerializer] = None):
+        self.serializer = ParkingSiteSerializer() if serializer is None else serializer
+        self._source_info_by_uid = {}
+        self._source_results_by_uid = {}
+        self._source_responses_by_uid = {}
+        self._sources_body = None
+        self._lock = Lock()
+        self._serving = False
+
+        self.http_server = ThreadingHTTPServer((host, port), ParkAPIRequestHandler)
+        self.http_server.parkapi_server = self  # type: ignore
+
+    @property
+    def server_address(self) -> tuple[str, int]:
+        return self.http_server.server_address[:2]  # type: ignore
+
+    def serve_forever(self):
+        self._serving = True
+        self.http_server.serve_forever()
+
+    def shutdown(self):
+        # shutdown() of the HTTP server waits for serve_forever() to return, so it would block if it was never started
+        if self._serving:
+            self.http_server.shutdown()
+            self._serving = False
+        self.http_server.server_close()
+
+    def handle_source_results(self, source_info: SourceInfo, source_results: SourceResults):
+        with self._lock:
+            self._source_info_by_uid[source_info.uid] = source_info
+            self._source_results_by_uid[source_info.uid] = (source_info, source_results)
+            self._source_responses_by_uid.pop(source_info.uid, None)
+            self._sources_body = None
+
+    def get_source_responses(self, source_uid: str) -> Optional[SourceResponses]:
+        with self._lock:
+            source_responses = self._source_responses_by_uid.get(source_uid)
+            source_info_and_results = self._source_results_by_uid.get(source_uid)
+        if source_responses is not None or source_info_and_results is None:
+            return source_responses
+
+        # Large sources take a while, so they are built without blocking requests for other sources
+        source_responses = SourceResponses.from_source_results(*source_info_and_results, serializer=self.serializer)
+        with self._lock:
+            # If a new result arrived in the meantime, it's built at the next request
+            if self._source_results_by_uid.get(source_uid) is source_info_and_results:
+                self._source_responses_by_uid[source_uid] = source_responses
+        return source_responses
+
+    def load_parking_site_store(self, parking_site_store: ParkingSiteStore, source_infos: Iterable[SourceInfo]):
+        """
+        Serves the stored data of the given sources until their first result, so a restarted server does not have to wait for the
+        sources to be polled again. Sources which got a result in the meantime are skipped.
+        """
+        for source_info in source_infos:
+            parking_site_dicts = parking_site_store.get_parking_sites(source_uid=source_info.uid)
+            if not parking_site_dicts:
+                continue
+            # Without source_uid, stored parking sites are the same dicts as built from results
+            for parking_site_dict in parking_site_dicts:
+                del parking_site_dict['source_uid']
+            source_responses = SourceResponses(source_info, parking_site_dicts, self.serializer)
+
+            with self._lock:
+                if source_info.uid in self._source_info_by_uid:
+                    continue
+                self._source_info_by_uid[source_info.uid] = source_info
+                self._source_responses_by_uid[source_info.uid] = source_responses
+                self._sources_body = None
+
+    def get_response(self, path: str, query: Optional[dict[str, list[str]]] = None) -> tuple[HTTPStatus, bytes]:
+        """
+        Returns status and JSON body for a request path without the query string, and the parsed query.
+        """
+        query = {} if query is None else query
+        # Splitting before unquoting allows uids with encoded slashes
+        path_parts = [unquote(path_part) for path_part in path.strip('/').split('/')]
+
+        if path_parts == ['sources']:
+            return HTTPStatus.OK, self.get_sources_body()
+
+        if len(path_parts) in (2, 4) and path_parts[0] == 'sources':
+            source_responses = self.get_source_responses(path_parts[1])
+            if source_responses is None:
+                return self.get_error_response(HTTPStatus.NOT_FOUND, f'Source {path_parts[1]} not found.')
+            if len(path_parts) == 2:
+                return HTTPStatus.OK, source_responses.body
+            if path_parts[2] == 'parking-sites':
+                body = source_responses.get_parking_site_body(path_parts[3], self.serializer)
+                if body is None:
+                    return self.get_error_response(HTTPStatus.NOT_FOUND, f'Parking site {path_parts[3]} not found.')
+                return HTTPStatus.OK, body
+
+        if path_parts == ['parking-sites']:
+            bbox: Optional[tuple[float, ...]] = None
+            if 'bbox' in query:
+                try:
+                    bbox = tuple(float(value) for value in query['bbox'][0].split(','))
+                except ValueError:
+                    bbox = None
+                if bbox is None or len(bbox) != 4:
+                    return self.get_error_response(HTTPStatus.BAD_REQUEST, 'bbox has to be min_lon,min_lat,max_lon,max_lat.')
+            uid = query['uid'][0] if 'uid' in query else None
+            return HTTPStatus.OK, self.serializer.dumps(self.get_parking_site_dicts(uid=uid, bbox=bbox)).encode()  # type: ignore
+
+        return self.get_error_response(HTTPStatus.NOT_FOUND, 'Not found.')
+
+    def get_sources_body(self) -> bytes:
+        with self._lock:
+            if self._sources_body is None:
+                self._sources_body = self.serializer.dumps(
+                    [
+                        {**source_info.to_dict(), 'parking_site_count': self._get_parking_site_count(source_uid)}
+                        for source_uid, source_info in self._source_info_by_uid.items()
+                    ],
+                ).encode()
+            return self._sources_body
+
+    def get_parking_site_dicts(
+        self,
+        uid: Optional[str] = None,
+        bbox: Optional[tuple[float, float, float, float]] = None,
+    ) -> list[dict]:
+        with self._lock:
+            source_uids = list(self._source_info_by_uid.keys())
+
+        parking_site_dicts: list[dict] = []
+        for source_uid in source_uids:
+            source_responses = self.get_source_responses(source_uid)
+            if source_responses is None:
+                continue
+
+            if uid is not None:
+                parking_site_dict = source_responses.parking_site_dict_by_uid.get(uid)
+                candidates: list[tuple[dict, tuple[float, float]]] = []
+                if parking_site_dict is not None:
+                    candidates.append((parking_site_dict, (float(parking_site_dict['lat']), float(parking_site_dict['lon']))))
+            else:
+                candidates = list(zip(source_responses.parking_site_dicts, source_responses.coordinates, strict=True))
+
+            for parking_site_dict, (lat, lon) in candidates:
+                if bbox is not None and not (bbox[0] <= lon <= bbox[2] and bbox[1] <= lat <= bbox[3]):
+                    continue
+                parking_site_dicts.append({**parking_site_dict, 'source_uid': source_uid})
+        return parking_site_dicts
+
+    def get_error_response(self, status: HTTPStatus, message: str) -> tuple[HTTPStatus, bytes]:
+        return status, self.serializer.dumps({'message': message}).encode()
+
+    def _get_parking_site_count(self, source_uid: str) -> int:
+        # Results are newer than responses which were loaded from the store, and responses of results might not be built yet
+        source_info_and_results = self._source_results_by_uid.get(source_uid)
+        if source_info_and_results is not None:
+            return len(source_info_and_results[1])
+        return len(self._source_responses_by_uid[source_uid].parking_site_dicts)
+
+
+class ParkAPIRequestHandler(BaseHTTPRequestHandler):
+    server: Any
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        status, body = self.server.parkapi_server.get_response(url.path, parse_qs(url.query))
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any):  # noqa: A002
+        # Access logs go to the logger instead of stderr, so they can be silenced like the poller logs
+        logger.debug(format % args)
@@ -5,75 +5,61 @@ Use of this source code is governed by an MIT-style license that can be found in
 
 from typing import Optional, Type
 
-from .converters import (
-    A81PMPullConverter,
-    BahnV2PullConverter,
-    BaseConverter,
-    BfrkBwOepnvBikePushConverter,
-    BfrkBwOepnvCarPushConverter,
-    BfrkBwSpnvBikePushConverter,
-    BfrkBwSpnvCarPushConverter,
-    BietigheimBissingenPullConverter,
-    BuchenPushConverter,
-    EllwangenPushConverter,
-    FreiburgPullConverter,
-    HeidelbergPullConverter,
-    HerrenbergPullConverter,
-    KarlsruheBikePullConverter,
-    KarlsruhePullConverter,
-    KienzlerPullConverter,
-    KonstanzBikePushConverter,
-    MannheimPushConverter,
-    NeckarsulmBikePushConverter,
-    NeckarsulmPushConverter,
-    PbwPullConverter,
-    PforzheimPushConverter,
-    PumBwPushConverter,
-    RadvisBwPullConverter,
-    ReutlingenBikePushConverter,
-    ReutlingenPushConverter,
-    StuttgartPushConverter,
-    UlmPullConverter,
-    VrsParkAndRidePushConverter,
-)
+from . import converters
+from .converters import BaseConverter
 from .converters.base_converter.pull import PullConverter
 from .converters.base_converter.push import PushConverter
 from .exceptions import MissingConfigException, MissingConverterException
-from .util import ConfigHelper
+from .util import ConfigHelper, RequestHelper
+
+
+class ConverterClassesProperty:
+    """
+    Keeps ParkAPISources.converter_classes working, which was a list of all converter classes before converters were loaded lazily.
+    It's resolved at access, so just code which actually uses it imports all converters.
+    """
+
+    def __get__(self, instance: Optional['ParkAPISources'], owner: type['ParkAPISources']) -> list[Type[BaseConverter]]:
+        return owner.get_converter_classes()
 
 
 class ParkAPISources:
-    converter_classes: list[Type[BaseConverter]] = [
-        A81PMPullConverter,
-        BahnV2PullConverter,
-        BfrkBwOepnvBikePushConverter,
-        BfrkBwOepnvCarPushConverter,
-        BfrkBwSpnvBikePushConverter,
-        BfrkBwSpnvCarPushConverter,
-        BietigheimBissingenPullConverter,
-        EllwangenPushConverter,
-        BuchenPushConverter,
-        FreiburgPullConverter,
-        HeidelbergPullConverter,
-        HerrenbergPullConverter,
-        KarlsruheBikePullConverter,
-        KarlsruhePullConverter,
-        KienzlerPullConverter,
-        KonstanzBikePushConverter,
-        MannheimPushConverter,
-        NeckarsulmBikePushConverter,
-        NeckarsulmPushConverter,
-        PbwPullConverter,
-        PforzheimPushConverter,
-        PumBwPushConverter,
-        RadvisBwPullConverter,
-        ReutlingenPushConverter,
-        ReutlingenBikePushConverter,
-        StuttgartPushConverter,
-        UlmPullConverter,
-        VrsParkAndRidePushConverter,
-    ]
+    # Converter classes are registered by name and imported at first use, so ParkAPISources(converter_uids=[...]) just imports the
+    # converters it actually instantiates.
+    converter_class_names_by_uid: dict[str, str] = {
+        'a81_p_m': 'A81PMPullConverter',
+        'bahn_v2': 'BahnV2PullConverter',
+        'bfrk_bw_oepnv_bike': 'BfrkBwOepnvBikePushConverter',
+        'bfrk_bw_oepnv_car': 'BfrkBwOepnvCarPushConverter',
+        'bfrk_bw_spnv_bike': 'BfrkBwSpnvBikePushConverter',
+        'bfrk_bw_spnv_car': 'BfrkBwSpnvCarPushConverter',
+        'bietigheim_bissingen': 'BietigheimBissingenPullConverter',
+        'ellwangen': 'EllwangenPushConverter',
+        'buchen': 'BuchenPushConverter',
+        'freiburg': 'FreiburgPullConverter',
+        'heidelberg': 'HeidelbergPullConverter',
+        'herrenberg': 'HerrenbergPullConverter',
+        'karlsruhe_bike': 'KarlsruheBikePullConverter',
+        'karlsruhe': 'KarlsruhePullConverter',
+        'kienzler': 'KienzlerPullConverter',
+        'konstanz_bike': 'KonstanzBikePushConverter',
+        'mannheim': 'MannheimPushConverter',
+        'neckarsulm_bike': 'NeckarsulmBikePushConverter',
+        'neckarsulm': 'NeckarsulmPushConverter',
+        'pbw': 'PbwPullConverter',
+        'pforzheim': 'PforzheimPushConverter',
+        'pum_bw': 'PumBwPushConverter',
+        'radvis_bw': 'RadvisBwPullConverter',
+        'reutlingen': 'ReutlingenPushConverter',
+        'reutlingen_bike': 'ReutlingenBikePushConverter',
+        'stuttgart': 'StuttgartPushConverter',
+        'ulm': 'UlmPullConverter',
+        'vrs-p-r': 'VrsParkAndRidePushConverter',
+    }
+    # Deprecated, please use get_converter_classes() or converter_class_names_by_uid
+    converter_classes = ConverterClassesProperty()
     config_helper: ConfigHelper
+    request_helper: RequestHelper
     converter_by_uid: dict[str, BaseConverter]
 
     def __init__(
@@ -84,26 +70,45 @@ class ParkAPISources:
         no_push_converter: bool = False,
     ):
         self.config_helper = ConfigHelper(config=config)
+        # All converters share one connection pool, so requests to the same host re-use their connections
+        self.request_helper = RequestHelper(
+            pool_maxsize=int(self.config_helper.get('PARK_API_HTTP_POOL_SIZE', 10)),
+            retries=int(self.config_helper.get('PARK_API_HTTP_RETRIES', 3)),
+            backoff_factor=float(self.config_helper.get('PARK_API_HTTP_BACKOFF_FACTOR', 0.5)),
+        )
+        snapshot_cache_ttl = self.config_helper.get('PARK_API_SNAPSHOT_CACHE_TTL')
         self.converter_by_uid = {}
 
-        converter_classes_by_uid: dict[str, Type[BaseConverter]] = {
-            converter_class.source_info.uid: converter_class for converter_class in self.converter_classes
-        }
-
         if converter_uids is None:
-            converter_uids = list(converter_classes_by_uid.keys())
+            converter_uids = list(self.converter_class_names_by_uid.keys())
 
         for converter_uid in converter_uids:
-            if no_push_converter and issubclass(converter_classes_by_uid[converter_uid], PushConverter):
+            converter_class = self.get_converter_class(converter_uid)
+
+            if no_push_converter and issubclass(converter_class, PushConverter):
                 continue
 
-            if no_pull_converter and issubclass(converter_classes_by_uid[converter_uid], PullConverter):
+            if no_pull_converter and issubclass(converter_class, PullConverter):
                 continue
 
-            if converter_uid not in converter_classes_by_uid.keys():
-                raise MissingConverterException(f'Converter {converter_uid} does not exist.')
+            converter = converter_class(
+                config_helper=self.config_helper,
+                request_helper=self.request_helper,
+            )
+            if snapshot_cache_ttl is not None and isinstance(converter, PullConverter):
+                converter.snapshot_cache.ttl = float(snapshot_cache_ttl)
+            self.converter_by_uid[converter_uid] = converter
+
+    @classmethod
+    def get_converter_class(cls, converter_uid: str) -> Type[BaseConverter]:
+        if converter_uid not in cls.converter_class_names_by_uid:
+            raise MissingConverterException(f'Converter {converter_uid} does not exist.')
+
+        return getattr(converters, cls.converter_class_names_by_uid[converter_uid])
 
-            self.converter_by_uid[converter_uid] = converter_classes_by_uid[converter_uid](config_helper=self.config_helper)
+    @classmethod
+    def get_converter_classes(cls) -> list[Type[BaseConverter]]:
+        return [cls.get_converter_class(converter_uid) for converter_uid in cls.converter_class_names_by_uid.keys()]
 
     def check_credentials(self):
         for converter in self.converter_by_uid.values():
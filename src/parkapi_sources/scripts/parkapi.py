@@ -4,34 +4,130 @@ Use of this source code is governed by an MIT-style license that can be found in
 """
 
 import argparse
-import json
+import logging
 import os
+import signal
+import sys
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from pathlib import Path
-from typing import Optional
+from queue import Empty, SimpleQueue
+from threading import Lock, Thread
+from time import monotonic
+from typing import Callable, Iterable, Iterator, Optional
 
-from parkapi_sources import ParkAPISources
+from parkapi_sources import ParkAPIPoller, ParkAPIServer, ParkAPISources
 from parkapi_sources.converters.base_converter.pull import PullConverter
 from parkapi_sources.models import RealtimeParkingSiteInput, SourceInfo, StaticParkingSiteInput
-from parkapi_sources.util import DefaultJSONEncoder
+from parkapi_sources.parkapi_poller import SourceResults, iter_parking_site_dicts
+from parkapi_sources.util import JsonStreamWriter, ParkingSiteSerializer, ParkingSiteStore, StaticFingerprintStore
+
+# RFC 8142 prefixes each GeoJSON text with the ASCII record separator
+GEOJSON_SEQUENCE_RECORD_SEPARATOR = '\x1e'
+LINE_OUTPUT_TYPES = ('ndjson', 'geojsonseq')
+FILE_SUFFIX_BY_OUTPUT_TYPE: dict[str, str] = {
+    'json': 'json',
+    'geojson': 'geojson',
+    'ndjson': 'ndjson',
+    'geojsonseq': 'geojsons',
+}
+# Just used for building dicts from inputs, which does not depend on the JSON backend
+parking_site_serializer = ParkingSiteSerializer()
 
 
 def main():
+    # Options which are used by the one-shot run as well as by the poll command
+    common_parser = argparse.ArgumentParser(add_help=False)
+    common_parser.add_argument('-s', '--source', dest='sources', nargs='+', help='Limit to specific sources.')
+    common_parser.add_argument(
+        '-t',
+        '--type',
+        dest='output_type',
+        choices=['json', 'geojson', 'ndjson', 'geojsonseq'],
+        default='json',
+        help='Output format. ndjson and geojsonseq (RFC 8142) write one parking site per line as soon as its source is loaded.',
+    )
+    common_parser.add_argument(
+        '-d',
+        '--directory',
+        dest='output_directory',
+        help='Directory where data should be saved in one file per source.',
+    )
+    common_parser.add_argument(
+        '-gtd',
+        '--geojson-template-directory',
+        dest='geojson_template_directory',
+        help='Instead of loading GeoJSON template files from Github, you can load it from a local directory.',
+    )
+    common_parser.add_argument(
+        '-w',
+        '--workers',
+        dest='workers',
+        type=int,
+        default=1,
+        help='Number of sources which are fetched in parallel. Output order does not depend on this setting.',
+    )
+    common_parser.add_argument(
+        '--orjson',
+        dest='orjson',
+        action='store_true',
+        help='Use orjson for encoding, if installed. The output is more compact and does not escape non-ASCII characters.',
+    )
+
     parser = argparse.ArgumentParser(
         prog='Park-API',
         description='This library helps to get static and realtime parking site data. Outputs all sources to stdout per default. Uses '
         'env vars for config.',
+        parents=[common_parser],
     )
-    parser.add_argument('-s', '--source', dest='sources', nargs='+', help='Limit to specific sources.')
-    parser.add_argument('-t', '--type', dest='output_type', choices=['json', 'geojson'], default='json', help='Output format.')
-    parser.add_argument('-d', '--directory', dest='output_directory', help='Directory where data should be saved in one file per source.')
     parser.add_argument('-f', '--file', dest='output_file', help='Single File where all data should be saved in one file.')
     parser.add_argument(
-        '-gtd',
-        '--geojson-template-directory',
-        dest='geojson_template_directory',
-        help='Instead of loading GeoJSON template files from Github, you can load it from a local directory.',
+        '--timeout',
+        dest='timeout',
+        type=float,
+        help='Deadline in seconds per source, counted from its start. Sources which exceed it are left out of the output, and the exit '
+        'status is 1.',
+    )
+
+    # Options of the poll and serve commands
+    poller_parser = argparse.ArgumentParser(add_help=False, parents=[common_parser])
+    poller_parser.add_argument(
+        '--jitter',
+        dest='jitter',
+        type=float,
+        default=0.1,
+        help='Share by which poll intervals are randomized, so sources are not polled at the same time.',
+    )
+    poller_parser.add_argument(
+        '--realtime-changes',
+        dest='realtime_changes',
+        action='store_true',
+        help='Additionally write realtime data of parking sites whose values changed since the last poll as NDJSON to stdout.',
+    )
+    poller_parser.add_argument(
+        '--heartbeat-interval',
+        dest='heartbeat_interval',
+        type=float,
+        default=3600,
+        help='Seconds after which realtime changes contain all parking sites of a source again.',
     )
 
+    subparsers = parser.add_subparsers(dest='command', title='commands')
+    subparsers.add_parser(
+        'poll',
+        parents=[poller_parser],
+        help='Run as daemon which polls every source on its own interval and rewrites its file in the output directory after each '
+        'poll. Intervals are configured by env vars.',
+    )
+    serve_parser = subparsers.add_parser(
+        'serve',
+        parents=[poller_parser],
+        help='Run as daemon like poll, and serve the latest data of all sources by a local read-only HTTP API. The output directory '
+        'is optional.',
+    )
+    serve_parser.add_argument('--host', dest='host', default='127.0.0.1', help='Address the HTTP API listens on.')
+    serve_parser.add_argument('--port', dest='port', type=int, default=8000, help='Port the HTTP API listens on.')
+
     args = parser.parse_args()
 
     output_file_path: Optional[Path] = None
@@ -55,6 +151,12 @@ def main():
     if output_file_path is not None and output_directory is not None:
         raise ValueError('output directory and output file cannot be set at the same time.')
 
+    if args.workers < 1:
+        raise ValueError('workers has to be at least 1.')
+
+    if args.command == 'poll' and output_directory is None:
+        raise ValueError('poll needs an output directory.')
+
     # Load config variables from environment
     config = dict(os.environ)
     if geojson_template_directory is not None:
@@ -65,73 +167,354 @@ def main():
     # Check if all credentials are given by env vars.
     parkapi_sources.check_credentials()
 
-    # Initiate result dict. We collect all info in one dict because we decide later if we output it to stdout, to a single file or to
-    # multiple files. The list has always two entries, one first is a StaticParkingSiteInput, second an Optional[RealtimeParkingSiteInput].
-    result: dict[str, tuple[SourceInfo, dict[str, list[Optional[StaticParkingSiteInput | RealtimeParkingSiteInput]]]]] = {}
-    for source_uid, converter in parkapi_sources.converter_by_uid.items():
-        result[source_uid] = (converter.source_info, {})
+    serializer = ParkingSiteSerializer(use_orjson=args.orjson)
+
+    if args.command is not None:
+        run_poller(
+            parkapi_sources,
+            output_directory,
+            args.output_type,
+            serializer,
+            workers=args.workers,
+            jitter=args.jitter,
+            realtime_changes=args.realtime_changes,
+            heartbeat_interval=args.heartbeat_interval,
+            parkapi_server=ParkAPIServer(args.host, args.port, serializer=serializer) if args.command == 'serve' else None,
+        )
+        return
 
-    # Iterate over sources and get all the data
-    for source_uid, (_, source_results) in result.items():
-        converter: PullConverter = parkapi_sources.converter_by_uid[source_uid]  # type: ignore
+    static_fingerprint_store: Optional[StaticFingerprintStore] = None
+    if config.get('PARK_API_STATIC_FINGERPRINT_PATH'):
+        static_fingerprint_store = StaticFingerprintStore(Path(config['PARK_API_STATIC_FINGERPRINT_PATH']))
+
+    # Sources which exceeded the timeout are collected, so we know if some of them may still be running at the end
+    skipped_source_uids: list[str] = []
+    source_results_iterator = iter_source_results(
+        parkapi_sources,
+        workers=args.workers,
+        timeout=args.timeout,
+        static_fingerprint_store=static_fingerprint_store,
+        skipped_source_uids=skipped_source_uids,
+    )
+    if config.get('PARK_API_PARKING_SITE_STORE_PATH'):
+        source_results_iterator = store_source_results(
+            ParkingSiteStore(config['PARK_API_PARKING_SITE_STORE_PATH']),
+            source_results_iterator,
+        )
+
+    # Output is written source by source and parking site by parking site, so we never hold the whole serialized dataset in memory
+    if output_directory is not None:
+        file_suffix = FILE_SUFFIX_BY_OUTPUT_TYPE[args.output_type]
+        for source_info, source_results in source_results_iterator:
+            with Path(output_directory, f'{source_info.uid}.{file_suffix}').open('w', encoding='utf-8') as output_file:
+                write_source_results(JsonStreamWriter(output_file, serializer=serializer), args.output_type, source_info, source_results)
+    elif output_file_path is None:
+        write_all_source_results(JsonStreamWriter(sys.stdout, serializer=serializer), args.output_type, source_results_iterator)
+        # Line based formats already end with a newline
+        if args.output_type not in LINE_OUTPUT_TYPES:
+            sys.stdout.write('\n')
+    else:
+        with output_file_path.open('w', encoding='utf-8') as output_file:
+            write_all_source_results(JsonStreamWriter(output_file, serializer=serializer), args.output_type, source_results_iterator)
+
+    if skipped_source_uids:
+        # Skipped sources can still be running, and thread pools they use internally would be joined at interpreter exit, so we
+        # leave without waiting for them. os._exit() does not flush any buffers, so all output has to be flushed before. The exit
+        # status tells callers that the output is incomplete.
+        print(f'Skipped sources: {", ".join(skipped_source_uids)}', file=sys.stderr)  # noqa: T201
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(1)
+
+
+def run_poller(
+    parkapi_sources: ParkAPISources,
+    output_directory: Optional[Path],
+    output_type: str,
+    serializer: ParkingSiteSerializer,
+    workers: int,
+    jitter: float,
+    realtime_changes: bool,
+    heartbeat_interval: float,
+    parkapi_server: Optional[ParkAPIServer] = None,
+):
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
+    file_suffix = FILE_SUFFIX_BY_OUTPUT_TYPE[output_type]
+
+    def write_source_file(source_info: SourceInfo, source_results: SourceResults):
+        # The file is written next to the target and renamed, so readers never see a partially written file
+        output_file_path = Path(output_directory, f'{source_info.uid}.{file_suffix}')
+        temporary_file_path = output_file_path.with_name(f'.{output_file_path.name}.tmp')
+        with temporary_file_path.open('w', encoding='utf-8') as output_file:
+            write_source_results(JsonStreamWriter(output_file, serializer=serializer), output_type, source_info, source_results)
+        os.replace(temporary_file_path, output_file_path)
+
+    realtime_changes_writer = JsonStreamWriter(sys.stdout, serializer=serializer)
+    realtime_changes_lock = Lock()
+
+    def write_realtime_changes(source_info: SourceInfo, realtime_parking_site_inputs: list[RealtimeParkingSiteInput]):
+        # Sources are polled in parallel, but lines must not be mixed
+        with realtime_changes_lock:
+            realtime_changes_writer.write_lines(
+                {**parking_site_serializer.to_dict(realtime_parking_site_input), 'source_uid': source_info.uid}
+                for realtime_parking_site_input in realtime_parking_site_inputs
+            )
+            sys.stdout.flush()
+
+    result_handlers: list[Callable[[SourceInfo, SourceResults], None]] = []
+    if output_directory is not None:
+        result_handlers.append(write_source_file)
+    if parkapi_server is not None:
+        result_handlers.append(parkapi_server.handle_source_results)
+
+    parkapi_poller = ParkAPIPoller(
+        parkapi_sources,
+        workers=workers,
+        jitter=jitter,
+        result_handlers=result_handlers,
+        realtime_change_handlers=[write_realtime_changes] if realtime_changes else None,
+        heartbeat_interval=heartbeat_interval,
+    )
+
+    # Running polls are finished before the daemon stops
+    for signal_number in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signal_number, lambda *_: parkapi_poller.stop())
 
-        static_parking_site_inputs, static_parking_site_errors = converter.get_static_parking_sites()
-        for static_parking_site_input in static_parking_site_inputs:
-            source_results[static_parking_site_input.uid] = [static_parking_site_input, None]
+    if parkapi_server is None:
+        parkapi_poller.run()
+        return
+
+    # Until a source is polled, its data of the last run is served
+    if parkapi_poller.parking_site_store is not None:
+        parkapi_server.load_parking_site_store(
+            parkapi_poller.parking_site_store,
+            [converter.source_info for converter in parkapi_sources.converter_by_uid.values()],
+        )
 
-        realtime_parking_site_inputs, realtime_parking_site_errors = converter.get_realtime_parking_sites()
-        for realtime_parking_site_input in realtime_parking_site_inputs:
-            # If the realtime uid does not have a corresponding static dataset: ignore the realtime dataset
-            if realtime_parking_site_input.uid not in result[source_uid][1]:
+    host, port = parkapi_server.server_address
+    print(f'Serving HTTP API on http://{host}:{port}/', file=sys.stderr)  # noqa: T201
+    Thread(target=parkapi_server.serve_forever, name='parkapi-server', daemon=True).start()
+    try:
+        parkapi_poller.run()
+    finally:
+        parkapi_server.shutdown()
+
+
+def iter_source_results(
+    parkapi_sources: ParkAPISources,
+    workers: int,
+    timeout: Optional[float],
+    static_fingerprint_store: Optional[StaticFingerprintStore] = None,
+    skipped_source_uids: Optional[list[str]] = None,
+) -> Iterator[tuple[SourceInfo, dict[str, list[Optional[StaticParkingSiteInput | RealtimeParkingSiteInput]]]]]:
+    """
+    Yields the results of all sources in the order of the sources. The list per parking site has always two entries, the first one is a
+    StaticParkingSiteInput, the second one an Optional[RealtimeParkingSiteInput]. Sources which exceed the timeout are left out and
+    added to skipped_source_uids.
+    """
+    if workers == 1 and timeout is None:
+        # Sources are fetched one by one while the output is written, so just one source is held in memory at the same time
+        for converter in parkapi_sources.converter_by_uid.values():
+            yield converter.source_info, get_source_results(converter, static_fingerprint_store)  # type: ignore
+        return
+
+    # Sources are fetched in parallel, but as we wait for the futures in source order, the output order stays the same
+    source_queue: SimpleQueue[tuple[PullConverter, Future]] = SimpleQueue()
+    futures: dict[str, Future] = {}
+    for source_uid, converter in parkapi_sources.converter_by_uid.items():
+        futures[source_uid] = Future()
+        source_queue.put((converter, futures[source_uid]))  # type: ignore
+    # Start times are written by the workers and read while waiting, so they are guarded by a lock
+    started_at: dict[str, float] = {}
+    started_at_lock = Lock()
+
+    def start_source_worker():
+        # Workers are daemon threads, so a source which hangs beyond the timeout does not keep the process alive
+        Thread(
+            target=run_source_worker,
+            args=(source_queue, started_at, started_at_lock, static_fingerprint_store),
+            name='parkapi-source',
+            daemon=True,
+        ).start()
+
+    for _ in range(min(workers, len(futures))):
+        start_source_worker()
+
+    try:
+        for source_uid in list(futures.keys()):
+            # Drop the future, so its results are released as soon as the source was written
+            future = futures.pop(source_uid)
+            try:
+                source_results = wait_for_source_results(future, source_uid, started_at, started_at_lock, timeout)
+            except FutureTimeoutError:
+                print(f'Source {source_uid} exceeded the timeout of {timeout} seconds and was skipped.', file=sys.stderr)  # noqa: T201
+                if skipped_source_uids is not None:
+                    skipped_source_uids.append(source_uid)
+                # The worker of the skipped source is still busy with it, so another one takes over the remaining sources
+                start_source_worker()
                 continue
-            source_results[realtime_parking_site_input.uid][1] = realtime_parking_site_input
-
-    if args.output_type == 'geojson':
-        if output_directory is None:
-            # If we don't have an output directory, we have to create a single GeoJSON file with all features
-            output_geojson_features: list[dict] = []
-            for source_info, source_results in result.values():
-                output_geojson_features += source_results_to_geojson_feature(source_info, source_results)
-
-            output_geojson = json_dump(geojson_collection(output_geojson_features))
-            if output_file_path is None:
-                print(output_geojson)  # noqa: T201
-            else:
-                with output_file_path.open('w') as output_file:
-                    output_file.write(output_geojson)
+            del future
+            yield parkapi_sources.converter_by_uid[source_uid].source_info, source_results
+    finally:
+        # Sources which did not start yet are skipped by the workers
+        for future in futures.values():
+            future.cancel()
+
+
+def run_source_worker(
+    source_queue: SimpleQueue,
+    started_at: dict[str, float],
+    started_at_lock: Lock,
+    static_fingerprint_store: Optional[StaticFingerprintStore],
+):
+    while True:
+        try:
+            converter, future = source_queue.get_nowait()
+        except Empty:
             return
+        if not future.set_running_or_notify_cancel():
+            continue
+        try:
+            future.set_result(get_timed_source_results(converter, started_at, started_at_lock, static_fingerprint_store))
+        except BaseException as e:
+            future.set_exception(e)
+
+
+def store_source_results(
+    parking_site_store: ParkingSiteStore,
+    source_results_iterator: Iterable[tuple[SourceInfo, dict[str, list[Optional[StaticParkingSiteInput | RealtimeParkingSiteInput]]]]],
+) -> Iterator[tuple[SourceInfo, dict[str, list[Optional[StaticParkingSiteInput | RealtimeParkingSiteInput]]]]]:
+    """
+    Writes the results of each source to the parking site store before it's passed on to the output.
+    """
+    for source_info, source_results in source_results_iterator:
+        parking_site_store.upsert_static_parking_sites(
+            source_info.uid,
+            (static_parking_site_input for static_parking_site_input, _ in source_results.values()),
+        )
+        parking_site_store.upsert_realtime_parking_sites(
+            source_info.uid,
+            (realtime_parking_site_input for _, realtime_parking_site_input in source_results.values() if realtime_parking_site_input),
+            replace=True,
+        )
+        yield source_info, source_results
+
+
+def write_all_source_results(
+    json_stream_writer: JsonStreamWriter,
+    output_type: str,
+    source_results_iterator: Iterable[tuple[SourceInfo, dict[str, list[Optional[StaticParkingSiteInput | RealtimeParkingSiteInput]]]]],
+):
+    if output_type in LINE_OUTPUT_TYPES:
+        # Line based formats are just concatenated, and flushed after each source, so consumers can start while we load the next one
+        for source_info, source_results in source_results_iterator:
+            write_source_results(json_stream_writer, output_type, source_info, source_results)
+            json_stream_writer.output.flush()
+        return
+
+    if output_type == 'geojson':
+        # A single GeoJSON output has all features of all sources in one FeatureCollection
+        json_stream_writer.write_geojson_feature_collection(
+            feature
+            for source_info, source_results in source_results_iterator
+            for feature in iter_source_results_geojson_features(source_info, source_results)
+        )
+        return
+
+    json_stream_writer.write_raw('[')
+    for index, (source_info, source_results) in enumerate(source_results_iterator):
+        if index > 0:
+            json_stream_writer.write_raw(json_stream_writer.serializer.item_separator)
+        write_source_results(json_stream_writer, output_type, source_info, source_results)
+    json_stream_writer.write_raw(']')
 
-        # If we have an output directory, we have to split the GeoJSON data up in separate files
-        for source_info, source_results in result.values():
-            geojson_file_path = Path(output_directory, f'{source_info.uid}.geojson')
-            output_geojson_features = source_results_to_geojson_feature(source_info, source_results)
-            output_geojson = json_dump(geojson_collection(output_geojson_features))
-            with geojson_file_path.open('w') as geojson_file:
-                geojson_file.write(output_geojson)
 
+def write_source_results(
+    json_stream_writer: JsonStreamWriter,
+    output_type: str,
+    source_info: SourceInfo,
+    source_results: dict[str, list[Optional[StaticParkingSiteInput | RealtimeParkingSiteInput]]],
+):
+    if output_type == 'geojson':
+        json_stream_writer.write_geojson_feature_collection(iter_source_results_geojson_features(source_info, source_results))
+        return
+
+    if output_type == 'geojsonseq':
+        json_stream_writer.write_lines(
+            iter_source_results_geojson_features(source_info, source_results),
+            record_separator=GEOJSON_SEQUENCE_RECORD_SEPARATOR,
+        )
         return
 
-    if output_directory is None:
-        # If we don't have an output directory, we have to create a single JSON file with all the data
-        output_dicts: list[dict] = []
-        for source_info, source_results in result.values():
-            output_dicts.append(source_results_to_dict(source_info, source_results))
-
-        output_json = json_dump(output_dicts)
-        if output_file_path is None:
-            print(output_json)  # noqa: T201
-        else:
-            with output_file_path.open('w') as output_file:
-                output_file.write(output_json)
+    if output_type == 'ndjson':
+        # As there is no surrounding source object, each line references its source
+        json_stream_writer.write_lines(
+            {**parking_site_dict, 'source_uid': source_info.uid}
+            for parking_site_dict in iter_source_results_parking_site_dicts(source_results)
+        )
         return
 
-    for source_info, source_results in result.values():
-        geojson_file_path = Path(output_directory, f'{source_info.uid}.json')
-        output_dict = source_results_to_dict(source_info, source_results)
-        output_json = json_dump(output_dict)
+    json_stream_writer.write_object(
+        [('source', source_info.to_dict())],
+        'parking_sites',
+        iter_source_results_parking_site_dicts(source_results),
+    )
+
 
-        with geojson_file_path.open('w') as geojson_file:
-            geojson_file.write(output_json)
+def get_source_results(
+    converter: PullConverter,
+    static_fingerprint_store: Optional[StaticFingerprintStore] = None,
+) -> dict[str, list[Optional[StaticParkingSiteInput | RealtimeParkingSiteInput]]]:
+    source_results: dict[str, list[Optional[StaticParkingSiteInput | RealtimeParkingSiteInput]]] = {}
+
+    static_parking_site_inputs, static_parking_site_errors = converter.get_static_parking_sites()
+    if static_fingerprint_store is not None:
+        # Keeps static_data_updated_at of parking sites whose content did not change since the last run
+        static_fingerprint_store.update(converter.source_info.uid, static_parking_site_inputs)
+    for static_parking_site_input in static_parking_site_inputs:
+        source_results[static_parking_site_input.uid] = [static_parking_site_input, None]
+
+    realtime_parking_site_inputs, realtime_parking_site_errors = converter.get_realtime_parking_sites()
+    for realtime_parking_site_input in realtime_parking_site_inputs:
+        # If the realtime uid does not have a corresponding static dataset: ignore the realtime dataset
+        if realtime_parking_site_input.uid not in source_results:
+            continue
+        source_results[realtime_parking_site_input.uid][1] = realtime_parking_site_input
+
+    return source_results
+
+
+def get_timed_source_results(
+    converter: PullConverter,
+    started_at: dict[str, float],
+    started_at_lock: Lock,
+    static_fingerprint_store: Optional[StaticFingerprintStore] = None,
+) -> dict[str, list[Optional[StaticParkingSiteInput | RealtimeParkingSiteInput]]]:
+    with started_at_lock:
+        started_at[converter.source_info.uid] = monotonic()
+    return get_source_results(converter, static_fingerprint_store)
+
+
+def wait_for_source_results(
+    future: Future,
+    source_uid: str,
+    started_at: dict[str, float],
+    started_at_lock: Lock,
+    timeout: Optional[float],
+) -> dict[str, list[Optional[StaticParkingSiteInput | RealtimeParkingSiteInput]]]:
+    if timeout is None:
+        return future.result()
+
+    while True:
+        with started_at_lock:
+            source_started_at: Optional[float] = started_at.get(source_uid)
+        # The deadline starts as soon as the source is actually running, not while it's waiting for a free worker
+        remaining = timeout if source_started_at is None else source_started_at + timeout - monotonic()
+        try:
+            return future.result(timeout=max(remaining, 0))
+        except FutureTimeoutError:
+            if source_started_at is not None:
+                raise
 
 
 def parking_site_inputs_to_geojson_feature(
@@ -145,65 +528,30 @@ def parking_site_inputs_to_geojson_feature(
             'coordinates': [float(static_parking_site_input.lon), float(static_parking_site_input.lat)],
         },
         'properties': {
-            **static_parking_site_input.to_dict(),
-            **({} if realtime_parking_site_input is None else realtime_parking_site_input.to_dict()),
+            **parking_site_serializer.to_dict(static_parking_site_input),
+            **({} if realtime_parking_site_input is None else parking_site_serializer.to_dict(realtime_parking_site_input)),
             'source': source_info.to_dict(),
         },
         'type': 'Feature',
     }
 
 
-def json_dump(data: dict | list) -> str:
-    return json.dumps(data, cls=DefaultJSONEncoder)
-
-
-def geojson_collection(features: list[dict]) -> dict:
-    return {
-        'type': 'FeatureCollection',
-        'features': features,
-    }
-
-
-def source_results_to_geojson_feature(
+def iter_source_results_geojson_features(
     source_info: SourceInfo,
     source_results: dict[str, list[Optional[StaticParkingSiteInput | RealtimeParkingSiteInput]]],
-) -> list[dict]:
-    output_geojson_features: list[dict] = []
+) -> Iterator[dict]:
     for static_parking_site_input, realtime_parking_site_input in source_results.values():
-        output_geojson_features.append(
-            parking_site_inputs_to_geojson_feature(
-                source_info=source_info,
-                static_parking_site_input=static_parking_site_input,
-                realtime_parking_site_input=realtime_parking_site_input,
-            ),
+        yield parking_site_inputs_to_geojson_feature(
+            source_info=source_info,
+            static_parking_site_input=static_parking_site_input,
+            realtime_parking_site_input=realtime_parking_site_input,
         )
 
-    return output_geojson_features
-
 
-def source_results_to_dict(
-    source_info: SourceInfo,
+def iter_source_results_parking_site_dicts(
     source_results: dict[str, list[Optional[StaticParkingSiteInput | RealtimeParkingSiteInput]]],
-) -> dict[str, dict]:
-    return {
-        'source': source_info.to_dict(),
-        'parking_sites': source_results_to_parking_site_dicts(source_results),
-    }
-
-
-def source_results_to_parking_site_dicts(
-    source_results: dict[str, list[Optional[StaticParkingSiteInput | RealtimeParkingSiteInput]]],
-) -> list[dict]:
-    output_json_items: list[dict] = []
-    for static_parking_site_input, realtime_parking_site_input in source_results.values():
-        output_json_item = static_parking_site_input.to_dict()
-
-        if realtime_parking_site_input is not None:
-            output_json_item.update(realtime_parking_site_input.to_dict())
-
-        output_json_items.append(output_json_item)
-
-    return output_json_items
+) -> Iterator[dict]:
+    return iter_parking_site_dicts(source_results, parking_site_serializer)
 
 
 if __name__ == '__main__':
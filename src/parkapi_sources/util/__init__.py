@@ -5,4 +5,14 @@ Use of this source code is governed by an MIT-style license that can be found in
 
 from .config_helper import ConfigHelper
 from .encoding import DefaultJSONEncoder
-from .xml_helper import XMLHelper
+from .json_stream_writer import JsonStreamWriter
+from .parking_site_batch import ParkingSiteBatch
+from .parking_site_serializer import ParkingSiteSerializer
+from .parking_site_store import ParkingSiteStore
+from .poll_scheduler import PollScheduler
+from .realtime_change_detector import RealtimeChangeDetector
+from .request_helper import RequestHelper
+from .row_mapper import RowMapper
+from .snapshot_cache import SnapshotCache
+from .static_fingerprint_store import StaticFingerprintStore
+from .xml_helper import XMLHelper, XMLToDictConverter
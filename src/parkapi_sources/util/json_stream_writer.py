@@ -0,0 +1,65 @@
+"""
+Copyright 2024 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+from typing import Any, Iterable, Optional, TextIO
+
+from .parking_site_serializer import ParkingSiteSerializer
+
+
+class JsonStreamWriter:
+    """
+    Writes JSON documents item by item to a file handle instead of building the whole document as one string first. Each item is
+    encoded on its own, so memory is bounded by the largest item instead of the whole document. With the default serializer, the
+    output is identical to json.dumps(data, cls=DefaultJSONEncoder).
+    """
+
+    output: TextIO
+    serializer: ParkingSiteSerializer
+
+    def __init__(self, output: TextIO, serializer: Optional[ParkingSiteSerializer] = None):
+        self.output = output
+        self.serializer = ParkingSiteSerializer() if serializer is None else serializer
+
+    def write_raw(self, data: str):
+        self.output.write(data)
+
+    def write_value(self, value: Any):
+        self.output.write(self.serializer.dumps(value))
+
+    def write_array(self, items: Iterable[Any]):
+        self.output.write('[')
+        for index, item in enumerate(items):
+            if index > 0:
+                self.output.write(self.serializer.item_separator)
+            self.write_value(item)
+        self.output.write(']')
+
+    def write_object(self, items: Iterable[tuple[str, Any]], streamed_key: str, streamed_items: Iterable[Any]):
+        """
+        Writes an object with regular key-value pairs first and one array which is streamed item by item as last value.
+        """
+        self.output.write('{')
+        for key, value in items:
+            self.write_value(key)
+            self.output.write(self.serializer.key_separator)
+            self.write_value(value)
+            self.output.write(self.serializer.item_separator)
+        self.write_value(streamed_key)
+        self.output.write(self.serializer.key_separator)
+        self.write_array(streamed_items)
+        self.output.write('}')
+
+    def write_lines(self, items: Iterable[Any], record_separator: str = ''):
+        """
+        Writes one JSON document per line, as used by NDJSON. GeoJSON text sequences (RFC 8142) additionally prefix each record with
+        the ASCII record separator.
+        """
+        for item in items:
+            self.output.write(record_separator)
+            self.output.write(self.serializer.dumps(item))
+            self.output.write('\n')
+
+    def write_geojson_feature_collection(self, features: Iterable[dict]):
+        self.write_object([('type', 'FeatureCollection')], 'features', features)
@@ -0,0 +1,205 @@
+"""
+Copyright 2024 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+from dataclasses import fields, is_dataclass
+from decimal import Decimal
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Generic, Iterable, Iterator, Optional, TypeVar
+
+from validataclass.helpers import UnsetValue
+
+from parkapi_sources.exceptions import ImportParkingSiteException
+
+from .parking_site_serializer import ParkingSiteSerializer
+
+if TYPE_CHECKING:
+    from pyarrow import Table
+
+T_Input = TypeVar('T_Input')
+
+
+class ParkingSiteBatch(Generic[T_Input]):
+    """
+    Columnar container for converter results: one list per field of the input class and a validity mask per field, which is 1 if the
+    field is set and 0 if it is UnsetValue. Unset values are stored as None in the column, so None values of set fields can be told
+    apart by the mask. Appending an input just copies its values to the columns, so results which are streamed by a converter can be
+    collected without keeping the input objects.
+
+    Exports convert each column at once instead of each object: to_dicts() gives the same dicts as ParkingSiteSerializer.to_dict()
+    for every input, and to_arrow() builds a pyarrow Table if pyarrow is installed.
+    """
+
+    input_class: type[T_Input]
+    source_uid: Optional[str]
+    field_names: tuple[str, ...]
+    columns: dict[str, list[Any]]
+    masks: dict[str, bytearray]
+
+    def __init__(self, input_class: type[T_Input], source_uid: Optional[str] = None):
+        self.input_class = input_class
+        self.source_uid = source_uid
+        self.field_names = tuple(field.name for field in fields(input_class))
+        self.columns = {field_name: [] for field_name in self.field_names}
+        self.masks = {field_name: bytearray() for field_name in self.field_names}
+
+    @classmethod
+    def from_inputs(
+        cls,
+        input_class: type[T_Input],
+        inputs: Iterable[T_Input],
+        source_uid: Optional[str] = None,
+    ) -> 'ParkingSiteBatch[T_Input]':
+        batch = cls(input_class, source_uid=source_uid)
+        batch.extend(inputs)
+        return batch
+
+    @classmethod
+    def from_results(
+        cls,
+        input_class: type[T_Input],
+        results: Iterable[Any | ImportParkingSiteException] | tuple[list[Any], list[ImportParkingSiteException]],
+        source_uid: Optional[str] = None,
+    ) -> tuple['ParkingSiteBatch[T_Input]', list[ImportParkingSiteException]]:
+        """
+        Collects converter results into a batch and a list of import exceptions. Results can be the usual tuple of inputs and exceptions
+        returned by handle_*() and split_results(), or the results of converters which yield inputs and exceptions while reading, like
+        CsvConverter.iter_csv_string(). As some converters return static and realtime inputs together, inputs of other classes than
+        input_class are skipped, so the same results can be passed once per input class.
+        """
+        batch = cls(input_class, source_uid=source_uid)
+        import_parking_site_exceptions: list[ImportParkingSiteException] = []
+        if isinstance(results, tuple):
+            results = [*results[0], *results[1]]
+        for result in results:
+            if isinstance(result, ImportParkingSiteException):
+                import_parking_site_exceptions.append(result)
+            elif isinstance(result, input_class):
+                batch.append(result)
+        return batch, import_parking_site_exceptions
+
+    def __len__(self) -> int:
+        return len(self.masks[self.field_names[0]]) if self.field_names else 0
+
+    def __iter__(self) -> Iterator[T_Input]:
+        return self.iter_inputs()
+
+    def append(self, parking_site_input: T_Input):
+        if not isinstance(parking_site_input, self.input_class):
+            raise TypeError(f'{self.input_class.__name__} batch cannot hold {type(parking_site_input).__name__}.')
+
+        for field_name in self.field_names:
+            value = getattr(parking_site_input, field_name)
+            if value is UnsetValue:
+                self.columns[field_name].append(None)
+                self.masks[field_name].append(0)
+            else:
+                self.columns[field_name].append(value)
+                self.masks[field_name].append(1)
+
+    def extend(self, parking_site_inputs: Iterable[T_Input]):
+        for parking_site_input in parking_site_inputs:
+            self.append(parking_site_input)
+
+    def iter_inputs(self) -> Iterator[T_Input]:
+        """
+        Re-creates the input objects row by row. Unset fields are left out, so they get their defaults like at validation.
+        """
+        columns = [(field_name, self.columns[field_name], self.masks[field_name]) for field_name in self.field_names]
+        for index in range(len(self)):
+            yield self.input_class(**{field_name: column[index] for field_name, column, mask in columns if mask[index]})
+
+    def to_dicts(self, serializer: Optional[ParkingSiteSerializer] = None) -> list[dict[str, Any]]:
+        serializer = ParkingSiteSerializer() if serializer is None else serializer
+        convert_value = serializer.convert_value
+
+        rows: list[dict[str, Any]] = [{} for _ in range(len(self))]
+        # Fields are filled one after another, so the keys have the same order as in ParkingSiteSerializer.to_dict()
+        for field_name in self.field_names:
+            for row, value, is_set in zip(rows, self.columns[field_name], self.masks[field_name], strict=True):
+                if is_set:
+                    row[field_name] = convert_value(value)
+        return rows
+
+    def to_json(self, serializer: Optional[ParkingSiteSerializer] = None) -> str:
+        serializer = ParkingSiteSerializer() if serializer is None else serializer
+        return serializer.dumps(self.to_dicts(serializer))
+
+    def to_arrow(self) -> 'Table':
+        """
+        Builds a pyarrow Table with one column per field. Datetimes and decimals keep their types, enums become their values and nested
+        dataclasses become structs. Arrow has no unset values, so unset fields are nulls like None values.
+        """
+        try:
+            # pyarrow is optional and large, so it's just imported if it's used
+            import pyarrow
+        except ImportError as e:
+            raise ValueError('Arrow export requested, but pyarrow is not installed. Please install parkapi-sources[arrow].') from e
+
+        serializer = ParkingSiteSerializer()
+        return pyarrow.table(
+            {
+                field_name: pyarrow.array([self._convert_arrow_value(value, serializer) for value in self.columns[field_name]])
+                for field_name in self.field_names
+            },
+        )
+
+    def get_sum(self, field_name: str) -> int | Decimal:
+        """
+        Sums up a numeric field, for example realtime_free_capacity. Unset and None values are skipped.
+        """
+        return sum(
+            value for value, is_set in zip(self.columns[field_name], self.masks[field_name], strict=True) if is_set and value is not None
+        )
+
+    def get_free_capacity(self) -> int:
+        return self.get_sum('realtime_free_capacity')
+
+    def get_occupancy_rate(
+        self,
+        capacity_field_name: str = 'realtime_capacity',
+        free_capacity_field_name: str = 'realtime_free_capacity',
+    ) -> Optional[float]:
+        """
+        Returns the share of occupied capacity of all rows together, which is the occupancy of the source if the batch holds the results
+        of one source. Rows without capacity or free capacity are skipped, and None is returned if no capacity is left.
+        """
+        capacity_sum = 0
+        free_capacity_sum = 0
+        for capacity, free_capacity in zip(self.columns[capacity_field_name], self.columns[free_capacity_field_name], strict=True):
+            # Unset values are None in the columns
+            if capacity is None or free_capacity is None:
+                continue
+            capacity_sum += capacity
+            free_capacity_sum += free_capacity
+        if capacity_sum == 0:
+            return None
+        return (capacity_sum - free_capacity_sum) / capacity_sum
+
+    def get_occupancy_rates(
+        self,
+        capacity_field_name: str = 'realtime_capacity',
+        free_capacity_field_name: str = 'realtime_free_capacity',
+    ) -> list[Optional[float]]:
+        """
+        Returns the share of occupied capacity for every row, or None if capacity or free capacity are not set or capacity is zero.
+        """
+        occupancy_rates: list[Optional[float]] = []
+        for capacity, free_capacity in zip(self.columns[capacity_field_name], self.columns[free_capacity_field_name], strict=True):
+            # Unset values are None in the columns
+            if capacity is None or free_capacity is None or capacity == 0:
+                occupancy_rates.append(None)
+            else:
+                occupancy_rates.append((capacity - free_capacity) / capacity)
+        return occupancy_rates
+
+    @classmethod
+    def _convert_arrow_value(cls, value: Any, serializer: ParkingSiteSerializer) -> Any:
+        if isinstance(value, Enum):
+            return value.value
+        if isinstance(value, (list, tuple)):
+            return [cls._convert_arrow_value(item, serializer) for item in value]
+        if is_dataclass(value):
+            return serializer.to_dict(value)
+        return value
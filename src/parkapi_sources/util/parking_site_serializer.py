@@ -0,0 +1,135 @@
+"""
+Copyright 2024 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+import json
+from dataclasses import fields, is_dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable
+
+from validataclass.helpers import UnsetValue
+
+from .encoding import DefaultJSONEncoder, convert_to_serializable_value
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+NATIVE_TYPES: frozenset[type] = frozenset({str, int, float, bool, type(None)})
+ORJSON_OPTIONS: int = 0 if orjson is None else orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+
+
+def serialize_datetime(value: datetime) -> str:
+    # Same output as DefaultJSONEncoder, which uses strftime('%Y-%m-%dT%H:%M:%SZ'), but without parsing the format string every time
+    return f'{value.year:04d}-{value.month:02d}-{value.day:02d}T{value.hour:02d}:{value.minute:02d}:{value.second:02d}Z'
+
+
+class ParkingSiteSerializer:
+    """
+    Serializes StaticParkingSiteInput, RealtimeParkingSiteInput and other validataclass models to JSON-compatible dicts and JSON strings.
+
+    In contrast to to_dict() and DefaultJSONEncoder, which deep-copy the model with dataclasses.asdict() and run an isinstance chain
+    for every non-native value, it walks a field list which is computed once per class, skips UnsetValues right away and looks up
+    converters by exact type. The output is identical to json.dumps(model.to_dict(), cls=DefaultJSONEncoder).
+
+    If orjson is installed, it can be used as JSON backend with use_orjson=True. Please keep in mind that its output is more compact
+    and does not escape non-ASCII characters, so it's the same data, but not the same bytes.
+    """
+
+    use_orjson: bool
+    # Separators used by the backend, so documents which are written piece by piece look like the ones dumped at once
+    item_separator: str
+    key_separator: str
+    _field_names_by_class: dict[type, tuple[str, ...]]
+    _converter_by_type: dict[type, Callable[[Any], Any]]
+    _json_encoder: json.JSONEncoder
+
+    def __init__(self, use_orjson: bool = False):
+        if use_orjson and orjson is None:
+            raise ValueError('orjson backend requested, but orjson is not installed.')
+
+        self.use_orjson = use_orjson
+        self.item_separator, self.key_separator = (',', ':') if use_orjson else (', ', ': ')
+        self._field_names_by_class = {}
+        self._converter_by_type = {
+            datetime: serialize_datetime,
+            date: date.isoformat,
+            Decimal: str,
+            list: self._convert_list,
+            tuple: self._convert_list,
+            dict: self._convert_dict,
+        }
+        # All values are JSON-native after to_dict(), DefaultJSONEncoder is just a fallback for plain dicts passed to dumps()
+        self._json_encoder = DefaultJSONEncoder()
+
+    def to_dict(self, obj: Any) -> dict:
+        obj_class = type(obj)
+        field_names = self._field_names_by_class.get(obj_class)
+        if field_names is None:
+            # Compact inputs are no dataclasses, but have one slot per field
+            field_names = tuple(field.name for field in fields(obj_class)) if is_dataclass(obj_class) else obj_class.__slots__
+            self._field_names_by_class[obj_class] = field_names
+
+        result: dict = {}
+        for field_name in field_names:
+            value = getattr(obj, field_name)
+            if value is UnsetValue:
+                continue
+            value_type = type(value)
+            if value_type in NATIVE_TYPES:
+                result[field_name] = value
+            else:
+                result[field_name] = self._get_converter(value_type)(value)
+
+        return result
+
+    def convert_value(self, value: Any) -> Any:
+        value_type = type(value)
+        if value_type in NATIVE_TYPES:
+            return value
+        return self._get_converter(value_type)(value)
+
+    def dumps(self, value: Any) -> str:
+        if is_dataclass(value) and not isinstance(value, type):
+            value = self.to_dict(value)
+
+        if self.use_orjson:
+            # orjson would format datetimes and dataclasses on its own, so we pass them to our converters
+            return orjson.dumps(value, default=self.convert_value, option=ORJSON_OPTIONS).decode()
+
+        return self._json_encoder.encode(value)
+
+    def _get_converter(self, value_type: type) -> Callable[[Any], Any]:
+        converter = self._converter_by_type.get(value_type)
+        if converter is not None:
+            return converter
+
+        # Subclasses like enums or nested dataclasses are resolved once per type, so the isinstance chain just runs at the first value
+        if issubclass(value_type, Enum):
+            converter = self._convert_enum
+        elif is_dataclass(value_type):
+            converter = self.to_dict
+        elif issubclass(value_type, datetime):
+            converter = serialize_datetime
+        elif issubclass(value_type, date):
+            converter = date.isoformat
+        else:
+            converter = convert_to_serializable_value
+
+        self._converter_by_type[value_type] = converter
+        return converter
+
+    @staticmethod
+    def _convert_enum(value: Enum) -> Any:
+        return value.value
+
+    def _convert_list(self, values: list | tuple) -> list:
+        return [self.convert_value(value) for value in values]
+
+    def _convert_dict(self, values: dict) -> dict:
+        return {key: self.convert_value(value) for key, value in values.items()}
@@ -0,0 +1,196 @@
+"""
+Copyright 2024 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+from threading import Lock, local
+from typing import Any, Iterable, Optional
+
+from .parking_site_serializer import ParkingSiteSerializer
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS static_parking_site (
+    source_uid TEXT NOT NULL,
+    uid TEXT NOT NULL,
+    lat REAL NOT NULL,
+    lon REAL NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (source_uid, uid)
+);
+CREATE INDEX IF NOT EXISTS static_parking_site_uid ON static_parking_site (uid);
+CREATE INDEX IF NOT EXISTS static_parking_site_lat_lon ON static_parking_site (lat, lon);
+CREATE TABLE IF NOT EXISTS realtime_parking_site (
+    source_uid TEXT NOT NULL,
+    uid TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (source_uid, uid)
+);
+"""
+
+
+class ParkingSiteStore:
+    """
+    Keeps the latest static and realtime data of every parking site in a SQLite database, so it survives restarts and can be queried
+    without loading the sources again. Data is stored as the JSON of ParkingSiteSerializer.to_dict() per (source_uid, uid), plus the
+    coordinates of static data for bounding box queries.
+
+    The database runs in WAL mode, so readers see the last committed state while a source is written. Each thread gets its own
+    connection, and every upsert of a source is one transaction.
+    """
+
+    path: Path
+    _serializer: ParkingSiteSerializer
+    _local: local
+    _connections: list[sqlite3.Connection]
+    _lock: Lock
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        self._serializer = ParkingSiteSerializer()
+        self._local = local()
+        self._connections = []
+        self._lock = Lock()
+
+        with self._get_connection() as connection:
+            connection.executescript(SCHEMA)
+
+    def upsert_static_parking_sites(self, source_uid: str, static_parking_site_inputs: Iterable[Any], replace: bool = True):
+        """
+        Inserts or updates the static data of parking sites of a source. With replace, the inputs are the complete import of the source,
+        so parking sites of the source which are not part of it are removed together with their realtime data.
+        """
+        rows = [
+            (
+                source_uid,
+                static_parking_site_input.uid,
+                float(static_parking_site_input.lat),
+                float(static_parking_site_input.lon),
+                self._serializer.dumps(self._serializer.to_dict(static_parking_site_input)),
+            )
+            for static_parking_site_input in static_parking_site_inputs
+        ]
+
+        with self._get_connection() as connection:
+            if replace:
+                # Deleting first keeps the order of the import, which is used as output order
+                connection.execute('DELETE FROM static_parking_site WHERE source_uid = ?', (source_uid,))
+            connection.executemany(
+                'INSERT INTO static_parking_site (source_uid, uid, lat, lon, data) VALUES (?, ?, ?, ?, ?) '
+                'ON CONFLICT (source_uid, uid) DO UPDATE SET lat = excluded.lat, lon = excluded.lon, data = excluded.data',
+                rows,
+            )
+            if replace:
+                connection.execute(
+                    'DELETE FROM realtime_parking_site WHERE source_uid = ? '
+                    'AND uid NOT IN (SELECT uid FROM static_parking_site WHERE source_uid = ?)',
+                    (source_uid, source_uid),
+                )
+
+    def upsert_realtime_parking_sites(
+        self,
+        source_uid: str,
+        realtime_parking_site_inputs: Iterable[Any],
+        replace: bool = False,
+        current_uids: Optional[Iterable[str]] = None,
+    ):
+        """
+        Inserts or updates the realtime data of parking sites of a source. Per default, realtime data of other parking sites is kept, so
+        it's enough to pass the changed ones. With replace, the inputs are the complete realtime data of the source instead. With
+        current_uids, just the changed inputs are passed, but realtime data of parking sites which are not in current_uids is removed,
+        so parking sites which dropped out of a poll don't keep their last values.
+        """
+        rows = [
+            (
+                source_uid,
+                realtime_parking_site_input.uid,
+                self._serializer.dumps(self._serializer.to_dict(realtime_parking_site_input)),
+            )
+            for realtime_parking_site_input in realtime_parking_site_inputs
+        ]
+
+        with self._get_connection() as connection:
+            if replace:
+                connection.execute('DELETE FROM realtime_parking_site WHERE source_uid = ?', (source_uid,))
+            elif current_uids is not None:
+                # The uids are passed as one JSON array, as the number of SQL parameters is limited
+                connection.execute(
+                    'DELETE FROM realtime_parking_site WHERE source_uid = ? AND uid NOT IN (SELECT value FROM json_each(?))',
+                    (source_uid, json.dumps(list(current_uids))),
+                )
+            connection.executemany(
+                'INSERT INTO realtime_parking_site (source_uid, uid, data) VALUES (?, ?, ?) '
+                'ON CONFLICT (source_uid, uid) DO UPDATE SET data = excluded.data',
+                rows,
+            )
+
+    def get_source_uids(self) -> list[str]:
+        cursor = self._get_connection().execute('SELECT DISTINCT source_uid FROM static_parking_site ORDER BY source_uid')
+        return [source_uid for (source_uid,) in cursor]
+
+    def get_parking_site(self, source_uid: str, uid: str) -> Optional[dict]:
+        parking_sites = self.get_parking_sites(source_uid=source_uid, uid=uid)
+        return parking_sites[0] if parking_sites else None
+
+    def get_parking_sites(
+        self,
+        source_uid: Optional[str] = None,
+        uid: Optional[str] = None,
+        bbox: Optional[tuple[float, float, float, float]] = None,
+    ) -> list[dict]:
+        """
+        Returns parking sites as dicts of their static data, updated by their realtime data and with their source_uid, like the lines
+        of the ndjson output. All filters are optional and combined: source_uid, uid, which can exist at several sources, and bbox as
+        (min_lon, min_lat, max_lon, max_lat) like in GeoJSON.
+        """
+        conditions: list[str] = []
+        parameters: list[Any] = []
+        if source_uid is not None:
+            conditions.append('static_parking_site.source_uid = ?')
+            parameters.append(source_uid)
+        if uid is not None:
+            conditions.append('static_parking_site.uid = ?')
+            parameters.append(uid)
+        if bbox is not None:
+            min_lon, min_lat, max_lon, max_lat = bbox
+            conditions.append('static_parking_site.lat BETWEEN ? AND ? AND static_parking_site.lon BETWEEN ? AND ?')
+            parameters.extend((min_lat, max_lat, min_lon, max_lon))
+
+        query = (
+            'SELECT static_parking_site.source_uid, static_parking_site.data, realtime_parking_site.data FROM static_parking_site '
+            'LEFT JOIN realtime_parking_site ON realtime_parking_site.source_uid = static_parking_site.source_uid '
+            'AND realtime_parking_site.uid = static_parking_site.uid'
+        )
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+        query += ' ORDER BY static_parking_site.source_uid, static_parking_site.rowid'
+
+        parking_sites: list[dict] = []
+        for parking_site_source_uid, static_data, realtime_data in self._get_connection().execute(query, parameters):
+            parking_site = json.loads(static_data)
+            if realtime_data is not None:
+                parking_site.update(json.loads(realtime_data))
+            parking_site['source_uid'] = parking_site_source_uid
+            parking_sites.append(parking_site)
+        return parking_sites
+
+    def close(self):
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+        self._local = local()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        connection: Optional[sqlite3.Connection] = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            connection.execute('PRAGMA journal_mode = WAL')
+            # With WAL, NORMAL just risks the last transactions at a power loss, but never corrupts the database
+            connection.execute('PRAGMA synchronous = NORMAL')
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
@@ -0,0 +1,102 @@
+"""
+Copyright 2024 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+import heapq
+from itertools import count
+from random import Random
+from threading import Condition
+from time import monotonic
+from typing import Generic, Hashable, Iterator, Optional, TypeVar
+
+T_Key = TypeVar('T_Key', bound=Hashable)
+
+
+class PollScheduler(Generic[T_Key]):
+    """
+    Priority queue of keys with their next due time, for polling sources on individual intervals in one process. get_next() blocks
+    until the earliest key is due and hands it out, and it's not handed out again until it's rescheduled after its poll. So one key is
+    never polled twice at the same time, and a slow poll delays just its own next run.
+
+    Every interval is randomized by +/- jitter, so sources with the same interval drift apart instead of being polled in bursts.
+    """
+
+    jitter: float
+    _intervals: dict[T_Key, float]
+    _queue: list[tuple[float, int, T_Key]]
+    _sequence: Iterator[int]
+    _random: Random
+    _condition: Condition
+    _closed: bool
+
+    def __init__(self, jitter: float = 0.1, random: Optional[Random] = None):
+        if not 0 <= jitter < 1:
+            raise ValueError('jitter has to be at least 0 and less than 1.')
+
+        self.jitter = jitter
+        self._intervals = {}
+        self._queue = []
+        # Keys don't have to be comparable, so the sequence decides if two keys are due at the same time
+        self._sequence = count()
+        # Jitter just spreads polls, so it does not need a cryptographically secure generator
+        self._random = Random() if random is None else random  # noqa: S311
+        self._condition = Condition()
+        self._closed = False
+
+    def add(self, key: T_Key, interval: float, delay: float = 0):
+        """
+        Adds a key which is polled every interval seconds, starting after delay seconds.
+        """
+        if interval <= 0:
+            raise ValueError('interval has to be greater than 0.')
+
+        with self._condition:
+            self._intervals[key] = interval
+            self._push(key, delay)
+
+    def reschedule(self, key: T_Key, interval: Optional[float] = None):
+        """
+        Schedules the next poll of a key which was handed out by get_next() after its jittered interval. A different interval just
+        applies to this poll, like for retries.
+        """
+        with self._condition:
+            self._push(key, self.get_jittered_interval(self._intervals[key] if interval is None else interval))
+
+    def get_jittered_interval(self, interval: float) -> float:
+        return interval * self._random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def get_startup_delay(self, interval: float) -> float:
+        """
+        Returns a random delay within the jitter range, which spreads the first polls of sources which are added at the same time.
+        """
+        return interval * self._random.uniform(0, self.jitter)
+
+    def get_next(self, timeout: Optional[float] = None) -> Optional[T_Key]:
+        """
+        Blocks until the earliest key is due and returns it. Returns None if the scheduler was closed or the timeout passed.
+        """
+        deadline = None if timeout is None else monotonic() + timeout
+        with self._condition:
+            while not self._closed:
+                now = monotonic()
+                if self._queue and self._queue[0][0] <= now:
+                    return heapq.heappop(self._queue)[2]
+
+                # Wait until the earliest key is due, or until a new key is added or the scheduler is closed
+                wait_until = self._queue[0][0] if self._queue else None
+                if deadline is not None:
+                    if deadline <= now:
+                        return None
+                    wait_until = deadline if wait_until is None else min(wait_until, deadline)
+                self._condition.wait(None if wait_until is None else wait_until - now)
+            return None
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def _push(self, key: T_Key, delay: float):
+        heapq.heappush(self._queue, (monotonic() + delay, next(self._sequence), key))
+        self._condition.notify_all()
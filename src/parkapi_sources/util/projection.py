@@ -0,0 +1,55 @@
+"""
+Copyright 2024 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+from threading import Lock
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pyproj import Transformer
+
+
+# UTM zone 32N coordinates on the WGS84 ellipsoid, as used by most sources in Baden-Württemberg
+UTM_32N_CRS: str = '+proj=utm +zone=32 +ellps=WGS84 +units=m +no_defs +type=crs'
+# Longitude and latitude on the WGS84 ellipsoid, which is the inverse of UTM_32N_CRS without any datum shift
+WGS84_LON_LAT_CRS: str = '+proj=longlat +ellps=WGS84 +no_defs +type=crs'
+
+
+_transformers: dict[tuple[str, str], 'Transformer'] = {}
+_transformers_lock: Lock = Lock()
+
+
+def get_transformer(source_crs: str, target_crs: str) -> 'Transformer':
+    """
+    Returns a shared always_xy Transformer for a CRS pair. Transformers are created at first use, because looking up CRS in the PROJ
+    database is expensive, and then re-used by all converters. pyproj Transformers keep their PROJ objects per thread, so a shared
+    Transformer can be used from multiple threads.
+    """
+    transformer = _transformers.get((source_crs, target_crs))
+    if transformer is not None:
+        return transformer
+
+    with _transformers_lock:
+        transformer = _transformers.get((source_crs, target_crs))
+        if transformer is None:
+            # pyproj is imported here, so importing a converter does not load PROJ
+            from pyproj import Transformer
+
+            transformer = Transformer.from_crs(source_crs, target_crs, always_xy=True)
+            _transformers[(source_crs, target_crs)] = transformer
+
+    return transformer
+
+
+def transform_coordinates(source_crs: str, target_crs: str, coordinates: list[tuple[float, float]]) -> list[tuple[float, float]]:
+    """
+    Transforms (x, y) coordinates in one pyproj call for all coordinates of an import, as the overhead of single pyproj calls from
+    Python is much higher than the transformation itself. The results are identical to single calls.
+    """
+    if len(coordinates) == 0:
+        return []
+
+    xs, ys = zip(*coordinates, strict=True)
+    transformed_xs, transformed_ys = get_transformer(source_crs, target_crs).transform(list(xs), list(ys))
+    return list(zip(transformed_xs, transformed_ys, strict=True))
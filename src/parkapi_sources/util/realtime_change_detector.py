@@ -0,0 +1,85 @@
+"""
+Copyright 2024 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+from dataclasses import fields
+from operator import attrgetter
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Iterable, Optional, TypeVar
+
+T_Input = TypeVar('T_Input')
+
+
+class RealtimeChangeDetector:
+    """
+    Filters realtime inputs down to the parking sites whose values changed since the last poll of their source. Per (source_uid, uid),
+    just a hash of the realtime values is kept. Fields in ignored_field_names are left out: the uid is the key anyway, and
+    realtime_data_updated_at changes at many sources with every poll, even if nothing else did.
+
+    With heartbeat_interval set, all parking sites of a source are passed again as soon as the last full output of the source is older
+    than heartbeat_interval seconds, so consumers can recover from lost updates. The first poll of a source is always a full output.
+    """
+
+    ignored_field_names: tuple[str, ...] = ('uid', 'realtime_data_updated_at')
+
+    heartbeat_interval: Optional[float]
+    _fingerprints_by_source_uid: dict[str, dict[str, int]]
+    _heartbeat_at_by_source_uid: dict[str, float]
+    _value_getters_by_class: dict[type, Callable[[Any], tuple]]
+    _lock: Lock
+
+    def __init__(self, heartbeat_interval: Optional[float] = 60 * 60):
+        self.heartbeat_interval = heartbeat_interval
+        self._fingerprints_by_source_uid = {}
+        self._heartbeat_at_by_source_uid = {}
+        self._value_getters_by_class = {}
+        self._lock = Lock()
+
+    def filter_changed(self, source_uid: str, realtime_parking_site_inputs: Iterable[T_Input]) -> list[T_Input]:
+        """
+        Returns the changed inputs of a poll. All inputs of the poll have to be passed: fingerprints of parking sites which are not part
+        of it are dropped, so they count as changed as soon as they are back.
+        """
+        now = monotonic()
+        with self._lock:
+            last_fingerprints = self._fingerprints_by_source_uid.get(source_uid, {})
+            heartbeat_at = self._heartbeat_at_by_source_uid.get(source_uid)
+            is_heartbeat = heartbeat_at is None or (self.heartbeat_interval is not None and now - heartbeat_at >= self.heartbeat_interval)
+
+        fingerprints: dict[str, int] = {}
+        changed_parking_site_inputs: list[T_Input] = []
+        for realtime_parking_site_input in realtime_parking_site_inputs:
+            fingerprint = hash(self._get_value_getter(type(realtime_parking_site_input))(realtime_parking_site_input))
+            fingerprints[realtime_parking_site_input.uid] = fingerprint  # type: ignore
+            if is_heartbeat or last_fingerprints.get(realtime_parking_site_input.uid) != fingerprint:  # type: ignore
+                changed_parking_site_inputs.append(realtime_parking_site_input)
+
+        with self._lock:
+            self._fingerprints_by_source_uid[source_uid] = fingerprints
+            if is_heartbeat:
+                self._heartbeat_at_by_source_uid[source_uid] = now
+
+        return changed_parking_site_inputs
+
+    def reset(self, source_uid: Optional[str] = None):
+        """
+        Drops the fingerprints of one or all sources, so their next poll is a full output.
+        """
+        with self._lock:
+            if source_uid is None:
+                self._fingerprints_by_source_uid.clear()
+                self._heartbeat_at_by_source_uid.clear()
+            else:
+                self._fingerprints_by_source_uid.pop(source_uid, None)
+                self._heartbeat_at_by_source_uid.pop(source_uid, None)
+
+    def _get_value_getter(self, input_class: type) -> Callable[[Any], tuple]:
+        value_getter = self._value_getters_by_class.get(input_class)
+        if value_getter is None:
+            field_names = [field.name for field in fields(input_class) if field.name not in self.ignored_field_names]
+            # attrgetter with a single name returns the value instead of a tuple, which hashes just as well
+            value_getter = attrgetter(*field_names)
+            self._value_getters_by_class[input_class] = value_getter
+        return value_getter
@@ -0,0 +1,71 @@
+"""
+Copyright 2024 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+from threading import Lock
+from typing import Optional
+
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry, make_headers
+
+
+class RequestHelper:
+    """
+    Provides one pooled HTTP session which is shared by all converters, so connections (and TLS handshakes) to the same host are
+    re-used across requests. The session is created at the first request, so converters which never do any request don't pay for it.
+    """
+
+    pool_maxsize: int
+    retries: int
+    backoff_factor: float
+    retry_status_codes: tuple[int, ...] = (429, 500, 502, 503, 504)
+
+    _session: Optional[Session] = None
+    _session_lock: Lock
+
+    def __init__(self, pool_maxsize: int = 10, retries: int = 3, backoff_factor: float = 0.5):
+        self.pool_maxsize = pool_maxsize
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self._session_lock = Lock()
+
+    @property
+    def session(self) -> Session:
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+
+    def _create_session(self) -> Session:
+        session = Session()
+
+        # Retries just apply to idempotent methods, as urllib3 excludes POST per default
+        retry = Retry(
+            total=self.retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=self.retry_status_codes,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=self.pool_maxsize, pool_maxsize=self.pool_maxsize, max_retries=retry)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+
+        # make_headers adds brotli and zstd as soon as urllib3 is able to decode them
+        session.headers.update(make_headers(accept_encoding=True))
+
+        return session
+
+    def get(self, url: str, **kwargs) -> Response:
+        return self.session.get(url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> Response:
+        return self.session.post(url, **kwargs)
+
+    def close(self):
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
@@ -0,0 +1,45 @@
+"""
+Copyright 2024 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+from operator import itemgetter
+from typing import Any, Callable, Sequence
+
+
+class RowMapper:
+    """
+    Maps rows of tabular data like CSV or XLSX to dicts. It's compiled once from a mapping of target fields to column indices, so
+    mapping a row is a single itemgetter call over all columns, zipped with a fixed tuple of field names.
+    """
+
+    fields: tuple[str, ...]
+    indices: tuple[int, ...]
+    _get_values: Callable[[Sequence[Any]], tuple[Any, ...]]
+
+    def __init__(self, mapping: dict[str, int]):
+        self.fields = tuple(mapping.keys())
+        self.indices = tuple(mapping.values())
+
+        if len(self.indices) == 1:
+            # itemgetter with a single index returns the value instead of a tuple
+            index = self.indices[0]
+            self._get_values = lambda row: (row[index],)
+        elif len(self.indices) == 0:
+            self._get_values = lambda row: ()
+        else:
+            self._get_values = itemgetter(*self.indices)
+
+    @staticmethod
+    def get_column_indices(header_row: Sequence[Any]) -> dict[Any, int]:
+        """
+        Returns the index of each header column in one pass. Like list.index(), the first column wins if a header is duplicated.
+        """
+        column_indices: dict[Any, int] = {}
+        for index, header in enumerate(header_row):
+            column_indices.setdefault(header, index)
+        return column_indices
+
+    def map(self, row: Sequence[Any]) -> dict[str, Any]:
+        # fields and values have the same length by construction, and a strict zip is measurably slower for every row
+        return dict(zip(self.fields, self._get_values(row)))  # noqa: B905
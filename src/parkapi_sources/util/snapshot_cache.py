@@ -0,0 +1,47 @@
+"""
+Copyright 2024 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Hashable
+
+
+class SnapshotCache:
+    """
+    Small TTL cache for downloaded and validated source data. It is used by pull converters which need the same document for static and
+    realtime data, so one run of both costs just one download and one validation pass.
+    """
+
+    ttl: float
+    _items: dict[Hashable, tuple[float, Any]]
+    _key_locks: dict[Hashable, Lock]
+    _lock: Lock
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._items = {}
+        self._key_locks = {}
+        self._lock = Lock()
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        # The global lock just guards the lock dict, loading is locked per key, so parallel calls for the same converter download once
+        # without blocking other converters
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, Lock())
+
+        with key_lock:
+            now = monotonic()
+            cached_item = self._items.get(key)
+            if cached_item is not None and cached_item[0] > now:
+                return cached_item[1]
+
+            # If the loader raises an exception, nothing gets cached
+            value = loader()
+            self._items[key] = (now + self.ttl, value)
+            return value
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
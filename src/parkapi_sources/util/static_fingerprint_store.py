@@ -0,0 +1,122 @@
+"""
+Copyright 2024 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+import json
+from datetime import datetime
+from hashlib import sha256
+from pathlib import Path
+from threading import Lock
+from typing import Any, Iterable, Optional, TypeVar
+
+from validataclass.helpers import UnsetValue
+
+from .parking_site_serializer import ParkingSiteSerializer
+
+T_Input = TypeVar('T_Input')
+
+
+class StaticFingerprintStore:
+    """
+    Keeps a content hash of every static parking site per source, without volatile fields like static_data_updated_at, which most
+    converters set to the current time. If the content of a parking site did not change since the import which stored its hash,
+    update() sets static_data_updated_at back to the time of that import, so it just moves if the data actually changes.
+
+    With a directory, fingerprints are persisted in one JSON file per source, so they survive restarts. Without, they are kept in
+    memory only.
+    """
+
+    ignored_field_names: tuple[str, ...] = ('static_data_updated_at',)
+
+    directory: Optional[Path]
+    _fingerprints_by_source_uid: dict[str, dict[str, tuple[str, Optional[str]]]]
+    _serializer: ParkingSiteSerializer
+    _lock: Lock
+
+    def __init__(self, directory: Optional[Path] = None):
+        self.directory = directory
+        self._fingerprints_by_source_uid = {}
+        self._serializer = ParkingSiteSerializer()
+        self._lock = Lock()
+
+    def get_content_hash(self, static_parking_site_input: Any) -> str:
+        parking_site_dict = self._serializer.to_dict(static_parking_site_input)
+        for field_name in self.ignored_field_names:
+            parking_site_dict.pop(field_name, None)
+        # A canonical encoding which does not depend on the JSON backend, so fingerprints stay valid if it changes
+        canonical_json = json.dumps(
+            parking_site_dict,
+            sort_keys=True,
+            separators=(',', ':'),
+            ensure_ascii=False,
+            default=self._serializer.convert_value,
+        )
+        return sha256(canonical_json.encode()).hexdigest()
+
+    def update(self, source_uid: str, static_parking_site_inputs: Iterable[T_Input]) -> list[T_Input]:
+        """
+        Compares all static inputs of an import with the stored fingerprints of their source and returns the new and changed ones.
+        Unchanged inputs get the static_data_updated_at of their stored fingerprint. Fingerprints of parking sites which are not part
+        of the import are dropped.
+        """
+        with self._lock:
+            last_fingerprints = self._get_fingerprints(source_uid)
+
+        fingerprints: dict[str, tuple[str, Optional[str]]] = {}
+        changed_static_parking_site_inputs: list[T_Input] = []
+        for static_parking_site_input in static_parking_site_inputs:
+            content_hash = self.get_content_hash(static_parking_site_input)
+            last_fingerprint = last_fingerprints.get(static_parking_site_input.uid)  # type: ignore
+
+            if last_fingerprint is not None and last_fingerprint[0] == content_hash:
+                fingerprints[static_parking_site_input.uid] = last_fingerprint  # type: ignore
+                if last_fingerprint[1] is not None:
+                    static_parking_site_input.static_data_updated_at = datetime.fromisoformat(last_fingerprint[1])  # type: ignore
+                continue
+
+            static_data_updated_at = static_parking_site_input.static_data_updated_at  # type: ignore
+            fingerprints[static_parking_site_input.uid] = (  # type: ignore
+                content_hash,
+                None if static_data_updated_at is UnsetValue or static_data_updated_at is None else static_data_updated_at.isoformat(),
+            )
+            changed_static_parking_site_inputs.append(static_parking_site_input)
+
+        if fingerprints != last_fingerprints:
+            with self._lock:
+                self._fingerprints_by_source_uid[source_uid] = fingerprints
+                self._save_fingerprints(source_uid, fingerprints)
+
+        return changed_static_parking_site_inputs
+
+    def _get_fingerprints(self, source_uid: str) -> dict[str, tuple[str, Optional[str]]]:
+        fingerprints = self._fingerprints_by_source_uid.get(source_uid)
+        if fingerprints is not None:
+            return fingerprints
+
+        fingerprints = {}
+        if self.directory is not None:
+            fingerprint_path = Path(self.directory, f'{source_uid}.json')
+            try:
+                with fingerprint_path.open() as fingerprint_file:
+                    fingerprints = {
+                        uid: (content_hash, updated_at) for uid, (content_hash, updated_at) in json.load(fingerprint_file).items()
+                    }
+            except FileNotFoundError:
+                pass
+            except (ValueError, TypeError):
+                # Broken fingerprints just mean that all parking sites count as changed once
+                fingerprints = {}
+
+        self._fingerprints_by_source_uid[source_uid] = fingerprints
+        return fingerprints
+
+    def _save_fingerprints(self, source_uid: str, fingerprints: dict[str, tuple[str, Optional[str]]]):
+        if self.directory is None:
+            return
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first, so readers never see a half-written file
+        temporary_path = Path(self.directory, f'{source_uid}.json.tmp')
+        temporary_path.write_text(json.dumps(fingerprints))
+        temporary_path.replace(Path(self.directory, f'{source_uid}.json'))
@@ -3,11 +3,144 @@ Copyright 2023 binary butterfly GmbH
 Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
 """
 
-from collections import defaultdict
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Tuple
 
 from lxml import etree
 
+XSI_NAMESPACE_PREFIX: str = '{http://www.w3.org/2001/XMLSchema-instance}'
+
+
+class XMLToDictConverter:
+    """
+    Converts XML elements to dicts like XMLHelper.xml_to_dict(), with the options compiled once into sets. Elements are traversed with
+    an explicit stack instead of recursion, and local names are cached per tag. See XMLHelper.xml_to_dict() for the options.
+    """
+
+    ensure_array_keys: frozenset[Tuple[str, str]]
+    remote_type_tags: frozenset[str]
+    conditional_remote_type_tags: frozenset[Tuple[str, str]]
+    ignore_attributes: frozenset[str]
+    _localnames: dict[str, str]
+
+    def __init__(
+        self,
+        ensure_array_keys: Optional[Iterable[Tuple[str, str]]] = None,
+        remote_type_tags: Optional[Iterable[str]] = None,
+        conditional_remote_type_tags: Optional[Iterable[Tuple[str, str]]] = None,
+        ignore_attributes: Optional[Iterable[str]] = None,
+    ):
+        self.ensure_array_keys = frozenset(ensure_array_keys or ())
+        self.remote_type_tags = frozenset(remote_type_tags or ())
+        self.conditional_remote_type_tags = frozenset(conditional_remote_type_tags or ())
+        self.ignore_attributes = frozenset(ignore_attributes or ())
+        self._localnames = {}
+
+    def convert(self, tag: etree.Element) -> dict:
+        # Every stack entry is an element, its local name, an iterator over its children and the aggregated dicts of its children
+        stack: list[tuple[etree.Element, str, Iterator[etree.Element], dict[str, list]]] = [
+            (tag, self._get_localname(tag), iter(tag), {}),
+        ]
+        while True:
+            element, tag_name, children, aggregated_child_dict = stack[-1]
+            child = next(children, None)
+            if child is not None:
+                # Leaf elements, which are most of the elements, are converted right away instead of getting their own stack entry
+                if len(child) > 0:
+                    stack.append((child, self._get_localname(child), iter(child), {}))
+                    continue
+                tag_dict = self._build_tag_dict(child, self._get_localname(child), None)
+            else:
+                stack.pop()
+                tag_dict = self._build_tag_dict(element, tag_name, aggregated_child_dict if len(element) > 0 else None)
+                if not stack:
+                    return tag_dict
+                aggregated_child_dict = stack[-1][3]
+
+            for key, value in tag_dict.items():
+                values = aggregated_child_dict.get(key)
+                if values is None:
+                    aggregated_child_dict[key] = [value]
+                else:
+                    values.append(value)
+
+    def _get_localname(self, element: etree.Element) -> str:
+        localname = self._localnames.get(element.tag)
+        if localname is None:
+            localname = etree.QName(element).localname
+            self._localnames[element.tag] = localname
+        return localname
+
+    def _build_tag_dict(self, element: etree.Element, tag_name: str, aggregated_child_dict: Optional[dict[str, list]]) -> dict:
+        # aggregated_child_dict is None for elements without children
+        has_children = aggregated_child_dict is not None
+
+        # only parse attributes if there are any of them not in the ignore list
+        attributes: list[tuple[str, str]] = element.items()
+        if attributes and self.ignore_attributes:
+            attributes = [(key, value) for key, value in attributes if key not in self.ignore_attributes]
+
+        tag_value: dict | str | None = None
+        if has_children:
+            tag_value = {}
+            for key, values in aggregated_child_dict.items():
+                if key == 'class':
+                    key = 'class_'
+                tag_value[key] = values[0] if len(values) == 1 and (tag_name, key) not in self.ensure_array_keys else values
+        elif attributes:
+            tag_value = {}
+
+        for key, value in attributes:
+            tag_value[key.replace(XSI_NAMESPACE_PREFIX, '')] = value
+
+        if element.text:
+            text = element.text.strip()
+            if has_children or attributes:
+                if text:
+                    tag_value['_text'] = text
+            else:
+                tag_value = text
+
+        if isinstance(tag_value, dict):
+            # filter out remote type tags at the child level, it only works if there is exactly one key-value-pair at the child level!
+            if len(tag_value) == 1:
+                child_key, child_value = next(iter(tag_value.items()))
+                if child_key in self.remote_type_tags or (tag_name, child_key) in self.conditional_remote_type_tags:
+                    tag_value = child_value
+
+            # finally, filter out remote type tags at the top level, the return value still has to be a dict!
+            if isinstance(tag_value, dict) and tag_name in self.remote_type_tags:
+                return tag_value
+
+        return {tag_name: tag_value}
+
+
+@lru_cache(maxsize=64)
+def _get_cached_xml_to_dict_converter(
+    ensure_array_keys: Tuple[Tuple[str, str], ...],
+    remote_type_tags: Tuple[str, ...],
+    conditional_remote_type_tags: Tuple[Tuple[str, str], ...],
+    ignore_attributes: Tuple[str, ...],
+) -> XMLToDictConverter:
+    return XMLToDictConverter(ensure_array_keys, remote_type_tags, conditional_remote_type_tags, ignore_attributes)
+
+
+def get_xml_to_dict_converter(
+    ensure_array_keys: Optional[Iterable[Tuple[str, str]]] = None,
+    remote_type_tags: Optional[Iterable[str]] = None,
+    conditional_remote_type_tags: Optional[Iterable[Tuple[str, str]]] = None,
+    ignore_attributes: Optional[Iterable[str]] = None,
+) -> XMLToDictConverter:
+    """
+    Returns a shared XMLToDictConverter for the given options, so XMLHelper.xml_to_dict() does not compile them on every call.
+    """
+    return _get_cached_xml_to_dict_converter(
+        tuple(ensure_array_keys or ()),
+        tuple(remote_type_tags or ()),
+        tuple(conditional_remote_type_tags or ()),
+        tuple(ignore_attributes or ()),
+    )
+
 
 class XMLHelper:
     """
@@ -183,79 +316,15 @@ class XMLHelper:
 
         'resultDescription': None
 
+        The conversion itself is done by a cached XMLToDictConverter for the given options. Converters which are called often can
+        also use an XMLToDictConverter directly.
         """
-        # default empty lists for the optional arguments:
-        if ensure_array_keys is None:
-            ensure_array_keys = []
-        if remote_type_tags is None:
-            remote_type_tags = []
-        if conditional_remote_type_tags is None:
-            conditional_remote_type_tags = []
-        if ignore_attributes is None:
-            ignore_attributes = []
-
-        tag_name = etree.QName(tag).localname
-
-        # only parse attributes if there are any of them not in the ignore list
-        ignore_all_attribs: bool = False
-        if tag.attrib:
-            ignore_all_attribs = True
-            for key in tag.attrib.keys():
-                if key not in ignore_attributes:
-                    ignore_all_attribs = False
-
-        tag_dict = {tag_name: {} if (tag.attrib and not ignore_all_attribs) else None}
-        children = list(tag)
-        if children:
-            aggregated_child_dict = defaultdict(list)
-            for child in children:
-                child_dict = XMLHelper.xml_to_dict(
-                    child,
-                    ensure_array_keys,
-                    remote_type_tags,
-                    conditional_remote_type_tags,
-                    ignore_attributes,
-                )
-                for key, value in child_dict.items():
-                    aggregated_child_dict[key].append(value)
-            tag_dict = {tag_name: {}}
-            for key, value in aggregated_child_dict.items():
-                if key == 'class':
-                    key = 'class_'
-                if len(value) == 1 and (tag_name, key) not in ensure_array_keys:
-                    value = value[0]
-                tag_dict[tag_name][key] = value
-
-        if tag.attrib and not ignore_all_attribs:
-            for key, value in tag.attrib.items():
-                if key not in ignore_attributes:
-                    tag_dict[tag_name][key.replace('{http://www.w3.org/2001/XMLSchema-instance}', '')] = value
-
-        if tag.text:
-            text = tag.text.strip()
-            if children or (tag.attrib and not ignore_all_attribs):
-                if text:
-                    tag_dict[tag_name]['_text'] = text
-            else:
-                tag_dict[tag_name] = text
-
-        # filter out remote type tags at the child level:
-        if isinstance(tag_dict[tag_name], dict):
-            tag_items: list[tuple[str, str]] = [(key, value) for key, value in tag_dict[tag_name].items()]  # noqa: C416
-            # it only works if there is exactly one key-value-pair at the child level!
-            if len(tag_items) == 1:
-                child_key = tag_items[0][0]
-                child_value = tag_items[0][1]
-                # filter second level:
-                if child_key in remote_type_tags or (tag_name, child_key) in conditional_remote_type_tags:
-                    tag_dict[tag_name] = child_value
-
-        # finally, filter out remote type tags at the top level:
-        if isinstance(tag_dict[tag_name], dict) and tag_name in remote_type_tags:
-            # the return value still has to be a dict!
-            tag_dict = tag_dict[tag_name]
-
-        return tag_dict
+        return get_xml_to_dict_converter(
+            ensure_array_keys=ensure_array_keys,
+            remote_type_tags=remote_type_tags,
+            conditional_remote_type_tags=conditional_remote_type_tags,
+            ignore_attributes=ignore_attributes,
+        ).convert(tag)
 
     @staticmethod
     def xml_string_to_dict(
@@ -277,3 +346,46 @@ class XMLHelper:
             ignore_attributes,
         )
         return result_dict
+
+    @staticmethod
+    def iter_elements(root: etree.Element, element_paths: Iterable[Tuple[str, str]]) -> Iterator[etree.Element]:
+        """
+        Yields all elements below root which match one of the (parent tag, tag) pairs in element_paths. Tags are local names, so
+        namespaces are ignored.
+        """
+        element_paths = set(element_paths)
+        for element in root.iter(*{f'{{*}}{tag_name}' for _, tag_name in element_paths}):
+            if XMLHelper._matches_element_path(element, element_paths):
+                yield element
+
+    @staticmethod
+    def iterparse_elements(source: str | BinaryIO, element_paths: Iterable[Tuple[str, str]]) -> Iterator[etree.Element]:
+        """
+        Parses XML from a file path or a binary file object incrementally and yields the same elements as iter_elements() as soon as
+        they are complete. Yielded elements and everything before them are removed from the tree when the next element is requested,
+        so memory usage does not grow with the size of the document. Elements must therefore be converted before iterating further.
+        """
+        element_paths = set(element_paths)
+        for _, element in etree.iterparse(  # noqa: S320
+            source,
+            events=('end',),
+            tag=[f'{{*}}{tag_name}' for tag_name in {tag_name for _, tag_name in element_paths}],
+            resolve_entities=False,
+        ):
+            # Nested elements with the same tag name end before their parent and have to stay in the tree
+            if not XMLHelper._matches_element_path(element, element_paths):
+                continue
+
+            yield element
+
+            element.clear(keep_tail=True)
+            parent = element.getparent()
+            while element.getprevious() is not None:
+                del parent[0]
+
+    @staticmethod
+    def _matches_element_path(element: etree.Element, element_paths: set[Tuple[str, str]]) -> bool:
+        parent = element.getparent()
+        if parent is None:
+            return False
+        return (etree.QName(parent).localname, etree.QName(element).localname) in element_paths
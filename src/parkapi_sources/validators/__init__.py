@@ -4,6 +4,7 @@ Use of this source code is governed by an MIT-style license that can be found in
 """
 
 from .boolean_validators import MappedBooleanValidator
+from .compiled_dataclass_validator import CompiledDataclassValidator
 from .date_validator import ParsedDateValidator
 from .datetime_validator import Rfc1123DateTimeValidator, SpacedDateTimeValidator, TimestampDateTimeValidator
 from .decimal_validators import GermanDecimalValidator
@@ -0,0 +1,173 @@
+"""
+Copyright 2024 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+from copy import deepcopy
+from enum import Enum
+from typing import Any, Callable, Optional, Type
+
+from validataclass.dataclasses import Default
+from validataclass.exceptions import (
+    DataclassPostValidationError,
+    DictFieldsValidationError,
+    DictInvalidKeyTypeError,
+    DictRequiredFieldError,
+    InvalidTypeError,
+    ListItemsValidationError,
+    ListLengthError,
+    ValidationError,
+)
+from validataclass.validators import DataclassValidator, ListValidator, Noneable, Validator
+from validataclass.validators.dataclass_validator import T_Dataclass
+
+# Values which deepcopy() returns as they are, so defaults of these types don't need to be copied
+IMMUTABLE_TYPES: tuple[type, ...] = (type(None), bool, int, float, str, Enum)
+
+
+class CompiledDataclassValidator(DataclassValidator[T_Dataclass]):
+    """
+    Drop-in replacement for DataclassValidator which gives the same results and errors, but is much faster for validating many
+    objects of the same dataclass.
+
+    DataclassValidator calls every field validator with validate_with_context(), which inspects the signature of the validate()
+    method on every call, and so do wrapping validators like Noneable and ListValidator for their inner validators. Without context
+    arguments, this always ends up in validate(input_data), so this validator resolves a validate function per field once: Noneable,
+    ListValidator and DataclassValidator are compiled to closures over their compiled inner validators, all other validators are
+    called with validate() directly. Defaults which don't need to be copied are resolved once as well.
+
+    Calls with context arguments and dataclasses with __pre_validate__() or __post_validate__() use the generic DataclassValidator.
+    """
+
+    _field_validate_functions: dict[str, Callable[[Any], Any]]
+    _field_default_functions: dict[str, Callable[[], Any]]
+    _use_generic_validate: bool
+
+    def __init__(self, dataclass_cls: Optional[Type[T_Dataclass]] = None):
+        super().__init__(dataclass_cls)
+
+        self._field_validate_functions = {
+            field_name: compile_validate_function(field_validator) for field_name, field_validator in self.field_validators.items()
+        }
+        self._field_default_functions = {
+            field_name: compile_default_function(field_default) for field_name, field_default in self.field_defaults.items()
+        }
+        self._use_generic_validate = hasattr(self.dataclass_cls, '__pre_validate__') or hasattr(self.dataclass_cls, '__post_validate__')
+
+    def validate(self, input_data: Any, **kwargs: Any) -> T_Dataclass:
+        if kwargs or self._use_generic_validate:
+            return super().validate(input_data, **kwargs)
+
+        self._ensure_type(input_data, dict)
+
+        for key in input_data.keys():
+            if type(key) is not str:
+                raise DictInvalidKeyTypeError()
+
+        field_errors: dict[str, ValidationError] = {}
+        validated_dict: dict[str, Any] = {}
+
+        for field_name in self.required_fields:
+            if field_name not in input_data:
+                field_errors[field_name] = DictRequiredFieldError()
+
+        field_validate_functions = self._field_validate_functions
+        for key, value in input_data.items():
+            # Like DataclassValidator, unknown fields are ignored
+            validate_function = field_validate_functions.get(key)
+            if validate_function is None:
+                continue
+
+            try:
+                validated_dict[key] = validate_function(value)
+            except ValidationError as error:
+                field_errors[key] = error
+
+        if field_errors:
+            raise DictFieldsValidationError(field_errors=field_errors)
+
+        for field_name, default_function in self._field_default_functions.items():
+            if field_name not in validated_dict:
+                validated_dict[field_name] = default_function()
+
+        try:
+            return self.dataclass_cls(**validated_dict)
+        except DataclassPostValidationError as error:
+            raise error
+        except ValidationError as error:
+            raise DataclassPostValidationError(error=error) from error
+
+
+def compile_validate_function(validator: Validator) -> Callable[[Any], Any]:
+    """
+    Returns a function which validates a value like validator.validate_with_context() without context arguments. Subclasses of the
+    compiled validator types might change their behaviour, so just exact types are compiled.
+    """
+    validator_type = type(validator)
+    if validator_type is Noneable:
+        return _compile_noneable(validator)
+    if validator_type is ListValidator:
+        return _compile_list_validator(validator)
+    if validator_type is DataclassValidator:
+        return CompiledDataclassValidator(validator.dataclass_cls).validate
+    return validator.validate
+
+
+def compile_default_function(default: Default) -> Callable[[], Any]:
+    if type(default) is Default and isinstance(default.value, IMMUTABLE_TYPES):
+        value = default.value
+        return lambda: value
+    return default.get_value
+
+
+def _compile_noneable(validator: Noneable) -> Callable[[Any], Any]:
+    wrapped_validate_function = compile_validate_function(validator.wrapped_validator)
+    default_value = validator.default_value
+    copy_default_value = not isinstance(default_value, IMMUTABLE_TYPES)
+
+    def validate_noneable(input_data: Any) -> Any:
+        if input_data is None:
+            return deepcopy(default_value) if copy_default_value else default_value
+
+        try:
+            return wrapped_validate_function(input_data)
+        except InvalidTypeError as error:
+            error.add_expected_type(type(None))
+            raise error
+
+    return validate_noneable
+
+
+def _compile_list_validator(validator: ListValidator) -> Callable[[Any], Any]:
+    item_validate_function = compile_validate_function(validator.item_validator)
+    min_length = validator.min_length
+    max_length = validator.max_length
+    discard_invalid = validator.discard_invalid
+
+    def validate_list(input_data: Any) -> list:
+        validator._ensure_type(input_data, list)
+
+        if min_length is not None and len(input_data) < min_length:
+            raise ListLengthError(min_length=min_length, max_length=max_length)
+
+        if max_length is not None and len(input_data) > max_length:
+            raise ListLengthError(min_length=min_length, max_length=max_length)
+
+        validated_list = []
+        validation_errors = {}
+
+        for index, item in enumerate(input_data):
+            try:
+                validated_list.append(item_validate_function(item))
+            except ValidationError as error:
+                validation_errors[index] = error
+
+        if discard_invalid:
+            if min_length is not None and len(validated_list) < min_length:
+                raise ListLengthError(min_length=min_length, max_length=max_length)
+        elif validation_errors:
+            raise ListItemsValidationError(item_errors=validation_errors)
+
+        return validated_list
+
+    return validate_list
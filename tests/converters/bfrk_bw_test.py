@@ -30,6 +30,19 @@ class BfrkCarPullConverterTest:
 
         validate_static_parking_site_inputs(static_parking_site_inputs)
 
+    @staticmethod
+    def test_iter_csv_string(bfrk_car_push_converter: BfrkBwSpnvCarPushConverter):
+        # The file is read line by line while results are yielded
+        with get_data_path('bfrk_bw_car.csv').open() as bfrk_car_file:
+            results = bfrk_car_push_converter.iter_csv_string(bfrk_car_file)
+            first_result = next(results)
+            static_parking_site_inputs, import_parking_site_exceptions = bfrk_car_push_converter.split_results(results)
+
+        assert len(static_parking_site_inputs) + 1 == 1555
+        assert len(import_parking_site_exceptions) == 0
+
+        validate_static_parking_site_inputs([first_result, *static_parking_site_inputs])
+
 
 @pytest.fixture
 def bfrk_bike_push_converter(mocked_config_helper: Mock) -> BfrkBwSpnvBikePushConverter:
@@ -3,9 +3,13 @@ Copyright 2024 binary butterfly GmbH
 Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
 """
 
+from typing import Any, Optional
 from unittest.mock import Mock
 
 import pytest
+from parkapi_sources.validators import CompiledDataclassValidator
+from validataclass.exceptions import ValidationError
+from validataclass.validators import DataclassValidator
 
 
 @pytest.fixture
@@ -13,3 +17,33 @@ def mocked_static_geojson_config_helper(mocked_config_helper: Mock) -> Mock:
     config = {'STATIC_GEOJSON_BASE_URL': 'https://raw.githubusercontent.com/ParkenDD/parkapi-static-data/main/sources'}
     mocked_config_helper.get.side_effect = lambda key, default=None: config.get(key, default)
     return mocked_config_helper
+
+
+@pytest.fixture(autouse=True)
+def compiled_dataclass_validator_parity(monkeypatch: pytest.MonkeyPatch):
+    """
+    Validates every input of a CompiledDataclassValidator with DataclassValidator as well, so all converter tests check that both give
+    the same results and errors for their fixtures.
+    """
+    compiled_validate = CompiledDataclassValidator.validate
+
+    def get_result(validate_function, input_data: Any, **kwargs: Any) -> tuple[Any, Optional[ValidationError]]:
+        try:
+            return validate_function(input_data, **kwargs), None
+        except ValidationError as error:
+            return None, error
+
+    def validate(self: CompiledDataclassValidator, input_data: Any, **kwargs: Any) -> Any:
+        result, error = get_result(lambda *args, **kw: compiled_validate(self, *args, **kw), input_data, **kwargs)
+        expected_result, expected_error = get_result(
+            lambda *args, **kw: DataclassValidator.validate(self, *args, **kw), input_data, **kwargs
+        )
+
+        assert result == expected_result
+        assert (None if error is None else error.to_dict()) == (None if expected_error is None else expected_error.to_dict())
+
+        if error is not None:
+            raise error
+        return result
+
+    monkeypatch.setattr(CompiledDataclassValidator, 'validate', validate)
@@ -48,3 +48,13 @@ class KarlsruhePullConverterTest:
         assert len(import_parking_site_exceptions) == 4
 
         validate_realtime_parking_site_inputs(realtime_parking_site_inputs)
+
+    @staticmethod
+    def test_get_static_and_realtime_parking_sites_download_once(
+        karlsruhe_pull_converter: KarlsruhePullConverter,
+        requests_mock_karlsruhe: Mocker,
+    ):
+        karlsruhe_pull_converter.get_static_parking_sites()
+        karlsruhe_pull_converter.get_realtime_parking_sites()
+
+        assert requests_mock_karlsruhe.call_count == 1
@@ -33,6 +33,21 @@ def pbw_pull_converter(pbw_config_helper: Mock) -> PbwPullConverter:
     return PbwPullConverter(config_helper=pbw_config_helper)
 
 
+def generate_static_response(request: 'Request', context: 'Context'):
+    request_type = request.qs['type'][0]
+    if request_type == 'catalog-city':
+        filename = 'catalog-city.json'
+    elif request_type == 'object-by-city':
+        filename = f'object-by-city-{request.qs["id"][0]}.json'
+    else:
+        return {}
+    json_path = Path(Path(__file__).parent, 'data', 'pbw', filename)
+    with json_path.open() as json_file:
+        json_data = json_file.read()
+
+    return json.loads(json_data)
+
+
 class PbwPullConverterTest:
     @staticmethod
     def test_get_static_parking_sites(pbw_pull_converter: PbwPullConverter, requests_mock: Mocker):
@@ -62,6 +77,28 @@ class PbwPullConverterTest:
 
         validate_static_parking_site_inputs(static_parking_site_inputs)
 
+    @staticmethod
+    def test_get_static_parking_sites_city_failure(pbw_pull_converter: PbwPullConverter, requests_mock: Mocker):
+        def generate_response(request: 'Request', context: 'Context'):
+            # City 10 has 33 parking sites and fails
+            if request.qs['type'][0] == 'object-by-city' and request.qs['id'][0] == '10':
+                context.status_code = 500
+                return 'Internal Server Error'
+            return json.dumps(generate_static_response(request, context))
+
+        requests_mock.get(
+            'https://www.mypbw.de/api/',
+            text=generate_response,
+        )
+
+        static_parking_site_inputs, import_parking_site_exceptions = pbw_pull_converter.get_static_parking_sites()
+
+        assert len(static_parking_site_inputs) == 65
+        assert len(import_parking_site_exceptions) == 1
+        assert import_parking_site_exceptions[0].parking_site_uid == '10'
+
+        validate_static_parking_site_inputs(static_parking_site_inputs)
+
     @staticmethod
     def test_get_realtime_parking_sites(pbw_pull_converter: PbwPullConverter, requests_mock: Mocker):
         json_path = Path(Path(__file__).parent, 'data', 'pbw', 'object-dynamic-all.json')
@@ -0,0 +1,120 @@
+"""
+Copyright 2024 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+from parkapi_sources.converters.ulm import UlmPullConverter
+from requests import ConnectionError
+from requests_mock import Mocker
+
+from tests.converters.helper import validate_static_parking_site_inputs
+
+GEOJSON_URL = 'https://raw.githubusercontent.com/ParkenDD/parkapi-static-data/main/sources/ulm.geojson'
+GEOJSON_DATA = {
+    'type': 'FeatureCollection',
+    'features': [
+        {
+            'type': 'Feature',
+            'properties': {
+                'uid': 'parkhaus-1',
+                'name': 'Parkhaus 1',
+                'address': 'Teststraße 1, 89073 Ulm',
+                'capacity': 300,
+                'has_realtime_data': True,
+            },
+            'geometry': {'type': 'Point', 'coordinates': [9.99, 48.4]},
+        },
+        {
+            'type': 'Feature',
+            'properties': {'uid': 'broken'},
+            'geometry': {'type': 'Point', 'coordinates': [9.99, 48.4]},
+        },
+    ],
+}
+
+
+@pytest.fixture
+def cached_static_geojson_config_helper(mocked_config_helper: Mock, tmp_path: Path) -> Mock:
+    config = {
+        'STATIC_GEOJSON_BASE_URL': 'https://raw.githubusercontent.com/ParkenDD/parkapi-static-data/main/sources',
+        'STATIC_GEOJSON_CACHE_PATH': str(tmp_path),
+    }
+    mocked_config_helper.get.side_effect = lambda key, default=None: config.get(key, default)
+    return mocked_config_helper
+
+
+@pytest.fixture
+def ulm_pull_converter(cached_static_geojson_config_helper: Mock) -> UlmPullConverter:
+    return UlmPullConverter(config_helper=cached_static_geojson_config_helper)
+
+
+class StaticGeojsonDataMixinTest:
+    @staticmethod
+    def test_get_static_parking_sites_with_last_modified(ulm_pull_converter: UlmPullConverter, requests_mock: Mocker, tmp_path: Path):
+        requests_mock.get(
+            GEOJSON_URL,
+            json=GEOJSON_DATA,
+            headers={'ETag': '"v1"', 'Last-Modified': 'Wed, 05 Jun 2024 10:00:00 GMT'},
+        )
+
+        static_parking_site_inputs, import_parking_site_exceptions = ulm_pull_converter.get_static_parking_sites()
+
+        assert len(static_parking_site_inputs) == 1
+        assert len(import_parking_site_exceptions) == 1
+        assert static_parking_site_inputs[0].static_data_updated_at == datetime(2024, 6, 5, 10, tzinfo=timezone.utc)
+        assert Path(tmp_path, 'ulm.geojson').exists()
+        assert Path(tmp_path, 'ulm.meta.json').exists()
+
+        validate_static_parking_site_inputs(static_parking_site_inputs)
+
+    @staticmethod
+    def test_get_static_parking_sites_not_modified(ulm_pull_converter: UlmPullConverter, requests_mock: Mocker):
+        requests_mock.get(GEOJSON_URL, json=GEOJSON_DATA, headers={'ETag': '"v1"'})
+        ulm_pull_converter.get_static_parking_sites()
+        first_snapshot = ulm_pull_converter._static_geojson_snapshot
+
+        requests_mock.get(GEOJSON_URL, status_code=304)
+        static_parking_site_inputs, import_parking_site_exceptions = ulm_pull_converter.get_static_parking_sites()
+
+        assert requests_mock.last_request.headers['If-None-Match'] == '"v1"'
+        assert len(static_parking_site_inputs) == 1
+        assert len(import_parking_site_exceptions) == 1
+        # Unchanged content is not validated again
+        assert ulm_pull_converter._static_geojson_snapshot is first_snapshot
+
+    @staticmethod
+    def test_get_static_parking_sites_connection_error(ulm_pull_converter: UlmPullConverter, requests_mock: Mocker):
+        requests_mock.get(GEOJSON_URL, json=GEOJSON_DATA, headers={'ETag': '"v1"'})
+        ulm_pull_converter.get_static_parking_sites()
+
+        requests_mock.get(GEOJSON_URL, exc=ConnectionError)
+        static_parking_site_inputs, import_parking_site_exceptions = ulm_pull_converter.get_static_parking_sites()
+
+        assert len(static_parking_site_inputs) == 1
+        assert len(import_parking_site_exceptions) == 1
+
+    @staticmethod
+    def test_get_static_parking_sites_keeps_updated_at(
+        ulm_pull_converter: UlmPullConverter,
+        cached_static_geojson_config_helper: Mock,
+        requests_mock: Mocker,
+    ):
+        requests_mock.get(GEOJSON_URL, json=GEOJSON_DATA)
+        first_static_parking_site_inputs, _ = ulm_pull_converter.get_static_parking_sites()
+
+        # A new converter just has the cache, and the content is downloaded again without Last-Modified
+        other_ulm_pull_converter = UlmPullConverter(config_helper=cached_static_geojson_config_helper)
+        second_static_parking_site_inputs, _ = other_ulm_pull_converter.get_static_parking_sites()
+
+        assert second_static_parking_site_inputs[0].static_data_updated_at == first_static_parking_site_inputs[0].static_data_updated_at
+
+        changed_geojson_data = {**GEOJSON_DATA, 'features': GEOJSON_DATA['features'][:1]}
+        requests_mock.get(GEOJSON_URL, json=changed_geojson_data)
+        third_static_parking_site_inputs, _ = other_ulm_pull_converter.get_static_parking_sites()
+
+        assert third_static_parking_site_inputs[0].static_data_updated_at > first_static_parking_site_inputs[0].static_data_updated_at
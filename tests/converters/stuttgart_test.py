@@ -3,11 +3,14 @@ Copyright 2024 binary butterfly GmbH
 Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
 """
 
+from io import BytesIO
 from unittest.mock import Mock
 
 import pytest
 from lxml import etree
 from parkapi_sources.converters import StuttgartPushConverter
+from parkapi_sources.converters.base_converter.push import XmlConverter
+from parkapi_sources.models import StaticParkingSiteInput
 
 from tests.converters.helper import get_data_path, validate_realtime_parking_site_inputs, validate_static_parking_site_inputs
 
@@ -43,3 +46,38 @@ class StuttgartPullConverterTest:
         ), 'There should be more valid then invalid parking sites'
 
         validate_realtime_parking_site_inputs(realtime_parking_site_inputs)
+
+    @staticmethod
+    @pytest.mark.parametrize('filename', ['stuttgart-static.xml', 'stuttgart-realtime.xml'])
+    def test_handle_xml_file(stuttgart_push_converter: StuttgartPushConverter, filename: str):
+        with get_data_path(filename).open('br') as xml_file:
+            root_element = etree.fromstring(xml_file.read(), parser=etree.XMLParser(resolve_entities=False))  # noqa: S320
+
+        parking_site_inputs, import_parking_site_exceptions = stuttgart_push_converter.handle_xml(root_element)
+
+        with get_data_path(filename).open('br') as xml_file:
+            streamed_parking_site_inputs, streamed_import_parking_site_exceptions = stuttgart_push_converter.handle_xml_file(xml_file)
+
+        assert streamed_parking_site_inputs == parking_site_inputs
+        assert [exception.parking_site_uid for exception in streamed_import_parking_site_exceptions] == [
+            exception.parking_site_uid for exception in import_parking_site_exceptions
+        ]
+
+    @staticmethod
+    def test_handle_xml_file_sources(stuttgart_push_converter: StuttgartPushConverter):
+        file_path = get_data_path('stuttgart-static.xml')
+        # The default implementation of XmlConverter parses the whole tree and passes it to handle_xml()
+        parking_site_inputs, _ = XmlConverter.handle_xml_file(stuttgart_push_converter, file_path)
+
+        assert stuttgart_push_converter.handle_xml_file(file_path)[0] == parking_site_inputs
+        assert stuttgart_push_converter.handle_xml_file(file_path.read_bytes())[0] == parking_site_inputs
+
+    @staticmethod
+    def test_iter_xml_stream_yields_before_end(stuttgart_push_converter: StuttgartPushConverter):
+        xml_data = get_data_path('stuttgart-static.xml').read_bytes()
+        # The first third of the publication is enough to get the first record, the syntax error at its end comes later
+        results = stuttgart_push_converter.iter_xml_stream(BytesIO(xml_data[: len(xml_data) // 3]))
+
+        assert isinstance(next(results), StaticParkingSiteInput)
+        with pytest.raises(etree.XMLSyntaxError):
+            list(results)
@@ -0,0 +1,43 @@
+"""
+Copyright 2024 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+from openpyxl.reader.excel import load_workbook
+from parkapi_sources.converters import EllwangenPushConverter, PumBwPushConverter, VrsParkAndRidePushConverter
+from parkapi_sources.converters.base_converter.push import XlsxConverter
+
+from tests.converters.helper import get_data_path
+
+
+@pytest.mark.parametrize(
+    'converter_class, file_name',
+    [
+        (EllwangenPushConverter, 'ellwangen.xlsx'),
+        (PumBwPushConverter, 'pum_bw.xlsx'),
+        (VrsParkAndRidePushConverter, 'vrs_p_r.xlsx'),
+    ],
+)
+@pytest.mark.parametrize('source_type', ['bytes', 'path', 'file'])
+def test_handle_xlsx_file(mocked_config_helper: Mock, converter_class: type[XlsxConverter], file_name: str, source_type: str):
+    converter = converter_class(config_helper=mocked_config_helper)
+    file_path = get_data_path(file_name)
+
+    # Read-only workbooks have to give the same results as regular workbooks
+    expected_results = converter.handle_xlsx(load_workbook(filename=str(file_path.absolute())))
+    if source_type == 'bytes':
+        results = converter.handle_xlsx_file(file_path.read_bytes())
+    elif source_type == 'path':
+        results = converter.handle_xlsx_file(file_path)
+    else:
+        with file_path.open('rb') as file:
+            results = converter.handle_xlsx_file(file)
+
+    # static_data_updated_at is set at conversion, so it differs between the two runs
+    assert [{**vars(item), 'static_data_updated_at': None} for item in results[0]] == [
+        {**vars(item), 'static_data_updated_at': None} for item in expected_results[0]
+    ]
+    assert [exception.parking_site_uid for exception in results[1]] == [exception.parking_site_uid for exception in expected_results[1]]
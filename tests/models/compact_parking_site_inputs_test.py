@@ -0,0 +1,74 @@
+"""
+Copyright 2024 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+import sys
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+from parkapi_sources.models import (
+    CompactRealtimeParkingSiteInput,
+    CompactStaticParkingSiteInput,
+    RealtimeParkingSiteInput,
+    StaticParkingSiteInput,
+)
+from parkapi_sources.models.enums import ExternalIdentifierType, SupervisionType
+from parkapi_sources.models.parking_site_inputs import ExternalIdentifierInput
+from parkapi_sources.util import ParkingSiteSerializer
+
+
+def get_static_parking_site_input() -> StaticParkingSiteInput:
+    return StaticParkingSiteInput(
+        uid='parking-site',
+        name='Parking Site',
+        operator_name=''.join(['Stadt', 'werke']),
+        lat=Decimal('48.7758'),
+        lon=Decimal('9.1829'),
+        capacity=100,
+        supervision_type=SupervisionType.VIDEO,
+        static_data_updated_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        external_identifiers=[ExternalIdentifierInput(type=ExternalIdentifierType.OSM, value='123')],
+        tags=['tag'],
+    )
+
+
+def test_compact_static_parking_site_input():
+    static_parking_site_input = get_static_parking_site_input()
+
+    compact_input = CompactStaticParkingSiteInput.from_input(static_parking_site_input)
+
+    assert compact_input.to_dict() == static_parking_site_input.to_dict()
+    assert ParkingSiteSerializer().to_dict(compact_input) == ParkingSiteSerializer().to_dict(static_parking_site_input)
+    assert compact_input.to_input() == static_parking_site_input
+    assert compact_input.name == 'Parking Site'
+    assert compact_input.is_supervised is True
+    assert compact_input.operator_name is sys.intern('Stadtwerke')
+    assert not hasattr(compact_input, '__dict__')
+    with pytest.raises(AttributeError):
+        compact_input.unknown_field = 1
+
+
+def test_compact_static_parking_site_input_skips_unset_values():
+    static_parking_site_input = StaticParkingSiteInput(uid='parking-site', name='Parking Site', lat=Decimal('48.7'), lon=Decimal('9.1'))
+
+    compact_input = CompactStaticParkingSiteInput.from_input(static_parking_site_input)
+
+    assert compact_input.to_dict() == static_parking_site_input.to_dict()
+    assert 'operator_name' not in compact_input.to_dict()
+    assert compact_input.is_supervised == static_parking_site_input.is_supervised
+
+
+def test_compact_realtime_parking_site_input():
+    realtime_parking_site_input = RealtimeParkingSiteInput(
+        uid='parking-site',
+        realtime_data_updated_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        realtime_free_capacity=10,
+    )
+
+    compact_input = CompactRealtimeParkingSiteInput.from_input(realtime_parking_site_input)
+
+    assert compact_input.to_dict() == realtime_parking_site_input.to_dict()
+    assert compact_input.to_input() == realtime_parking_site_input
+    assert not hasattr(compact_input, '__dict__')
@@ -0,0 +1,182 @@
+"""
+Copyright 2024 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+from threading import Event, Timer
+
+from parkapi_sources import ParkAPIPoller, ParkAPISources
+from parkapi_sources.converters.base_converter.pull import PullConverter
+from parkapi_sources.exceptions import ImportParkingSiteException
+from parkapi_sources.models import RealtimeParkingSiteInput, SourceInfo, StaticParkingSiteInput
+from parkapi_sources.util import ConfigHelper
+
+
+class ExamplePullConverter(PullConverter):
+    source_info = SourceInfo(uid='example-source', name='Example Source', has_realtime_data=True)
+    free_capacity: int = 10
+
+    def get_static_parking_sites(self) -> tuple[list[StaticParkingSiteInput], list[ImportParkingSiteException]]:
+        static_parking_site_inputs = [
+            StaticParkingSiteInput(
+                uid=uid,
+                name=uid,
+                lat=Decimal('48.7'),
+                lon=Decimal('9.1'),
+                capacity=100,
+                static_data_updated_at=datetime.now(tz=timezone.utc),
+            )
+            for uid in ('1', '2')
+        ]
+        return static_parking_site_inputs, []
+
+    def get_realtime_parking_sites(self) -> tuple[list[RealtimeParkingSiteInput], list[ImportParkingSiteException]]:
+        self.free_capacity -= 1
+        realtime_parking_site_inputs = [
+            RealtimeParkingSiteInput(
+                uid=uid,
+                realtime_data_updated_at=datetime(2024, 6, 1, tzinfo=timezone.utc),
+                realtime_free_capacity=self.free_capacity,
+            )
+            for uid in ('1', 'unknown')
+        ]
+        return realtime_parking_site_inputs, []
+
+
+def get_parkapi_poller(config: dict) -> ParkAPIPoller:
+    parkapi_sources = ParkAPISources(config=config, converter_uids=[])
+    parkapi_sources.converter_by_uid['example-source'] = ExamplePullConverter(ConfigHelper(config=config))
+    return ParkAPIPoller(parkapi_sources)
+
+
+class ParkAPIPollerTest:
+    @staticmethod
+    def test_intervals():
+        parkapi_poller = get_parkapi_poller({'PARK_API_STATIC_INTERVAL': '600', 'PARK_API_REALTIME_INTERVAL_EXAMPLE_SOURCE': '30'})
+
+        assert parkapi_poller.static_interval_by_uid == {'example-source': 600}
+        assert parkapi_poller.realtime_interval_by_uid == {'example-source': 30}
+
+    @staticmethod
+    def test_snapshot_cache_ttl_is_capped_at_realtime_interval():
+        parkapi_poller = get_parkapi_poller({'PARK_API_REALTIME_INTERVAL': '10'})
+
+        assert parkapi_poller.parkapi_sources.converter_by_uid['example-source'].snapshot_cache.ttl == 10
+
+    @staticmethod
+    def test_poll_static_and_realtime():
+        parkapi_poller = get_parkapi_poller({})
+        handled_source_results: list[dict] = []
+        parkapi_poller.result_handlers.append(lambda source_info, source_results: handled_source_results.append(source_results))
+
+        parkapi_poller.poll_static('example-source')
+        parkapi_poller.poll_realtime('example-source')
+        parkapi_poller.poll_static('example-source')
+
+        # The second static poll did not change anything, so it's not passed to the handlers
+        assert len(handled_source_results) == 2
+        assert [realtime_input for _, realtime_input in handled_source_results[0].values()] == [None, None]
+        # Realtime data without static data is ignored, and realtime data is kept on static polls
+        assert list(handled_source_results[1].keys()) == ['1', '2']
+        assert handled_source_results[1]['1'][1].realtime_free_capacity == 9
+        source_results = parkapi_poller.source_results_by_uid['example-source']
+        assert source_results['1'][1].realtime_free_capacity == 9
+        assert source_results['2'][1] is None
+
+    @staticmethod
+    def test_static_data_updated_at_is_kept():
+        parkapi_poller = get_parkapi_poller({})
+
+        parkapi_poller.poll_static('example-source')
+        first_static_input = parkapi_poller.source_results_by_uid['example-source']['1'][0]
+        parkapi_poller.poll_static('example-source')
+        second_static_input = parkapi_poller.source_results_by_uid['example-source']['1'][0]
+
+        assert first_static_input is not second_static_input
+        assert second_static_input.static_data_updated_at == first_static_input.static_data_updated_at
+
+    @staticmethod
+    def test_realtime_change_handlers():
+        parkapi_poller = get_parkapi_poller({})
+        changed_uids: list[list[str]] = []
+        parkapi_poller.realtime_change_handlers.append(
+            lambda source_info, realtime_parking_site_inputs: changed_uids.append([item.uid for item in realtime_parking_site_inputs]),
+        )
+
+        parkapi_poller.poll_static('example-source')
+        parkapi_poller.poll_realtime('example-source')
+        parkapi_poller.poll_realtime('example-source')
+        # Free capacity does not change anymore
+        parkapi_poller.parkapi_sources.converter_by_uid['example-source'].free_capacity += 1
+        parkapi_poller.poll_realtime('example-source')
+
+        assert changed_uids == [['1'], ['1'], []]
+
+    @staticmethod
+    def test_parking_site_store(tmp_path: Path):
+        parkapi_poller = get_parkapi_poller({'PARK_API_PARKING_SITE_STORE_PATH': str(Path(tmp_path, 'parking_sites.db'))})
+
+        parkapi_poller.poll_static('example-source')
+        parkapi_poller.poll_realtime('example-source')
+
+        parking_sites = parkapi_poller.parking_site_store.get_parking_sites(source_uid='example-source')
+        assert [parking_site['uid'] for parking_site in parking_sites] == ['1', '2']
+        assert parking_sites[0]['realtime_free_capacity'] == 9
+        assert 'realtime_free_capacity' not in parking_sites[1]
+
+    @staticmethod
+    def test_parking_site_store_drops_missing_realtime_data(tmp_path: Path):
+        parkapi_poller = get_parkapi_poller({'PARK_API_PARKING_SITE_STORE_PATH': str(Path(tmp_path, 'parking_sites.db'))})
+        converter = parkapi_poller.parkapi_sources.converter_by_uid['example-source']
+
+        parkapi_poller.poll_static('example-source')
+        parkapi_poller.poll_realtime('example-source')
+        # Parking site 1 drops out of the next realtime poll
+        converter.get_realtime_parking_sites = lambda: ([], [])
+        parkapi_poller.poll_realtime('example-source')
+
+        assert parkapi_poller.source_results_by_uid['example-source']['1'][1] is None
+        parking_site = parkapi_poller.parking_site_store.get_parking_site('example-source', '1')
+        assert 'realtime_free_capacity' not in parking_site
+
+    @staticmethod
+    def test_run():
+        parkapi_poller = get_parkapi_poller({'PARK_API_REALTIME_INTERVAL': '0.01'})
+        realtime_polled = Event()
+
+        def handle_source_results(source_info: SourceInfo, source_results: dict):
+            if source_results['1'][1] is not None and source_results['1'][1].realtime_free_capacity <= 7:
+                realtime_polled.set()
+                parkapi_poller.stop()
+
+        parkapi_poller.result_handlers.append(handle_source_results)
+        parkapi_poller.run()
+
+        assert realtime_polled.is_set()
+        assert parkapi_poller.source_results_by_uid['example-source']['1'][1].realtime_free_capacity <= 7
+
+    @staticmethod
+    def test_run_retries_failed_initial_static_poll():
+        parkapi_poller = get_parkapi_poller({'PARK_API_STATIC_INTERVAL': '600', 'PARK_API_REALTIME_INTERVAL': '0.01'})
+        converter = parkapi_poller.parkapi_sources.converter_by_uid['example-source']
+        static_poll_results = [ConnectionError('Source is down.'), converter.get_static_parking_sites()]
+
+        def get_static_parking_sites():
+            static_poll_result = static_poll_results.pop(0)
+            if isinstance(static_poll_result, Exception):
+                raise static_poll_result
+            return static_poll_result
+
+        converter.get_static_parking_sites = get_static_parking_sites
+        parkapi_poller.result_handlers.append(lambda source_info, source_results: parkapi_poller.stop())
+        # Without the retry, the next static poll would be in 600 seconds
+        timer = Timer(5, parkapi_poller.stop)
+        timer.start()
+        parkapi_poller.run()
+        timer.cancel()
+
+        assert static_poll_results == []
+        assert list(parkapi_poller.source_results_by_uid['example-source'].keys()) == ['1', '2']
@@ -0,0 +1,125 @@
+"""
+Copyright 2024 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+from http import HTTPStatus
+from threading import Thread
+from urllib.request import urlopen
+
+from parkapi_sources import ParkAPIServer
+from parkapi_sources.models import RealtimeParkingSiteInput, SourceInfo, StaticParkingSiteInput
+from parkapi_sources.parkapi_poller import SourceResults
+from parkapi_sources.util import ParkingSiteStore
+
+UPDATED_AT = datetime(2024, 6, 1, 12, tzinfo=timezone.utc)
+SOURCE_INFO = SourceInfo(uid='example-source', name='Example Source', has_realtime_data=True)
+
+
+def get_source_results(free_capacity: int) -> SourceResults:
+    source_results: SourceResults = {}
+    for uid, lat, lon in (('1', '48.7758', '9.1829'), ('2/a', '49.0069', '8.4037')):
+        source_results[uid] = [
+            StaticParkingSiteInput(
+                uid=uid,
+                name=uid,
+                lat=Decimal(lat),
+                lon=Decimal(lon),
+                capacity=100,
+                static_data_updated_at=UPDATED_AT,
+            ),
+            None,
+        ]
+    source_results['1'][1] = RealtimeParkingSiteInput(uid='1', realtime_data_updated_at=UPDATED_AT, realtime_free_capacity=free_capacity)
+    return source_results
+
+
+def get_json_response(parkapi_server: ParkAPIServer, path: str, query: dict | None = None) -> tuple[HTTPStatus, dict | list]:
+    status, body = parkapi_server.get_response(path, query)
+    return status, json.loads(body)
+
+
+class ParkAPIServerTest:
+    @staticmethod
+    def test_get_response():
+        parkapi_server = ParkAPIServer(port=0)
+        parkapi_server.handle_source_results(SOURCE_INFO, get_source_results(10))
+
+        status, sources = get_json_response(parkapi_server, '/sources')
+        assert status == HTTPStatus.OK
+        assert sources == [{**SOURCE_INFO.to_dict(), 'parking_site_count': 2}]
+
+        status, source = get_json_response(parkapi_server, '/sources/example-source')
+        assert status == HTTPStatus.OK
+        assert source['source'] == SOURCE_INFO.to_dict()
+        assert [(item['uid'], item.get('realtime_free_capacity')) for item in source['parking_sites']] == [('1', 10), ('2/a', None)]
+
+        status, parking_site = get_json_response(parkapi_server, '/sources/example-source/parking-sites/2%2Fa')
+        assert status == HTTPStatus.OK
+        assert parking_site['uid'] == '2/a'
+
+        status, parking_sites = get_json_response(parkapi_server, '/parking-sites', {'bbox': ['9,48,10,49']})
+        assert status == HTTPStatus.OK
+        assert [(item['source_uid'], item['uid']) for item in parking_sites] == [('example-source', '1')]
+        assert get_json_response(parkapi_server, '/parking-sites', {'uid': ['2/a'], 'bbox': ['9,48,10,49']})[1] == []
+
+        assert parkapi_server.get_response('/sources/other-source')[0] == HTTPStatus.NOT_FOUND
+        assert parkapi_server.get_response('/sources/example-source/parking-sites/3')[0] == HTTPStatus.NOT_FOUND
+        assert parkapi_server.get_response('/parking-sites', {'bbox': ['9,48,10']})[0] == HTTPStatus.BAD_REQUEST
+        parkapi_server.shutdown()
+
+    @staticmethod
+    def test_responses_are_cached_per_source_result():
+        parkapi_server = ParkAPIServer(port=0)
+        parkapi_server.handle_source_results(SOURCE_INFO, get_source_results(10))
+
+        first_body = parkapi_server.get_response('/sources/example-source')[1]
+        assert parkapi_server.get_response('/sources/example-source')[1] is first_body
+
+        parkapi_server.handle_source_results(SOURCE_INFO, get_source_results(9))
+        status, parking_site = get_json_response(parkapi_server, '/sources/example-source/parking-sites/1')
+        assert parking_site['realtime_free_capacity'] == 9
+        parkapi_server.shutdown()
+
+    @staticmethod
+    def test_load_parking_site_store(tmp_path):
+        source_results = get_source_results(10)
+        parking_site_store = ParkingSiteStore(tmp_path / 'parking-sites.sqlite')
+        parking_site_store.upsert_static_parking_sites(SOURCE_INFO.uid, [item[0] for item in source_results.values()])
+        parking_site_store.upsert_realtime_parking_sites(SOURCE_INFO.uid, [source_results['1'][1]])
+        other_source_info = SourceInfo(uid='other-source', name='Other Source', has_realtime_data=False)
+
+        polled_parkapi_server = ParkAPIServer(port=0)
+        polled_parkapi_server.handle_source_results(SOURCE_INFO, source_results)
+        expected_body = polled_parkapi_server.get_response('/sources/example-source')[1]
+        polled_parkapi_server.shutdown()
+
+        parkapi_server = ParkAPIServer(port=0)
+        parkapi_server.load_parking_site_store(parking_site_store, [SOURCE_INFO, other_source_info])
+
+        assert get_json_response(parkapi_server, '/sources')[1] == [{**SOURCE_INFO.to_dict(), 'parking_site_count': 2}]
+        assert parkapi_server.get_response('/sources/example-source')[1] == expected_body
+        assert parkapi_server.get_response('/sources/other-source')[0] == HTTPStatus.NOT_FOUND
+
+        # A poll result replaces stored data, and stored data does not replace a poll result
+        parkapi_server.handle_source_results(SOURCE_INFO, get_source_results(9))
+        parkapi_server.load_parking_site_store(parking_site_store, [SOURCE_INFO])
+        parking_site = get_json_response(parkapi_server, '/sources/example-source/parking-sites/1')[1]
+        assert parking_site['realtime_free_capacity'] == 9
+        parking_site_store.close()
+        parkapi_server.shutdown()
+
+    @staticmethod
+    def test_serve():
+        parkapi_server = ParkAPIServer(port=0)
+        parkapi_server.handle_source_results(SOURCE_INFO, get_source_results(10))
+        Thread(target=parkapi_server.serve_forever, daemon=True).start()
+
+        host, port = parkapi_server.server_address
+        with urlopen(f'http://{host}:{port}/sources/example-source/parking-sites/1') as response:  # noqa: S310
+            assert response.headers['Content-Type'] == 'application/json; charset=utf-8'
+            assert json.loads(response.read())['realtime_free_capacity'] == 10
+        parkapi_server.shutdown()
@@ -0,0 +1,61 @@
+"""
+Copyright 2024 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from parkapi_sources import ParkAPISources
+from parkapi_sources.exceptions import MissingConverterException
+
+
+class ParkAPISourcesTest:
+    @staticmethod
+    def test_converter_registry_matches_source_uids():
+        for converter_uid in ParkAPISources.converter_class_names_by_uid.keys():
+            assert ParkAPISources.get_converter_class(converter_uid).source_info.uid == converter_uid
+
+    @staticmethod
+    def test_converter_classes():
+        converter_classes = ParkAPISources.converter_classes
+
+        assert converter_classes == ParkAPISources.get_converter_classes()
+        assert [converter_class.source_info.uid for converter_class in converter_classes] == list(
+            ParkAPISources.converter_class_names_by_uid.keys(),
+        )
+        assert ParkAPISources(config={}, converter_uids=[]).converter_classes == converter_classes
+
+    @staticmethod
+    def test_snapshot_cache_ttl():
+        parkapi_sources = ParkAPISources(config={'PARK_API_SNAPSHOT_CACHE_TTL': '5'}, converter_uids=['pbw', 'ellwangen'])
+
+        assert parkapi_sources.converter_by_uid['pbw'].snapshot_cache.ttl == 5
+        assert ParkAPISources(config={}, converter_uids=['pbw']).converter_by_uid['pbw'].snapshot_cache.ttl == 30
+
+    @staticmethod
+    def test_missing_converter():
+        with pytest.raises(MissingConverterException):
+            ParkAPISources(config={}, converter_uids=['not-existing'])
+
+    @staticmethod
+    def test_single_converter_imports_just_its_dependencies():
+        # Runs in a fresh interpreter, as other tests already imported all converters
+        script = (
+            'import sys\n'
+            'from parkapi_sources import ParkAPISources\n'
+            "ParkAPISources(config={}, converter_uids=['herrenberg'])\n"
+            "print(','.join(sorted(module for module in ('bs4', 'openpyxl', 'pyproj') if module in sys.modules)))\n"
+        )
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, '-c', script],
+            capture_output=True,
+            check=True,
+            cwd=Path(__file__).parent.parent,
+            env={'PYTHONPATH': str(Path(Path(__file__).parent.parent, 'src'))},
+            text=True,
+        )
+
+        assert result.stdout.strip() == ''
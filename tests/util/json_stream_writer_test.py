@@ -0,0 +1,73 @@
+"""
+Copyright 2024 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+from io import StringIO
+
+from parkapi_sources.util import DefaultJSONEncoder, JsonStreamWriter
+
+FEATURES: list[dict] = [
+    {
+        'type': 'Feature',
+        'geometry': {'type': 'Point', 'coordinates': [9.1, 48.7]},
+        'properties': {'uid': '1', 'lat': Decimal('48.7'), 'modified_at': datetime(2024, 6, 1, 12, tzinfo=timezone.utc)},
+    },
+    {
+        'type': 'Feature',
+        'geometry': {'type': 'Point', 'coordinates': [9.2, 48.8]},
+        'properties': {'uid': '2', 'name': 'Parkhaus Ä'},
+    },
+]
+
+
+class JsonStreamWriterTest:
+    @staticmethod
+    def test_write_array():
+        output = StringIO()
+        JsonStreamWriter(output).write_array(iter(FEATURES))
+
+        assert output.getvalue() == json.dumps(FEATURES, cls=DefaultJSONEncoder)
+
+    @staticmethod
+    def test_write_empty_array():
+        output = StringIO()
+        JsonStreamWriter(output).write_array(iter([]))
+
+        assert output.getvalue() == '[]'
+
+    @staticmethod
+    def test_write_object():
+        output = StringIO()
+        JsonStreamWriter(output).write_object([('source', {'uid': 'test'})], 'parking_sites', iter(FEATURES))
+
+        assert output.getvalue() == json.dumps({'source': {'uid': 'test'}, 'parking_sites': FEATURES}, cls=DefaultJSONEncoder)
+
+    @staticmethod
+    def test_write_geojson_feature_collection():
+        output = StringIO()
+        JsonStreamWriter(output).write_geojson_feature_collection(iter(FEATURES))
+
+        assert json.loads(output.getvalue()) == json.loads(
+            json.dumps({'type': 'FeatureCollection', 'features': FEATURES}, cls=DefaultJSONEncoder),
+        )
+
+    @staticmethod
+    def test_write_lines():
+        output = StringIO()
+        JsonStreamWriter(output).write_lines(iter(FEATURES))
+
+        assert output.getvalue().split('\n') == [*[json.dumps(feature, cls=DefaultJSONEncoder) for feature in FEATURES], '']
+
+    @staticmethod
+    def test_write_lines_with_record_separator():
+        output = StringIO()
+        JsonStreamWriter(output).write_lines(iter(FEATURES), record_separator='\x1e')
+
+        records = output.getvalue().split('\x1e')
+        assert records[0] == ''
+        assert [json.loads(record) for record in records[1:]] == json.loads(json.dumps(FEATURES, cls=DefaultJSONEncoder))
+        assert all(record.endswith('\n') for record in records[1:])
@@ -0,0 +1,160 @@
+"""
+Copyright 2024 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+import json
+import sys
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+from parkapi_sources.exceptions import ImportParkingSiteException
+from parkapi_sources.models import RealtimeParkingSiteInput, StaticParkingSiteInput
+from parkapi_sources.models.enums import ExternalIdentifierType, ParkAndRideType, PurposeType
+from parkapi_sources.models.parking_site_inputs import ExternalIdentifierInput
+from parkapi_sources.util import DefaultJSONEncoder, ParkingSiteBatch, ParkingSiteSerializer
+
+STATIC_PARKING_SITE_INPUTS: list[StaticParkingSiteInput] = [
+    StaticParkingSiteInput(
+        uid='1',
+        name='Parkhaus Ä',
+        lat=Decimal('48.7758'),
+        lon=Decimal('9.1829'),
+        capacity=100,
+        purpose=PurposeType.BIKE,
+        park_and_ride_type=[ParkAndRideType.TRAIN],
+        external_identifiers=[ExternalIdentifierInput(type=ExternalIdentifierType.OSM, value='123')],
+        static_data_updated_at=datetime(2024, 6, 1, 12, tzinfo=timezone.utc),
+    ),
+    StaticParkingSiteInput(
+        uid='2',
+        name='Parkplatz',
+        lat=Decimal('48.8'),
+        lon=Decimal('9.2'),
+        capacity=None,
+        address=None,
+    ),
+]
+
+REALTIME_PARKING_SITE_INPUTS: list[RealtimeParkingSiteInput] = [
+    RealtimeParkingSiteInput(
+        uid=str(index),
+        realtime_data_updated_at=datetime(2024, 6, 1, 12, tzinfo=timezone.utc),
+        realtime_capacity=capacity,
+        realtime_free_capacity=free_capacity,
+    )
+    for index, (capacity, free_capacity) in enumerate([(100, 25), (0, 0), (None, 10)])
+]
+
+
+class ParkingSiteBatchTest:
+    @staticmethod
+    def test_columns():
+        batch = ParkingSiteBatch.from_inputs(StaticParkingSiteInput, STATIC_PARKING_SITE_INPUTS)
+
+        assert len(batch) == 2
+        assert batch.columns['uid'] == ['1', '2']
+        assert batch.columns['capacity'] == [100, None]
+        assert batch.masks['capacity'] == bytearray([1, 1])
+        assert batch.columns['address'] == [None, None]
+        assert batch.masks['address'] == bytearray([0, 1])
+
+    @staticmethod
+    def test_to_dicts():
+        serializer = ParkingSiteSerializer()
+        batch = ParkingSiteBatch.from_inputs(StaticParkingSiteInput, STATIC_PARKING_SITE_INPUTS)
+
+        assert batch.to_dicts() == [serializer.to_dict(item) for item in STATIC_PARKING_SITE_INPUTS]
+
+    @staticmethod
+    def test_to_json():
+        batch = ParkingSiteBatch.from_inputs(StaticParkingSiteInput, STATIC_PARKING_SITE_INPUTS)
+
+        assert batch.to_json() == json.dumps([item.to_dict() for item in STATIC_PARKING_SITE_INPUTS], cls=DefaultJSONEncoder)
+
+    @staticmethod
+    def test_iter_inputs():
+        batch = ParkingSiteBatch.from_inputs(StaticParkingSiteInput, STATIC_PARKING_SITE_INPUTS)
+
+        assert list(batch) == STATIC_PARKING_SITE_INPUTS
+
+    @staticmethod
+    def test_from_results():
+        import_parking_site_exception = ImportParkingSiteException(source_uid='source', parking_site_uid='3', message='invalid')
+
+        batch, import_parking_site_exceptions = ParkingSiteBatch.from_results(
+            RealtimeParkingSiteInput,
+            iter([REALTIME_PARKING_SITE_INPUTS[0], import_parking_site_exception, REALTIME_PARKING_SITE_INPUTS[1]]),
+            source_uid='source',
+        )
+
+        assert list(batch) == REALTIME_PARKING_SITE_INPUTS[:2]
+        assert batch.source_uid == 'source'
+        assert import_parking_site_exceptions == [import_parking_site_exception]
+
+    @staticmethod
+    def test_from_results_tuple():
+        import_parking_site_exception = ImportParkingSiteException(source_uid='source', parking_site_uid='3', message='invalid')
+        results = ([STATIC_PARKING_SITE_INPUTS[0], *REALTIME_PARKING_SITE_INPUTS], [import_parking_site_exception])
+
+        static_batch, import_parking_site_exceptions = ParkingSiteBatch.from_results(StaticParkingSiteInput, results)
+        realtime_batch, _ = ParkingSiteBatch.from_results(RealtimeParkingSiteInput, results)
+
+        # Inputs of the other class are skipped, so mixed results can be split into one batch per class
+        assert list(static_batch) == STATIC_PARKING_SITE_INPUTS[:1]
+        assert list(realtime_batch) == REALTIME_PARKING_SITE_INPUTS
+        assert import_parking_site_exceptions == [import_parking_site_exception]
+
+    @staticmethod
+    def test_round_trip():
+        for input_class, parking_site_inputs in (
+            (StaticParkingSiteInput, STATIC_PARKING_SITE_INPUTS),
+            (RealtimeParkingSiteInput, REALTIME_PARKING_SITE_INPUTS),
+        ):
+            batch = ParkingSiteBatch.from_inputs(input_class, parking_site_inputs)
+
+            assert [item.to_dict() for item in batch] == [item.to_dict() for item in parking_site_inputs]
+            assert json.loads(batch.to_json()) == [
+                json.loads(json.dumps(item.to_dict(), cls=DefaultJSONEncoder)) for item in parking_site_inputs
+            ]
+
+    @staticmethod
+    def test_append_other_input_class():
+        batch = ParkingSiteBatch(RealtimeParkingSiteInput)
+
+        with pytest.raises(TypeError):
+            batch.append(STATIC_PARKING_SITE_INPUTS[0])
+
+    @staticmethod
+    def test_aggregations():
+        batch = ParkingSiteBatch.from_inputs(RealtimeParkingSiteInput, REALTIME_PARKING_SITE_INPUTS)
+
+        assert batch.get_sum('realtime_free_capacity') == 35
+        assert batch.get_sum('realtime_capacity') == 100
+        assert batch.get_sum('realtime_free_capacity_bus') == 0
+        assert batch.get_occupancy_rates() == [0.75, None, None]
+        assert batch.get_free_capacity() == 35
+        # Just rows with capacity and free capacity count: 100 - 25 + 0 - 0 of 100 + 0
+        assert batch.get_occupancy_rate() == 0.75
+        assert ParkingSiteBatch(RealtimeParkingSiteInput).get_occupancy_rate() is None
+
+    @staticmethod
+    def test_to_arrow_without_pyarrow(monkeypatch: pytest.MonkeyPatch):
+        # None in sys.modules makes the import fail, like if pyarrow is not installed
+        monkeypatch.setitem(sys.modules, 'pyarrow', None)
+        batch = ParkingSiteBatch.from_inputs(StaticParkingSiteInput, STATIC_PARKING_SITE_INPUTS)
+
+        with pytest.raises(ValueError, match='pyarrow is not installed'):
+            batch.to_arrow()
+
+    @staticmethod
+    def test_to_arrow():
+        pytest.importorskip('pyarrow')
+        batch = ParkingSiteBatch.from_inputs(StaticParkingSiteInput, STATIC_PARKING_SITE_INPUTS)
+
+        table = batch.to_arrow()
+
+        assert table.num_rows == 2
+        assert table.column('purpose').to_pylist() == ['BIKE', 'CAR']
+        assert table.column('address').to_pylist() == [None, None]
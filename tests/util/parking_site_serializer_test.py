@@ -0,0 +1,78 @@
+"""
+Copyright 2024 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+from parkapi_sources.models import RealtimeParkingSiteInput, StaticParkingSiteInput
+from parkapi_sources.models.enums import ExternalIdentifierType, OpeningStatus, ParkAndRideType, ParkingSiteType
+from parkapi_sources.models.parking_site_inputs import ExternalIdentifierInput
+from parkapi_sources.util import DefaultJSONEncoder, ParkingSiteSerializer
+
+PARKING_SITE_INPUTS: list[StaticParkingSiteInput | RealtimeParkingSiteInput] = [
+    StaticParkingSiteInput(
+        uid='1',
+        name='Parkhaus Österfeld',
+        lat=Decimal('48.7758459'),
+        lon=Decimal('9.1829321'),
+        type=ParkingSiteType.CAR_PARK,
+        capacity=120,
+        has_fee=True,
+        park_and_ride_type=[ParkAndRideType.TRAIN],
+        external_identifiers=[ExternalIdentifierInput(type=ExternalIdentifierType.OSM, value='way/1')],
+        static_data_updated_at=datetime(2024, 6, 1, 12, 30, 5, tzinfo=timezone.utc),
+    ),
+    StaticParkingSiteInput(
+        uid='2',
+        name='Parkplatz',
+        lat=Decimal('48.1'),
+        lon=Decimal('9.1'),
+        capacity=10,
+        description=None,
+        static_data_updated_at=datetime(2024, 6, 1, tzinfo=timezone.utc),
+    ),
+    RealtimeParkingSiteInput(
+        uid='1',
+        realtime_data_updated_at=datetime(2024, 6, 1, 12, tzinfo=timezone.utc),
+        realtime_opening_status=OpeningStatus.OPEN,
+        realtime_free_capacity=12,
+    ),
+]
+
+
+class ParkingSiteSerializerTest:
+    @staticmethod
+    @pytest.mark.parametrize('parking_site_input', PARKING_SITE_INPUTS)
+    def test_to_dict(parking_site_input: StaticParkingSiteInput | RealtimeParkingSiteInput):
+        serializer = ParkingSiteSerializer()
+
+        assert serializer.to_dict(parking_site_input) == json.loads(json.dumps(parking_site_input.to_dict(), cls=DefaultJSONEncoder))
+
+    @staticmethod
+    @pytest.mark.parametrize('parking_site_input', PARKING_SITE_INPUTS)
+    def test_dumps(parking_site_input: StaticParkingSiteInput | RealtimeParkingSiteInput):
+        serializer = ParkingSiteSerializer()
+
+        assert serializer.dumps(parking_site_input) == json.dumps(parking_site_input.to_dict(), cls=DefaultJSONEncoder)
+
+    @staticmethod
+    @pytest.mark.parametrize('parking_site_input', PARKING_SITE_INPUTS)
+    def test_dumps_orjson(parking_site_input: StaticParkingSiteInput | RealtimeParkingSiteInput):
+        pytest.importorskip('orjson')
+        serializer = ParkingSiteSerializer(use_orjson=True)
+
+        assert json.loads(serializer.dumps(parking_site_input)) == json.loads(
+            json.dumps(parking_site_input.to_dict(), cls=DefaultJSONEncoder),
+        )
+
+    @staticmethod
+    def test_dumps_orjson_nested_values():
+        pytest.importorskip('orjson')
+        serializer = ParkingSiteSerializer(use_orjson=True)
+        data = {'source': {'uid': 'test'}, 'parking_sites': PARKING_SITE_INPUTS, 'updated_at': datetime(2024, 6, 1, tzinfo=timezone.utc)}
+
+        assert json.loads(serializer.dumps(data)) == json.loads(json.dumps(data, cls=DefaultJSONEncoder))
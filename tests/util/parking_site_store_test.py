@@ -0,0 +1,122 @@
+"""
+Copyright 2024 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+
+from parkapi_sources.models import RealtimeParkingSiteInput, StaticParkingSiteInput
+from parkapi_sources.util import ParkingSiteSerializer, ParkingSiteStore
+
+UPDATED_AT = datetime(2024, 6, 1, 12, tzinfo=timezone.utc)
+parking_site_serializer = ParkingSiteSerializer()
+
+
+def get_static_parking_site_input(uid: str, lat: str, lon: str, capacity: int = 10) -> StaticParkingSiteInput:
+    return StaticParkingSiteInput(
+        uid=uid,
+        name=f'Parking Site {uid}',
+        lat=Decimal(lat),
+        lon=Decimal(lon),
+        capacity=capacity,
+        static_data_updated_at=UPDATED_AT,
+    )
+
+
+def get_realtime_parking_site_input(uid: str, free_capacity: int) -> RealtimeParkingSiteInput:
+    return RealtimeParkingSiteInput(uid=uid, realtime_data_updated_at=UPDATED_AT, realtime_free_capacity=free_capacity)
+
+
+def get_parking_site_store(tmp_path: Path) -> ParkingSiteStore:
+    parking_site_store = ParkingSiteStore(Path(tmp_path, 'parking_sites.db'))
+    parking_site_store.upsert_static_parking_sites(
+        'stuttgart',
+        [get_static_parking_site_input('2', '48.7758', '9.1829'), get_static_parking_site_input('1', '48.7800', '9.1700')],
+    )
+    parking_site_store.upsert_static_parking_sites('karlsruhe', [get_static_parking_site_input('1', '49.0069', '8.4037')])
+    return parking_site_store
+
+
+class ParkingSiteStoreTest:
+    @staticmethod
+    def test_get_parking_sites(tmp_path: Path):
+        parking_site_store = get_parking_site_store(tmp_path)
+        parking_site_store.upsert_realtime_parking_sites('stuttgart', [get_realtime_parking_site_input('1', 5)])
+
+        assert parking_site_store.get_source_uids() == ['karlsruhe', 'stuttgart']
+        # Parking sites of a source keep the order of the import
+        assert [item['uid'] for item in parking_site_store.get_parking_sites(source_uid='stuttgart')] == ['2', '1']
+        assert [item['source_uid'] for item in parking_site_store.get_parking_sites(uid='1')] == ['karlsruhe', 'stuttgart']
+        # Stored parking sites are the same as the ndjson output of the parkapi script
+        assert parking_site_store.get_parking_site('stuttgart', '1') == {
+            **parking_site_serializer.to_dict(get_static_parking_site_input('1', '48.7800', '9.1700')),
+            **parking_site_serializer.to_dict(get_realtime_parking_site_input('1', 5)),
+            'source_uid': 'stuttgart',
+        }
+        assert parking_site_store.get_parking_site('stuttgart', '3') is None
+
+    @staticmethod
+    def test_get_parking_sites_by_bbox(tmp_path: Path):
+        parking_site_store = get_parking_site_store(tmp_path)
+
+        parking_sites = parking_site_store.get_parking_sites(bbox=(9.0, 48.7, 9.18, 48.8))
+
+        assert [(item['source_uid'], item['uid']) for item in parking_sites] == [('stuttgart', '1')]
+
+    @staticmethod
+    def test_upsert_static_parking_sites_replaces_source(tmp_path: Path):
+        parking_site_store = get_parking_site_store(tmp_path)
+        parking_site_store.upsert_realtime_parking_sites(
+            'stuttgart',
+            [get_realtime_parking_site_input('1', 5), get_realtime_parking_site_input('2', 6)],
+        )
+
+        parking_site_store.upsert_static_parking_sites('stuttgart', [get_static_parking_site_input('1', '48.7800', '9.1700', 20)])
+        # Realtime data of removed parking sites is removed as well, so it does not come back with the parking site
+        parking_site_store.upsert_static_parking_sites(
+            'stuttgart', [get_static_parking_site_input('2', '48.7758', '9.1829')], replace=False
+        )
+
+        parking_sites = parking_site_store.get_parking_sites(source_uid='stuttgart')
+        assert [(item['uid'], item['capacity'], item.get('realtime_free_capacity')) for item in parking_sites] == [
+            ('1', 20, 5),
+            ('2', 10, None),
+        ]
+        assert len(parking_site_store.get_parking_sites(source_uid='karlsruhe')) == 1
+
+    @staticmethod
+    def test_upsert_realtime_parking_sites(tmp_path: Path):
+        parking_site_store = get_parking_site_store(tmp_path)
+        parking_site_store.upsert_realtime_parking_sites(
+            'stuttgart',
+            [get_realtime_parking_site_input('1', 5), get_realtime_parking_site_input('2', 6)],
+        )
+
+        parking_site_store.upsert_realtime_parking_sites('stuttgart', [get_realtime_parking_site_input('1', 4)])
+        assert [item['realtime_free_capacity'] for item in parking_site_store.get_parking_sites(source_uid='stuttgart')] == [6, 4]
+
+        parking_site_store.upsert_realtime_parking_sites('stuttgart', [get_realtime_parking_site_input('1', 3)], replace=True)
+        parking_sites = parking_site_store.get_parking_sites(source_uid='stuttgart')
+        assert [item.get('realtime_free_capacity') for item in parking_sites] == [None, 3]
+
+    @staticmethod
+    def test_upsert_realtime_parking_sites_with_current_uids(tmp_path: Path):
+        parking_site_store = get_parking_site_store(tmp_path)
+        parking_site_store.upsert_realtime_parking_sites(
+            'stuttgart',
+            [get_realtime_parking_site_input('1', 5), get_realtime_parking_site_input('2', 6)],
+        )
+
+        # Parking site 2 dropped out of the poll, and parking site 1 did not change
+        parking_site_store.upsert_realtime_parking_sites('stuttgart', [], current_uids=['1'])
+
+        parking_sites = parking_site_store.get_parking_sites(source_uid='stuttgart')
+        assert [(item['uid'], item.get('realtime_free_capacity')) for item in parking_sites] == [('2', None), ('1', 5)]
+
+    @staticmethod
+    def test_persistence(tmp_path: Path):
+        get_parking_site_store(tmp_path).close()
+
+        assert len(ParkingSiteStore(Path(tmp_path, 'parking_sites.db')).get_parking_sites()) == 3
@@ -0,0 +1,78 @@
+"""
+Copyright 2024 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+from random import Random
+from threading import Thread
+
+import pytest
+from parkapi_sources.util import PollScheduler
+
+
+class PollSchedulerTest:
+    @staticmethod
+    def test_get_next_in_due_order():
+        scheduler: PollScheduler[str] = PollScheduler(jitter=0)
+        scheduler.add('slow', 60, delay=0.02)
+        scheduler.add('fast', 60, delay=0)
+        scheduler.add('never', 60, delay=60)
+
+        assert scheduler.get_next(timeout=1) == 'fast'
+        assert scheduler.get_next(timeout=1) == 'slow'
+        assert scheduler.get_next(timeout=0.01) is None
+
+    @staticmethod
+    def test_reschedule():
+        scheduler: PollScheduler[str] = PollScheduler(jitter=0)
+        scheduler.add('source', 0.01)
+
+        assert scheduler.get_next(timeout=1) == 'source'
+        # A key is not handed out again until it's rescheduled
+        assert scheduler.get_next(timeout=0.05) is None
+
+        scheduler.reschedule('source')
+
+        assert scheduler.get_next(timeout=1) == 'source'
+
+    @staticmethod
+    def test_reschedule_with_interval():
+        scheduler: PollScheduler[str] = PollScheduler(jitter=0)
+        scheduler.add('source', 60)
+
+        assert scheduler.get_next(timeout=1) == 'source'
+
+        scheduler.reschedule('source', interval=0.01)
+
+        assert scheduler.get_next(timeout=1) == 'source'
+
+    @staticmethod
+    def test_jitter():
+        scheduler: PollScheduler[str] = PollScheduler(jitter=0.1, random=Random(1))  # noqa: S311
+
+        intervals = [scheduler.get_jittered_interval(100) for _ in range(1000)]
+        startup_delays = [scheduler.get_startup_delay(100) for _ in range(1000)]
+
+        assert all(90 <= interval <= 110 for interval in intervals)
+        assert len(set(intervals)) == 1000
+        assert all(0 <= startup_delay <= 10 for startup_delay in startup_delays)
+
+    @staticmethod
+    def test_close_wakes_up_get_next():
+        scheduler: PollScheduler[str] = PollScheduler()
+        results: list = []
+        thread = Thread(target=lambda: results.append(scheduler.get_next()))
+        thread.start()
+
+        scheduler.close()
+        thread.join(timeout=1)
+
+        assert results == [None]
+
+    @staticmethod
+    def test_invalid_arguments():
+        with pytest.raises(ValueError):
+            PollScheduler(jitter=1)
+
+        with pytest.raises(ValueError):
+            PollScheduler().add('source', 0)
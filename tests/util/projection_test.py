@@ -0,0 +1,79 @@
+"""
+Copyright 2024 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from unittest.mock import patch
+
+import pyproj
+from parkapi_sources.util import projection
+from parkapi_sources.util.projection import UTM_32N_CRS, WGS84_LON_LAT_CRS, get_transformer, transform_coordinates
+
+UTM_COORDINATES: list[tuple[float, float]] = [
+    (513276.5, 5402931.2),
+    (497832.0, 5377810.8),
+    (534522.3, 5451420.1),
+]
+
+
+class ProjectionTest:
+    @staticmethod
+    def test_get_transformer_is_shared() -> None:
+        assert get_transformer(UTM_32N_CRS, WGS84_LON_LAT_CRS) is get_transformer(UTM_32N_CRS, WGS84_LON_LAT_CRS)
+        assert get_transformer(UTM_32N_CRS, WGS84_LON_LAT_CRS) is not get_transformer(WGS84_LON_LAT_CRS, UTM_32N_CRS)
+
+    @staticmethod
+    def test_get_transformer_creates_transformer_once() -> None:
+        # A CRS pair which no converter uses, so the transformer is not cached yet
+        source_crs = '+proj=utm +zone=33 +ellps=WGS84 +units=m +no_defs +type=crs'
+        barrier = Barrier(8)
+
+        def get_transformer_at_once(_: int) -> pyproj.Transformer:
+            barrier.wait()
+            return get_transformer(source_crs, WGS84_LON_LAT_CRS)
+
+        try:
+            with patch.object(pyproj.Transformer, 'from_crs', wraps=pyproj.Transformer.from_crs) as from_crs:
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    transformers = list(executor.map(get_transformer_at_once, range(8)))
+                get_transformer(source_crs, WGS84_LON_LAT_CRS)
+
+            assert from_crs.call_count == 1
+            assert all(transformer is transformers[0] for transformer in transformers)
+        finally:
+            projection._transformers.pop((source_crs, WGS84_LON_LAT_CRS), None)
+
+    @staticmethod
+    def test_transform_coordinates_round_trip() -> None:
+        lon_lat_coordinates = transform_coordinates(UTM_32N_CRS, WGS84_LON_LAT_CRS, UTM_COORDINATES)
+
+        utm_coordinates = transform_coordinates(WGS84_LON_LAT_CRS, UTM_32N_CRS, lon_lat_coordinates)
+
+        # All coordinates are around Stuttgart
+        assert [(round(lon, 1), round(lat, 1)) for lon, lat in lon_lat_coordinates] == [(9.2, 48.8), (9.0, 48.6), (9.5, 49.2)]
+        for (x, y), (expected_x, expected_y) in zip(utm_coordinates, UTM_COORDINATES, strict=True):
+            assert abs(x - expected_x) < 1e-6
+            assert abs(y - expected_y) < 1e-6
+
+    @staticmethod
+    def test_transform_coordinates_matches_proj() -> None:
+        proj = pyproj.Proj(proj='utm', zone=32, ellps='WGS84', preserve_units=True)
+
+        coordinates = transform_coordinates(UTM_32N_CRS, WGS84_LON_LAT_CRS, UTM_COORDINATES)
+
+        assert coordinates == [proj(x, y, inverse=True) for x, y in UTM_COORDINATES]
+
+    @staticmethod
+    def test_transform_coordinates_empty() -> None:
+        assert transform_coordinates(UTM_32N_CRS, WGS84_LON_LAT_CRS, []) == []
+
+    @staticmethod
+    def test_transform_coordinates_in_threads() -> None:
+        expected_coordinates = transform_coordinates(UTM_32N_CRS, WGS84_LON_LAT_CRS, UTM_COORDINATES)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda _: transform_coordinates(UTM_32N_CRS, WGS84_LON_LAT_CRS, UTM_COORDINATES), range(16)))
+
+        assert all(result == expected_coordinates for result in results)
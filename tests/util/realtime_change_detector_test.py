@@ -0,0 +1,86 @@
+"""
+Copyright 2024 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+from datetime import datetime, timezone
+from time import sleep
+
+from parkapi_sources.models import RealtimeParkingSiteInput
+from parkapi_sources.models.enums import OpeningStatus
+from parkapi_sources.util import RealtimeChangeDetector
+
+
+def get_realtime_parking_site_input(
+    uid: str,
+    free_capacity: int,
+    opening_status: OpeningStatus = OpeningStatus.OPEN,
+    minute: int = 0,
+) -> RealtimeParkingSiteInput:
+    return RealtimeParkingSiteInput(
+        uid=uid,
+        realtime_data_updated_at=datetime(2024, 6, 1, 12, minute, tzinfo=timezone.utc),
+        realtime_opening_status=opening_status,
+        realtime_free_capacity=free_capacity,
+    )
+
+
+class RealtimeChangeDetectorTest:
+    @staticmethod
+    def test_filter_changed():
+        realtime_change_detector = RealtimeChangeDetector(heartbeat_interval=None)
+        first_poll = [get_realtime_parking_site_input('1', 10), get_realtime_parking_site_input('2', 20)]
+        second_poll = [
+            # Just the update time changed
+            get_realtime_parking_site_input('1', 10, minute=5),
+            get_realtime_parking_site_input('2', 20, opening_status=OpeningStatus.CLOSED, minute=5),
+            get_realtime_parking_site_input('3', 30, minute=5),
+        ]
+        third_poll = [get_realtime_parking_site_input('1', 9, minute=10), get_realtime_parking_site_input('2', 20, minute=10)]
+
+        assert realtime_change_detector.filter_changed('source', first_poll) == first_poll
+        assert realtime_change_detector.filter_changed('source', second_poll) == second_poll[1:]
+        assert realtime_change_detector.filter_changed('source', third_poll) == third_poll
+        assert realtime_change_detector.filter_changed('source', third_poll) == []
+
+    @staticmethod
+    def test_sources_are_separated():
+        realtime_change_detector = RealtimeChangeDetector(heartbeat_interval=None)
+        realtime_parking_site_inputs = [get_realtime_parking_site_input('1', 10)]
+
+        assert realtime_change_detector.filter_changed('source-1', realtime_parking_site_inputs) == realtime_parking_site_inputs
+        assert realtime_change_detector.filter_changed('source-2', realtime_parking_site_inputs) == realtime_parking_site_inputs
+        assert realtime_change_detector.filter_changed('source-1', realtime_parking_site_inputs) == []
+
+    @staticmethod
+    def test_dropped_parking_sites_count_as_changed():
+        realtime_change_detector = RealtimeChangeDetector(heartbeat_interval=None)
+        realtime_parking_site_input = get_realtime_parking_site_input('1', 10)
+
+        realtime_change_detector.filter_changed('source', [realtime_parking_site_input])
+        realtime_change_detector.filter_changed('source', [])
+
+        assert realtime_change_detector.filter_changed('source', [realtime_parking_site_input]) == [realtime_parking_site_input]
+
+    @staticmethod
+    def test_heartbeat():
+        realtime_change_detector = RealtimeChangeDetector(heartbeat_interval=0.01)
+        realtime_parking_site_inputs = [get_realtime_parking_site_input('1', 10)]
+
+        realtime_change_detector.filter_changed('source', realtime_parking_site_inputs)
+        assert realtime_change_detector.filter_changed('source', realtime_parking_site_inputs) == []
+
+        sleep(0.02)
+
+        assert realtime_change_detector.filter_changed('source', realtime_parking_site_inputs) == realtime_parking_site_inputs
+        assert realtime_change_detector.filter_changed('source', realtime_parking_site_inputs) == []
+
+    @staticmethod
+    def test_reset():
+        realtime_change_detector = RealtimeChangeDetector(heartbeat_interval=None)
+        realtime_parking_site_inputs = [get_realtime_parking_site_input('1', 10)]
+        realtime_change_detector.filter_changed('source', realtime_parking_site_inputs)
+
+        realtime_change_detector.reset('source')
+
+        assert realtime_change_detector.filter_changed('source', realtime_parking_site_inputs) == realtime_parking_site_inputs
@@ -0,0 +1,46 @@
+"""
+Copyright 2024 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+from parkapi_sources import ParkAPISources
+from parkapi_sources.util import RequestHelper
+from requests_mock import Mocker
+
+
+def test_session_is_created_once():
+    request_helper = RequestHelper(pool_maxsize=4, retries=2)
+
+    session = request_helper.session
+    adapter = session.get_adapter('https://example.com')
+
+    assert request_helper.session is session
+    assert adapter.max_retries.total == 2
+    assert adapter._pool_maxsize == 4
+    assert 'gzip' in session.headers['Accept-Encoding']
+
+
+def test_session_is_recreated_after_close():
+    request_helper = RequestHelper()
+    session = request_helper.session
+
+    request_helper.close()
+
+    assert request_helper.session is not session
+
+
+def test_get_uses_shared_session(requests_mock: Mocker):
+    requests_mock.get('https://example.com/data.json', json={'test': 1})
+    request_helper = RequestHelper()
+
+    assert request_helper.get('https://example.com/data.json', timeout=30).json() == {'test': 1}
+    assert requests_mock.last_request.headers['Accept-Encoding'] == request_helper.session.headers['Accept-Encoding']
+
+
+def test_converters_share_request_helper():
+    parkapi_sources = ParkAPISources(config={'PARK_API_HTTP_POOL_SIZE': '3'}, converter_uids=['karlsruhe', 'kienzler'])
+
+    request_helpers = {id(converter.request_helper) for converter in parkapi_sources.converter_by_uid.values()}
+
+    assert request_helpers == {id(parkapi_sources.request_helper)}
+    assert parkapi_sources.request_helper.pool_maxsize == 3
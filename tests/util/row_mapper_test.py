@@ -0,0 +1,27 @@
+"""
+Copyright 2024 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+import pytest
+
+from parkapi_sources.util import RowMapper
+
+
+@pytest.mark.parametrize(
+    'mapping, row, expected_output',
+    [
+        ({'uid': 2, 'name': 0}, ['Parkhaus', 'ignored', '1'], {'uid': '1', 'name': 'Parkhaus'}),
+        ({'uid': 1}, ('Parkhaus', '1'), {'uid': '1'}),
+        ({}, ['Parkhaus'], {}),
+    ],
+)
+def test_row_mapper_map(mapping: dict[str, int], row: list, expected_output: dict):
+    row_mapper = RowMapper(mapping)
+
+    assert row_mapper.map(row) == expected_output
+    assert list(row_mapper.map(row).keys()) == list(mapping.keys())
+
+
+def test_row_mapper_get_column_indices():
+    assert RowMapper.get_column_indices(['id', 'name', 'id', None]) == {'id': 0, 'name': 1, None: 3}
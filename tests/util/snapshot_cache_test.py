@@ -0,0 +1,70 @@
+"""
+Copyright 2024 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+from threading import Event, Thread
+from unittest.mock import Mock, patch
+
+import pytest
+from parkapi_sources.util import SnapshotCache
+
+
+def test_get_or_load_uses_cached_value():
+    snapshot_cache = SnapshotCache(ttl=30)
+    loader = Mock(return_value=['data'])
+
+    assert snapshot_cache.get_or_load('https://example.com', loader) == ['data']
+    assert snapshot_cache.get_or_load('https://example.com', loader) == ['data']
+    assert loader.call_count == 1
+
+
+def test_get_or_load_differs_by_key():
+    snapshot_cache = SnapshotCache(ttl=30)
+    loader = Mock(return_value=['data'])
+
+    snapshot_cache.get_or_load(('https://example.com', 1), loader)
+    snapshot_cache.get_or_load(('https://example.com', 2), loader)
+
+    assert loader.call_count == 2
+
+
+def test_get_or_load_expires():
+    snapshot_cache = SnapshotCache(ttl=30)
+    loader = Mock(return_value=['data'])
+
+    with patch('parkapi_sources.util.snapshot_cache.monotonic', return_value=100):
+        snapshot_cache.get_or_load('https://example.com', loader)
+    with patch('parkapi_sources.util.snapshot_cache.monotonic', return_value=131):
+        snapshot_cache.get_or_load('https://example.com', loader)
+
+    assert loader.call_count == 2
+
+
+def test_get_or_load_does_not_cache_exceptions():
+    snapshot_cache = SnapshotCache(ttl=30)
+    loader = Mock(side_effect=[ValueError('broken'), ['data']])
+
+    with pytest.raises(ValueError):
+        snapshot_cache.get_or_load('https://example.com', loader)
+
+    assert snapshot_cache.get_or_load('https://example.com', loader) == ['data']
+
+
+def test_get_or_load_does_not_block_other_keys():
+    snapshot_cache = SnapshotCache(ttl=30)
+    other_key_loaded = Event()
+
+    def slow_loader() -> list[str]:
+        # Waits for the load of another key, which would time out if all loads shared one lock
+        return ['slow'] if other_key_loaded.wait(timeout=5) else ['timeout']
+
+    results: list[list[str]] = []
+    thread = Thread(target=lambda: results.append(snapshot_cache.get_or_load('https://example.com/slow', slow_loader)))
+    thread.start()
+
+    assert snapshot_cache.get_or_load('https://example.com/fast', Mock(return_value=['fast'])) == ['fast']
+    other_key_loaded.set()
+    thread.join()
+
+    assert results == [['slow']]
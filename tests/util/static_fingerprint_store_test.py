@@ -0,0 +1,82 @@
+"""
+Copyright 2024 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+from hashlib import sha256
+from pathlib import Path
+
+from parkapi_sources.models import StaticParkingSiteInput
+from parkapi_sources.util import ParkingSiteSerializer, StaticFingerprintStore
+
+FIRST_IMPORT_AT = datetime(2024, 6, 1, 12, tzinfo=timezone.utc)
+SECOND_IMPORT_AT = datetime(2024, 6, 2, 12, tzinfo=timezone.utc)
+
+
+def get_static_parking_site_input(uid: str, capacity: int, static_data_updated_at: datetime) -> StaticParkingSiteInput:
+    return StaticParkingSiteInput(
+        uid=uid,
+        name=f'Parking Site {uid}',
+        lat=Decimal('48.7758'),
+        lon=Decimal('9.1829'),
+        capacity=capacity,
+        static_data_updated_at=static_data_updated_at,
+    )
+
+
+class StaticFingerprintStoreTest:
+    @staticmethod
+    def test_update():
+        static_fingerprint_store = StaticFingerprintStore()
+        first_import = [get_static_parking_site_input('1', 10, FIRST_IMPORT_AT), get_static_parking_site_input('2', 20, FIRST_IMPORT_AT)]
+        second_import = [
+            get_static_parking_site_input('1', 10, SECOND_IMPORT_AT),
+            get_static_parking_site_input('2', 21, SECOND_IMPORT_AT),
+            get_static_parking_site_input('3', 30, SECOND_IMPORT_AT),
+        ]
+
+        assert static_fingerprint_store.update('source', first_import) == first_import
+        assert static_fingerprint_store.update('source', second_import) == second_import[1:]
+        assert [item.static_data_updated_at for item in second_import] == [FIRST_IMPORT_AT, SECOND_IMPORT_AT, SECOND_IMPORT_AT]
+
+    @staticmethod
+    def test_content_hash_ignores_static_data_updated_at():
+        static_fingerprint_store = StaticFingerprintStore()
+
+        assert static_fingerprint_store.get_content_hash(
+            get_static_parking_site_input('1', 10, FIRST_IMPORT_AT),
+        ) == static_fingerprint_store.get_content_hash(get_static_parking_site_input('1', 10, SECOND_IMPORT_AT))
+        assert static_fingerprint_store.get_content_hash(
+            get_static_parking_site_input('1', 10, FIRST_IMPORT_AT),
+        ) != static_fingerprint_store.get_content_hash(get_static_parking_site_input('1', 11, FIRST_IMPORT_AT))
+
+    @staticmethod
+    def test_content_hash_is_canonical():
+        static_parking_site_input = get_static_parking_site_input('1', 10, FIRST_IMPORT_AT)
+        static_parking_site_input.name = 'Parkhaus Königstraße'
+        parking_site_dict = ParkingSiteSerializer().to_dict(static_parking_site_input)
+        del parking_site_dict['static_data_updated_at']
+
+        # Sorted keys, no whitespace and unescaped UTF-8, so it does not depend on the JSON backend of the serializer
+        expected_json = json.dumps(parking_site_dict, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+        assert StaticFingerprintStore().get_content_hash(static_parking_site_input) == sha256(expected_json.encode()).hexdigest()
+
+    @staticmethod
+    def test_persistence(tmp_path: Path):
+        StaticFingerprintStore(tmp_path).update('source', [get_static_parking_site_input('1', 10, FIRST_IMPORT_AT)])
+        static_parking_site_input = get_static_parking_site_input('1', 10, SECOND_IMPORT_AT)
+
+        changed_static_parking_site_inputs = StaticFingerprintStore(tmp_path).update('source', [static_parking_site_input])
+
+        assert changed_static_parking_site_inputs == []
+        assert static_parking_site_input.static_data_updated_at == FIRST_IMPORT_AT
+
+    @staticmethod
+    def test_broken_file(tmp_path: Path):
+        Path(tmp_path, 'source.json').write_text('broken')
+        static_parking_site_inputs = [get_static_parking_site_input('1', 10, FIRST_IMPORT_AT)]
+
+        assert StaticFingerprintStore(tmp_path).update('source', static_parking_site_inputs) == static_parking_site_inputs
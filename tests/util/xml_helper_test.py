@@ -4,11 +4,12 @@ Copyright (c) 2023, binary butterfly GmbH
 All rights reserved.
 """
 
+from io import BytesIO
 from typing import List, Optional, Tuple
 
 import pytest
 from lxml import etree
-from parkapi_sources.util import XMLHelper
+from parkapi_sources.util import XMLHelper, XMLToDictConverter
 
 from tests.util.data_xml_helper import (
     conditional_remote_type_tags_2a,
@@ -158,3 +159,26 @@ def test_xml_to_dict(
     )
 
     assert result_dict == expected_output
+
+
+def test_iterparse_elements():
+    xml_string = (
+        b'<root xmlns="urn:test"><header><item>no record</item></header>'
+        b'<items><item id="1"><item>nested</item></item><item id="2"/></items></root>'
+    )
+    root: etree.Element = XMLHelper.string_to_xml_etree(xml_string)
+    element_paths: list[tuple[str, str]] = [('items', 'item')]
+
+    expected_ids: list[str] = [element.get('id') for element in XMLHelper.iter_elements(root, element_paths)]
+    streamed_ids: list[str] = [element.get('id') for element in XMLHelper.iterparse_elements(BytesIO(xml_string), element_paths)]
+
+    assert expected_ids == ['1', '2']
+    assert streamed_ids == expected_ids
+
+
+def test_xml_to_dict_converter():
+    xml_to_dict_converter = XMLToDictConverter(remote_type_tags=remote_type_tags_1b)
+
+    assert xml_to_dict_converter.convert(xml_etree_example_1) == xml_dict_example_1b
+    # The converter can be used for multiple elements
+    assert xml_to_dict_converter.convert(xml_etree_example_1) == xml_dict_example_1b
@@ -0,0 +1,94 @@
+"""
+Copyright 2024 binary butterfly GmbH
+Use of this source code is governed by an MIT-style license that can be found in the LICENSE.txt.
+"""
+
+from typing import Any, Optional
+
+import pytest
+from parkapi_sources.validators import CompiledDataclassValidator
+from validataclass.dataclasses import Default, DefaultFactory, validataclass
+from validataclass.exceptions import DataclassPostValidationError, ValidationError
+from validataclass.validators import (
+    DataclassValidator,
+    IntegerValidator,
+    ListValidator,
+    Noneable,
+    StringValidator,
+)
+
+
+@validataclass
+class ItemInput:
+    name: str = StringValidator(min_length=1)
+    count: Optional[int] = Noneable(IntegerValidator()), Default(None)
+
+
+@validataclass
+class ContainerInput:
+    uid: str = StringValidator(min_length=1)
+    capacity: int = IntegerValidator(min_value=0)
+    item: Optional[ItemInput] = Noneable(DataclassValidator(ItemInput)), Default(None)
+    items: list[ItemInput] = ListValidator(DataclassValidator(ItemInput), max_length=2), DefaultFactory(list)
+    tags: list[str] = Noneable(ListValidator(StringValidator()), default=[]), Default([])
+
+
+@validataclass
+class PostValidatedInput:
+    capacity: int = IntegerValidator()
+    free_capacity: int = IntegerValidator()
+
+    def __post_validate__(self):
+        if self.free_capacity > self.capacity:
+            raise ValidationError(code='free_capacity_too_large')
+
+
+def validate(validator: DataclassValidator, input_data: Any) -> tuple[Any, Optional[dict]]:
+    try:
+        return validator.validate(input_data), None
+    except ValidationError as error:
+        return None, error.to_dict()
+
+
+@pytest.mark.parametrize(
+    'input_data',
+    [
+        {'uid': 'a', 'capacity': 1},
+        {'uid': 'a', 'capacity': 1, 'unknown': 'ignored'},
+        {'uid': 'a', 'capacity': 1, 'item': {'name': 'b', 'count': 2}, 'items': [{'name': 'c'}], 'tags': ['d']},
+        {'uid': 'a', 'capacity': 1, 'item': None, 'tags': None},
+        {'uid': 'a', 'capacity': -1},
+        {'uid': 'a'},
+        {'capacity': 'invalid'},
+        {'uid': 'a', 'capacity': 1, 'item': {'name': ''}},
+        {'uid': 'a', 'capacity': 1, 'item': {'name': 'b', 'count': 'invalid'}},
+        {'uid': 'a', 'capacity': 1, 'items': [{'name': 'b'}, {'name': ''}]},
+        {'uid': 'a', 'capacity': 1, 'items': [{'name': 'b'}, {'name': 'c'}, {'name': 'd'}]},
+        {'uid': 'a', 'capacity': 1, 'items': 'invalid'},
+        {1: 'invalid'},
+        [],
+        None,
+    ],
+)
+def test_compiled_dataclass_validator_matches_dataclass_validator(input_data: Any):
+    assert validate(CompiledDataclassValidator(ContainerInput), input_data) == validate(DataclassValidator(ContainerInput), input_data)
+
+
+def test_compiled_dataclass_validator_copies_mutable_defaults():
+    validator = CompiledDataclassValidator(ContainerInput)
+
+    first = validator.validate({'uid': 'a', 'capacity': 1, 'tags': None})
+    second = validator.validate({'uid': 'b', 'capacity': 1, 'tags': None})
+    first.tags.append('changed')
+    first.items.append(ItemInput(name='changed'))
+
+    assert second.tags == []
+    assert second.items == []
+
+
+def test_compiled_dataclass_validator_post_validate():
+    validator = CompiledDataclassValidator(PostValidatedInput)
+
+    assert validator.validate({'capacity': 2, 'free_capacity': 1}) == PostValidatedInput(capacity=2, free_capacity=1)
+    with pytest.raises(DataclassPostValidationError):
+        validator.validate({'capacity': 1, 'free_capacity': 2})